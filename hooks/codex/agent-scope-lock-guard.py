@@ -4,17 +4,31 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from hook_common import ALLOW, emit_block, read_payload, tool_input_dict
+from hook_common import ALLOW, emit_block, file_paths_from_payload, read_payload, tool_input_dict
 
 VALIDATE_COMMAND = ("validate", "--changes", "all", "--format", "json")
+READ_COMMAND = ("read", "--format", "json")
 TIMEOUT_SECONDS = 8
 MAX_PATHS = 6
+SCOPE_CACHE_VERSION = 1
+SCOPE_CACHE_MAX_ENTRIES = 32
+# Scope entries using any of these are left to `validate`, so the prefix
+# fast path can never disagree with the CLI's own matching.
+SCOPE_PATTERN_CHARS = frozenset("*?[]{}!")
+
+
+@dataclass(frozen=True)
+class LockLocation:
+    lock_file: Path | None
+    toplevel: Path | None
 
 
 def emit_system_message(message: str) -> None:
@@ -87,13 +101,14 @@ def format_paths(paths: list[str]) -> str:
     return ", ".join(shown) + suffix
 
 
-def active_lock_file(cwd: Path) -> Path | None:
+def locate_lock(cwd: Path) -> LockLocation:
+    """Resolve the active lock file and work tree root with one git call."""
     git = shutil.which("git")
     if git is None:
-        return None
+        return LockLocation(None, None)
     try:
         completed = subprocess.run(
-            [git, "rev-parse", "--git-path", "agent-scope-lock.json"],
+            [git, "rev-parse", "--git-path", "agent-scope-lock.json", "--show-toplevel"],
             cwd=cwd,
             capture_output=True,
             text=True,
@@ -101,16 +116,152 @@ def active_lock_file(cwd: Path) -> Path | None:
             check=False,
         )
     except (OSError, subprocess.TimeoutExpired):
-        return None
+        return LockLocation(None, None)
     if completed.returncode != 0:
-        return None
-    raw_path = completed.stdout.strip()
+        return LockLocation(None, None)
+    lines = completed.stdout.splitlines()
+    raw_path = lines[0].strip() if lines else ""
     if not raw_path:
-        return None
+        return LockLocation(None, None)
     lock_path = Path(raw_path)
     if not lock_path.is_absolute():
         lock_path = cwd / lock_path
-    return lock_path if lock_path.is_file() else None
+    toplevel = Path(lines[1].strip()) if len(lines) > 1 and lines[1].strip() else None
+    return LockLocation(lock_path if lock_path.is_file() else None, toplevel)
+
+
+def scope_cache_path() -> Path:
+    return Path.home() / ".cache" / "agent-kit" / "scope-lock.json"
+
+
+def load_scope_cache(path: Path) -> dict[str, Any]:
+    try:
+        loaded = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(loaded, dict) or loaded.get("version") != SCOPE_CACHE_VERSION:
+        return {}
+    entries = loaded.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def store_scope_cache(path: Path, entries: dict[str, Any]) -> None:
+    while len(entries) > SCOPE_CACHE_MAX_ENTRIES:
+        entries.pop(next(iter(entries)))
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps({"version": SCOPE_CACHE_VERSION, "entries": entries}), encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError:
+        return
+
+
+def allowed_paths_from_read(data: dict[str, Any]) -> list[str]:
+    details = details_from(data)
+    lock = details.get("lock")
+    for source in (details, lock if isinstance(lock, dict) else {}):
+        for key in ("allowed_paths", "paths"):
+            paths = path_values(source.get(key))
+            if paths:
+                return paths
+    return []
+
+
+def allowed_scope(binary: str, cwd: Path, lock_file: Path) -> list[str] | None:
+    """Return the lock's allowed paths, cached by the lock file's mtime."""
+    try:
+        info = lock_file.stat()
+    except OSError:
+        return None
+    stamp = [info.st_mtime_ns, info.st_size]
+    cache_path = scope_cache_path()
+    entries = load_scope_cache(cache_path)
+    entry = entries.get(str(lock_file))
+    if isinstance(entry, dict) and entry.get("stamp") == stamp and isinstance(entry.get("allowed_paths"), list):
+        return [str(path) for path in entry["allowed_paths"]]
+
+    try:
+        completed = subprocess.run(
+            [binary, *READ_COMMAND],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=TIMEOUT_SECONDS,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if completed.returncode != 0:
+        return None
+    allowed_paths = allowed_paths_from_read(parse_json(completed.stdout))
+    if not allowed_paths:
+        return None
+    entries.pop(str(lock_file), None)
+    entries[str(lock_file)] = {"stamp": stamp, "allowed_paths": allowed_paths}
+    store_scope_cache(cache_path, entries)
+    return allowed_paths
+
+
+def normalize_scope_path(path: str) -> str:
+    normalized = path.replace("\\", "/").strip()
+    while normalized.startswith("./"):
+        normalized = normalized[2:]
+    return normalized.rstrip("/")
+
+
+def plain_prefix_scope(allowed_paths: list[str]) -> bool:
+    return not any(SCOPE_PATTERN_CHARS.intersection(allowed) for allowed in allowed_paths)
+
+
+def in_scope(path: str, allowed_paths: list[str]) -> bool:
+    for allowed in allowed_paths:
+        prefix = normalize_scope_path(allowed)
+        if prefix in {"", "."} or path == prefix or path.startswith(prefix + "/"):
+            return True
+    return False
+
+
+def payload_repo_paths(payload: dict[str, Any], cwd: Path, toplevel: Path) -> list[str] | None:
+    """Map payload paths to work-tree-relative paths; None when any is unusable."""
+    root = Path(os.path.abspath(toplevel))
+    paths: list[str] = []
+    for raw_path in dict.fromkeys(file_paths_from_payload(payload)):
+        candidate = Path(raw_path).expanduser()
+        absolute = Path(os.path.abspath(candidate if candidate.is_absolute() else cwd / candidate))
+        try:
+            relative = absolute.relative_to(root)
+        except ValueError:
+            try:
+                # git reports the resolved root; retry through symlinks.
+                relative = Path(os.path.realpath(absolute)).relative_to(os.path.realpath(root))
+            except ValueError:
+                # Outside the work tree: leave it to full validation.
+                return None
+        paths.append(normalize_scope_path(relative.as_posix()))
+    return paths or None
+
+
+def payload_scope_violations(
+    payload: dict[str, Any],
+    binary: str,
+    cwd: Path,
+    location: LockLocation,
+) -> tuple[list[str], list[str]] | None:
+    """Check only the payload's paths against the cached lock scope.
+
+    Returns (violations, allowed paths), or None when the fast path cannot
+    decide and full validation is needed.
+    """
+    if location.lock_file is None or location.toplevel is None:
+        return None
+    paths = payload_repo_paths(payload, cwd, location.toplevel)
+    if paths is None:
+        return None
+    allowed_paths = allowed_scope(binary, cwd, location.lock_file)
+    if allowed_paths is None or not plain_prefix_scope(allowed_paths):
+        return None
+    return [path for path in paths if not in_scope(path, allowed_paths)], allowed_paths
 
 
 def validation_failure_message(data: dict[str, Any], fallback: str) -> str:
@@ -144,17 +295,31 @@ def emit_guard_message(payload: dict[str, Any], message: str) -> None:
 def main() -> int:
     payload = read_payload()
     cwd = cwd_from_payload(payload)
-    binary = shutil.which("agent-scope-lock")
+    location = locate_lock(cwd)
+    if location.lock_file is None:
+        # Without a lock `validate` can only answer missing-lock.
+        return ALLOW
 
+    binary = shutil.which("agent-scope-lock")
     if binary is None:
-        if active_lock_file(cwd) is not None:
-            emit_guard_message(
-                payload,
-                "agent-scope-lock is active but the `agent-scope-lock` binary is not on PATH; "
-                "install nils-cli or clear the lock before continuing.",
-            )
+        emit_guard_message(
+            payload,
+            "agent-scope-lock is active but the `agent-scope-lock` binary is not on PATH; "
+            "install nils-cli or clear the lock before continuing.",
+        )
         return ALLOW
 
+    # Write hooks check only the paths they are about to touch; Stop keeps the
+    # full working-tree validation.
+    if hook_event(payload) != "Stop":
+        scoped = payload_scope_violations(payload, binary, cwd, location)
+        if scoped is not None:
+            violations, allowed_paths = scoped
+            if violations:
+                details = {"violations": violations, "allowed_paths": allowed_paths}
+                emit_guard_message(payload, validation_failure_message({"error": {"details": details}}, ""))
+            return ALLOW
+
     try:
         completed = subprocess.run(
             [binary, *VALIDATE_COMMAND],
@@ -165,25 +330,18 @@ def main() -> int:
             check=False,
         )
     except subprocess.TimeoutExpired:
-        if active_lock_file(cwd) is not None:
-            emit_guard_message(payload, "agent-scope-lock validation timed out for the active lock.")
+        emit_guard_message(payload, "agent-scope-lock validation timed out for the active lock.")
         return ALLOW
     except OSError as exc:
-        if active_lock_file(cwd) is not None:
-            emit_guard_message(payload, f"agent-scope-lock validation failed for the active lock: {exc}.")
+        emit_guard_message(payload, f"agent-scope-lock validation failed for the active lock: {exc}.")
         return ALLOW
 
     data = parse_json(completed.stdout)
-    if completed.returncode == 0:
-        return ALLOW
-    if error_code(data) == "missing-lock":
-        return ALLOW
-    if error_code(data) == "git-command-failed" and active_lock_file(cwd) is None:
+    if completed.returncode == 0 or error_code(data) == "missing-lock":
         return ALLOW
 
-    if active_lock_file(cwd) is not None or error_code(data) == "scope-violations":
-        fallback = completed.stderr.strip() or completed.stdout.strip() or f"exit {completed.returncode}"
-        emit_guard_message(payload, validation_failure_message(data, fallback))
+    fallback = completed.stderr.strip() or completed.stdout.strip() or f"exit {completed.returncode}"
+    emit_guard_message(payload, validation_failure_message(data, fallback))
     return ALLOW
 
 
@@ -4,11 +4,9 @@
 from __future__ import annotations
 
 import re
-import shlex
 import sys
-from pathlib import PurePosixPath
 
-from hook_common import ALLOW, command_from, emit_block, read_payload
+from hook_common import ALLOW, ShellCommand, SimpleCommand, emit_block, read_payload, shell_command_from
 
 ALLOWED_PR_SKILLS: frozenset[str] = frozenset(
     {
@@ -39,8 +37,6 @@ BLOCK_REASON_MR = (
 SKILL_MARKER_RE = re.compile(
     r"(?:^|[\s;&|()])AGENT_KIT_PR_SKILL=(?P<value>\S+)"
 )
-ASSIGNMENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=.*")
-SEPARATOR_TOKENS = {";", "&&", "||", "|", "(", ")"}
 CLI_OPTIONS_WITH_VALUE = {"-R", "--repo"}
 CLI_OPTIONS_WITH_VALUE_PREFIXES = ("--repo=",)
 GLAB_API_METHOD_FLAGS = {"-X", "--method"}
@@ -48,77 +44,7 @@ GLAB_API_POST_PARAMETER_FLAGS = {"-F", "--field", "-f", "--raw-field", "--form"}
 MR_ENDPOINT_RE = re.compile(r"(?:^|/)merge_requests(?:$|[/?#])")
 
 
-def shell_tokens(command: str) -> list[str]:
-    try:
-        lexer = shlex.shlex(command, posix=True, punctuation_chars=";&|()")
-        lexer.whitespace_split = True
-        lexer.commenters = ""
-        return list(lexer)
-    except ValueError:
-        return []
-
-
-def is_separator(token: str) -> bool:
-    return token in SEPARATOR_TOKENS or bool(token) and all(char in ";&|()" for char in token)
-
-
-def basename(token: str) -> str:
-    return PurePosixPath(token).name
-
-
-def is_assignment(token: str) -> bool:
-    return bool(ASSIGNMENT_RE.match(token))
-
-
-def skip_env_prefix(tokens: list[str], index: int) -> int:
-    while index < len(tokens):
-        token = tokens[index]
-        if token == "--":
-            return index + 1
-        if is_assignment(token):
-            index += 1
-            continue
-        if token in {"-i", "--ignore-environment", "-0", "--null"}:
-            index += 1
-            continue
-        if token in {"-u", "--unset"}:
-            index += 2
-            continue
-        if token.startswith("--unset="):
-            index += 1
-            continue
-        if token.startswith("-") and token != "-":
-            index += 1
-            continue
-        return index
-    return index
-
-
-def cli_command_index(simple_command: list[str], command_name: str) -> int | None:
-    index = 0
-    while index < len(simple_command) and is_assignment(simple_command[index]):
-        index += 1
-    if index >= len(simple_command):
-        return None
-
-    command = basename(simple_command[index])
-    if command == "env":
-        index = skip_env_prefix(simple_command, index + 1)
-    elif command == "time":
-        index += 1
-        while index < len(simple_command) and simple_command[index].startswith("-"):
-            index += 1
-    elif command in {"command", "exec"}:
-        if index + 1 < len(simple_command) and simple_command[index + 1] in {"-v", "-V"}:
-            return None
-        index += 1
-
-    if index >= len(simple_command):
-        return None
-    return index if basename(simple_command[index]) == command_name else None
-
-
-def skip_cli_global_options(tokens: list[str], index: int) -> int:
+def skip_cli_global_options(tokens: tuple[str, ...], index: int) -> int:
     while index < len(tokens):
         token = tokens[index]
         if token == "--":
@@ -139,22 +65,21 @@ def skip_cli_global_options(tokens: list[str], index: int) -> int:
     return index
 
 
-def cli_subcommands(simple_command: list[str], command_name: str) -> list[str]:
-    command_index = cli_command_index(simple_command, command_name)
-    if command_index is None:
+def cli_subcommands(command: SimpleCommand, command_name: str) -> list[str]:
+    if command.name != command_name:
         return []
 
-    index = skip_cli_global_options(simple_command, command_index + 1)
-    return simple_command[index:]
+    argv = command.argv
+    return list(argv[skip_cli_global_options(argv, 1) :])
 
 
-def invokes_gh_pr_create(simple_command: list[str]) -> bool:
-    args = cli_subcommands(simple_command, "gh")
+def invokes_gh_pr_create(command: SimpleCommand) -> bool:
+    args = cli_subcommands(command, "gh")
     return args[:2] == ["pr", "create"]
 
 
-def invokes_glab_mr_create(simple_command: list[str]) -> bool:
-    args = cli_subcommands(simple_command, "glab")
+def invokes_glab_mr_create(command: SimpleCommand) -> bool:
+    args = cli_subcommands(command, "glab")
     return args[:2] == ["mr", "create"]
 
 
@@ -178,37 +103,22 @@ def api_has_merge_requests_endpoint(args: list[str]) -> bool:
     return any(MR_ENDPOINT_RE.search(token) for token in args)
 
 
-def invokes_glab_api_mr_create(simple_command: list[str]) -> bool:
-    args = cli_subcommands(simple_command, "glab")
+def invokes_glab_api_mr_create(command: SimpleCommand) -> bool:
+    args = cli_subcommands(command, "glab")
     if args[:1] != ["api"]:
         return False
     api_args = args[1:]
     return api_method_is_post(api_args) and api_has_merge_requests_endpoint(api_args)
 
 
-def iter_simple_commands(command: str) -> list[list[str]]:
-    simple_commands: list[list[str]] = []
-    current: list[str] = []
-    for token in shell_tokens(command):
-        if is_separator(token):
-            if current:
-                simple_commands.append(current)
-                current = []
-            continue
-        current.append(token)
-    if current:
-        simple_commands.append(current)
-    return simple_commands
-
-
-def invokes_pr_create(command: str) -> bool:
-    return any(invokes_gh_pr_create(simple_command) for simple_command in iter_simple_commands(command))
+def invokes_pr_create(shell: ShellCommand) -> bool:
+    return any(invokes_gh_pr_create(command) for command in shell.commands)
 
 
-def invokes_mr_create(command: str) -> bool:
+def invokes_mr_create(shell: ShellCommand) -> bool:
     return any(
-        invokes_glab_mr_create(simple_command) or invokes_glab_api_mr_create(simple_command)
-        for simple_command in iter_simple_commands(command)
+        invokes_glab_mr_create(command) or invokes_glab_api_mr_create(command)
+        for command in shell.commands
     )
 
 
@@ -218,15 +128,15 @@ def marker_value(command: str) -> str | None:
 
 
 def main() -> int:
-    command = command_from(read_payload())
-    if not command:
+    shell = shell_command_from(read_payload())
+    if not shell.commands:
         return ALLOW
 
-    marker = marker_value(command)
-    if invokes_pr_create(command) and marker not in ALLOWED_PR_SKILLS:
+    marker = marker_value(shell.text)
+    if invokes_pr_create(shell) and marker not in ALLOWED_PR_SKILLS:
         emit_block(BLOCK_REASON_PR)
         return ALLOW
-    if invokes_mr_create(command) and marker not in ALLOWED_MR_SKILLS:
+    if invokes_mr_create(shell) and marker not in ALLOWED_MR_SKILLS:
         emit_block(BLOCK_REASON_MR)
     return ALLOW
 
@@ -3,23 +3,37 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
-import shlex
 import sys
+import time
 from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import Any
 
-from hook_common import ALLOW, command_from, emit_block, read_payload, tool_input_dict
+from hook_common import (
+    ALLOW,
+    ShellCommand,
+    SimpleCommand,
+    basename,
+    emit_block,
+    read_payload,
+    shell_command_from,
+    tool_input_dict,
+)
 
 BYPASS_ENV = "AGENT_KIT_ALLOW_SYSTEM_PYTHON"
 
-ASSIGNMENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=.*")
 PYTHON_NAME_RE = re.compile(r"^python(?:3(?:\.\d+)?)?$")
-SEPARATOR_TOKENS = {";", "&&", "||", "|", "(", ")"}
+MANAGER_CACHE_VERSION = 3
+# A hit stats only the directory the lookup stopped in and its marker, so a
+# marker added to a directory between the start and that one is noticed once
+# the entry expires.
+MANAGER_CACHE_TTL_SECONDS = 300
+MANAGER_CACHE_MAX_ENTRIES = 256
 WORKDIR_KEYS = {"cwd", "current_working_directory", "workdir", "working_directory"}
 
 
@@ -81,26 +95,113 @@ def find_python_manager(start: Path) -> PythonManager | None:
     return None
 
 
-def shell_tokens(command: str) -> list[str]:
+def manager_cache_dir() -> Path:
+    return Path.home() / ".cache" / "agent-kit" / "python-manager"
+
+
+def manager_cache_file(key: str) -> Path:
+    return manager_cache_dir() / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.json"
+
+
+def mtime_ns(path: str) -> int | None:
     try:
-        lexer = shlex.shlex(command, posix=True, punctuation_chars=";&|()")
-        lexer.whitespace_split = True
-        lexer.commenters = ""
-        return list(lexer)
-    except ValueError:
-        return []
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
-def is_separator(token: str) -> bool:
-    return token in SEPARATOR_TOKENS or bool(token) and all(char in ";&|()" for char in token)
+def manager_stamp_paths(start: Path, manager: PythonManager | None) -> list[str]:
+    """The directory the lookup stopped in and its marker; the start directory when nothing was found."""
+    if manager is None:
+        current = start.resolve()
+        return [str(current.parent if current.is_file() else current)]
+    return list(dict.fromkeys((str(manager.root), str(manager.marker))))
 
 
-def basename(token: str) -> str:
-    return PurePosixPath(token).name
+def cached_python_manager(path: Path, key: str, now: float) -> tuple[bool, PythonManager | None]:
+    """Return (hit, manager) when the entry is fresh and its recorded mtimes still match."""
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False, None
+    if not isinstance(entry, dict) or entry.get("version") != MANAGER_CACHE_VERSION or entry.get("key") != key:
+        return False, None
+    if now - float(entry.get("stored_at", 0)) > MANAGER_CACHE_TTL_SECONDS:
+        return False, None
+    stamps = entry.get("stamps")
+    if not isinstance(stamps, list) or not stamps:
+        return False, None
+    for stamp in stamps:
+        if not isinstance(stamp, list) or len(stamp) != 2 or mtime_ns(str(stamp[0])) != stamp[1]:
+            return False, None
+    manager = entry.get("manager")
+    if manager is None:
+        return True, None
+    try:
+        return True, PythonManager(
+            kind=str(manager["kind"]),
+            root=Path(manager["root"]),
+            marker=Path(manager["marker"]),
+            venv_name=manager.get("venv_name"),
+        )
+    except (KeyError, TypeError):
+        return False, None
 
 
-def is_assignment(token: str) -> bool:
-    return bool(ASSIGNMENT_RE.match(token))
+def prune_manager_cache(directory: Path) -> None:
+    try:
+        files = sorted(directory.glob("*.json"), key=lambda path: path.stat().st_mtime_ns)
+        for path in files[: max(0, len(files) - MANAGER_CACHE_MAX_ENTRIES)]:
+            path.unlink()
+    except OSError:
+        return
+
+
+def store_python_manager(
+    path: Path,
+    key: str,
+    manager: PythonManager | None,
+    stamp_paths: list[str],
+    now: float,
+) -> None:
+    stamps = [[stamp_path, mtime_ns(stamp_path)] for stamp_path in stamp_paths]
+    if any(stamp[1] is None for stamp in stamps):
+        return
+    entry = {
+        "version": MANAGER_CACHE_VERSION,
+        "key": key,
+        "stored_at": now,
+        "stamps": stamps,
+        "manager": None
+        if manager is None
+        else {
+            "kind": manager.kind,
+            "root": str(manager.root),
+            "marker": str(manager.marker),
+            "venv_name": manager.venv_name,
+        },
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError:
+        return
+    prune_manager_cache(path.parent)
+
+
+def resolve_python_manager(start: Path) -> PythonManager | None:
+    """Memoize `find_python_manager` on disk, one small file per start directory."""
+    key = os.path.abspath(start)
+    cache_file = manager_cache_file(key)
+    now = time.time()
+    hit, manager = cached_python_manager(cache_file, key, now)
+    if hit:
+        return manager
+    manager = find_python_manager(start)
+    store_python_manager(cache_file, key, manager, manager_stamp_paths(start, manager), now)
+    return manager
 
 
 def is_project_venv_python(token: str) -> bool:
@@ -118,71 +219,29 @@ def is_direct_python_token(token: str) -> bool:
     return "/" not in token or token.startswith("/")
 
 
-def skip_env_prefix(tokens: list[str], index: int) -> int:
-    while index < len(tokens):
-        token = tokens[index]
-        if token == "--":
-            return index + 1
-        if is_assignment(token):
-            index += 1
-            continue
-        if token in {"-i", "--ignore-environment", "-0", "--null"}:
-            index += 1
-            continue
-        if token in {"-u", "--unset"}:
-            index += 2
-            continue
-        if token.startswith("--unset="):
-            index += 1
-            continue
-        if token.startswith("-") and token != "-":
-            index += 1
-            continue
-        return index
-    return index
-
-
-def command_python_token(simple_command: list[str]) -> str | None:
-    index = 0
-    while index < len(simple_command) and is_assignment(simple_command[index]):
-        index += 1
-    if index >= len(simple_command):
-        return None
-
-    command = basename(simple_command[index])
-    if command == "env":
-        index = skip_env_prefix(simple_command, index + 1)
-    elif command == "time":
-        index += 1
-        while index < len(simple_command) and simple_command[index].startswith("-"):
-            index += 1
-    elif command in {"command", "exec"}:
-        if index + 1 < len(simple_command) and simple_command[index + 1] in {"-v", "-V"}:
-            return None
-        index += 1
-
-    if index >= len(simple_command):
-        return None
-    return simple_command[index] if is_direct_python_token(simple_command[index]) else None
+def command_python_token(command: SimpleCommand) -> str | None:
+    argv = command.argv
+    if argv and is_direct_python_token(argv[0]):
+        return argv[0]
+    return None
 
 
-def cd_target(simple_command: list[str], cwd: Path) -> Path | None:
-    index = 0
-    while index < len(simple_command) and is_assignment(simple_command[index]):
-        index += 1
-    if index >= len(simple_command) or basename(simple_command[index]) != "cd":
+def cd_target(command: SimpleCommand, cwd: Path) -> Path | None:
+    # `cd` is a builtin, so only leading assignments may precede it.
+    if command.wrappers or command.name != "cd":
         return None
 
-    index += 1
-    while index < len(simple_command) and simple_command[index] in {"-L", "-P", "-e"}:
+    argv = command.argv
+    index = 1
+    while index < len(argv) and argv[index] in {"-L", "-P", "-e"}:
         index += 1
-    if index < len(simple_command) and simple_command[index] == "--":
+    if index < len(argv) and argv[index] == "--":
         index += 1
 
-    if index >= len(simple_command):
+    if index >= len(argv):
         target = Path.home()
     else:
-        raw_target = simple_command[index]
+        raw_target = argv[index]
         if raw_target == "-":
             return None
         target = Path(raw_target).expanduser()
@@ -254,22 +313,14 @@ def path_from_transcript(payload: dict[str, object]) -> Path | None:
     return None
 
 
-def direct_python_invocation(command: str, start_cwd: Path) -> PythonInvocation | None:
-    simple_command: list[str] = []
+def direct_python_invocation(shell: ShellCommand, start_cwd: Path) -> PythonInvocation | None:
     current_cwd = start_cwd
-    for token in shell_tokens(command):
-        if is_separator(token):
-            found = command_python_token(simple_command)
-            if found:
-                return PythonInvocation(found, current_cwd)
-            if token in {";", "&&"}:
-                current_cwd = cd_target(simple_command, current_cwd) or current_cwd
-            simple_command = []
-            continue
-        simple_command.append(token)
-    found = command_python_token(simple_command)
-    if found:
-        return PythonInvocation(found, current_cwd)
+    for command in shell.commands:
+        found = command_python_token(command)
+        if found:
+            return PythonInvocation(found, current_cwd)
+        if command.separator in {";", "&&"}:
+            current_cwd = cd_target(command, current_cwd) or current_cwd
     return None
 
 
@@ -292,15 +343,15 @@ def block_reason(executable: str, manager: PythonManager) -> str:
 
 def main() -> int:
     payload = read_payload()
-    command = command_from(payload)
-    if not command or has_bypass(command):
+    shell = shell_command_from(payload)
+    if not shell.commands or has_bypass(shell.text):
         return ALLOW
 
-    invocation = direct_python_invocation(command, path_from_payload(payload))
+    invocation = direct_python_invocation(shell, path_from_payload(payload))
     if not invocation:
         return ALLOW
 
-    manager = find_python_manager(invocation.cwd)
+    manager = resolve_python_manager(invocation.cwd)
     if manager is not None:
         emit_block(block_reason(invocation.executable, manager))
     return ALLOW
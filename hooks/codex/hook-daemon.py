@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Resident agent-kit hook server for pretooluse-client.py.
+
+The server loads the PreToolUse guards once and answers client requests on a
+per-user unix socket, so long agent sessions stop paying guard import cost on
+every tool call. Each request runs with the client's working directory and
+environment. Connections are read on their own threads with a receive timeout,
+so a stalled client cannot hold up the others; hook runs are serialized because
+they swap the process working directory and environment. The server exits
+instead of answering when any hook source changes, and clients then fall back
+to in-process execution. Diagnostics go to ~/.cache/agent-kit/hook-daemon.log.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import socket
+import socketserver
+import stat
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from types import ModuleType
+
+HOOK_DIR = Path(__file__).resolve().parent
+START_TIMEOUT_SECONDS = 3.0
+RECEIVE_TIMEOUT_SECONDS = 2.0
+REPLY_STALE = b"STALE\n"
+REPLY_ERROR = b"ERROR\n"
+REQUEST_PING = b"P"
+REQUEST_STOP = b"S"
+
+
+def load_hook_module(script_name: str) -> ModuleType:
+    module_name = "agent_kit_hook_" + script_name.removesuffix(".py").replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, HOOK_DIR / script_name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load hook script: {script_name}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+client = load_hook_module("pretooluse-client.py")
+
+
+def source_signature() -> tuple[tuple[str, int], ...]:
+    return tuple(sorted((path.name, path.stat().st_mtime_ns) for path in HOOK_DIR.glob("*.py")))
+
+
+def decode_request(request: bytes) -> tuple[bytes, dict[bytes, bytes], bytes]:
+    header, _, payload = request[1:].partition(b"\0\0")
+    cwd, *entries = header.split(b"\0")
+    environ: dict[bytes, bytes] = {}
+    for entry in entries:
+        key, _, value = entry.partition(b"=")
+        if key:
+            environ[key] = value
+    return cwd, environ, payload
+
+
+@contextlib.contextmanager
+def client_context(cwd: bytes, environ: dict[bytes, bytes]) -> Iterator[None]:
+    saved_cwd = os.getcwdb()
+    saved_environ = dict(os.environb)
+    saved_stdin = sys.stdin
+    try:
+        os.chdir(cwd)
+        os.environb.clear()
+        os.environb.update(environ)
+        yield
+    finally:
+        os.environb.clear()
+        os.environb.update(saved_environ)
+        os.chdir(saved_cwd)
+        sys.stdin = saved_stdin
+
+
+def run_hook(dispatcher: ModuleType, request: bytes) -> bytes:
+    cwd, environ, payload = decode_request(request)
+    captured = io.StringIO()
+    try:
+        with client_context(cwd, environ), contextlib.redirect_stdout(captured):
+            sys.stdin = io.TextIOWrapper(io.BytesIO(payload), encoding="utf-8")
+            dispatcher.main([])
+    except Exception as exc:
+        print(f"hook-daemon: request failed: {exc}", file=sys.stderr)
+        return REPLY_ERROR
+    return client.REPLY_OK + captured.getvalue().encode("utf-8")
+
+
+def receive_all(connection: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while chunk := connection.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def log_path() -> Path:
+    return Path.home() / ".cache" / "agent-kit" / "hook-daemon.log"
+
+
+def prepare_socket_dir(path: Path) -> None:
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = path.parent.stat()
+    if info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+        raise PermissionError(f"socket directory must be private to the current user: {path.parent}")
+
+
+def ping(path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(client.CONNECT_TIMEOUT_SECONDS)
+            connection.connect(str(path))
+            connection.sendall(REQUEST_PING)
+            connection.shutdown(socket.SHUT_WR)
+            return receive_all(connection).startswith(client.REPLY_OK)
+    except OSError:
+        return False
+
+
+class HookServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, dispatcher: ModuleType) -> None:
+        super().__init__(str(path), HookRequestHandler)
+        self.dispatcher = dispatcher
+        self.signature = source_signature()
+        self.run_lock = threading.Lock()
+
+
+class HookRequestHandler(socketserver.BaseRequestHandler):
+    server: HookServer
+
+    def handle(self) -> None:
+        connection: socket.socket = self.request
+        connection.settimeout(RECEIVE_TIMEOUT_SECONDS)
+        try:
+            request = receive_all(connection)
+        except OSError as exc:
+            print(f"hook-daemon: dropped client: {exc}", file=sys.stderr)
+            return
+        if request.startswith(REQUEST_PING):
+            connection.sendall(client.REPLY_OK + f"{os.getpid()}\n".encode())
+            return
+        if request.startswith(REQUEST_STOP):
+            connection.sendall(client.REPLY_OK)
+            self.server.shutdown()
+            return
+        if source_signature() != self.server.signature:
+            connection.sendall(REPLY_STALE)
+            print("hook-daemon: hook sources changed; exiting", file=sys.stderr)
+            self.server.shutdown()
+            return
+        with self.server.run_lock:
+            reply = run_hook(self.server.dispatcher, request)
+        connection.sendall(reply)
+
+
+def serve(path: Path) -> int:
+    prepare_socket_dir(path)
+    if ping(path):
+        print(f"hook-daemon: already running on {path}", file=sys.stderr)
+        return 0
+    path.unlink(missing_ok=True)
+
+    dispatcher = load_hook_module("pretooluse-dispatch.py")
+    with HookServer(path, dispatcher) as server:
+        try:
+            path.chmod(0o600)
+            server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+    return 0
+
+
+def start(path: Path) -> int:
+    if ping(path):
+        print(f"running\t{path}")
+        return 0
+    log = log_path()
+    log.parent.mkdir(parents=True, exist_ok=True)
+    with log.open("ab") as log_file:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve", "--socket", str(path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=log_file,
+            start_new_session=True,
+        )
+    deadline = time.monotonic() + START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if ping(path):
+            print(f"started\t{path}")
+            return 0
+        time.sleep(0.05)
+    print(f"hook-daemon: failed to start on {path}; see {log}", file=sys.stderr)
+    return 1
+
+
+def stop(path: Path) -> int:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(client.CONNECT_TIMEOUT_SECONDS)
+            connection.connect(str(path))
+            connection.sendall(REQUEST_STOP)
+            connection.shutdown(socket.SHUT_WR)
+            receive_all(connection)
+    except OSError:
+        pass
+    print(f"stopped\t{path}")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the resident agent-kit PreToolUse hook server.")
+    parser.add_argument("action", choices=("serve", "start", "stop", "status"))
+    parser.add_argument(
+        "--socket",
+        help=f"Unix socket path (default: ${client.SOCKET_ENV} or a per-user runtime path).",
+    )
+    args = parser.parse_args(argv)
+    path = Path(args.socket or client.socket_path())
+
+    if args.action == "serve":
+        return serve(path)
+    if args.action == "start":
+        return start(path)
+    if args.action == "stop":
+        return stop(path)
+    running = ping(path)
+    print(f"{'running' if running else 'stopped'}\t{path}")
+    return 0 if running else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
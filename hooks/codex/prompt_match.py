@@ -0,0 +1,143 @@
+"""Shared phrase matcher for agent-kit UserPromptSubmit hooks.
+
+All phrases are compiled into one regular expression, so a prompt is scanned
+in a single C-level pass no matter how many phrases a hook watches. Prompts
+are lowercased and cut to `MAX_PROMPT_CHARS` first; pasted logs past that
+point cannot change a reminder decision enough to justify scanning them.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+MAX_PROMPT_CHARS = 256 * 1024
+
+
+@dataclass(frozen=True)
+class Phrase:
+    text: str
+    label: str
+    whole_word: bool = False
+
+
+@dataclass(frozen=True)
+class PhraseHit:
+    phrase: Phrase
+    start: int
+    end: int
+
+
+def is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def normalize_prompt(prompt: str) -> str:
+    return prompt[:MAX_PROMPT_CHARS].lower()
+
+
+class PhraseMatcher:
+    """Report every (possibly overlapping) occurrence of a fixed phrase set.
+
+    Whole-word phrases follow `grep -w`: the characters on either side of the
+    occurrence must not be letters, digits, or underscores.
+    """
+
+    def __init__(self, phrases: Iterable[Phrase]) -> None:
+        self.phrases = tuple(phrases)
+        by_text: dict[str, list[Phrase]] = {}
+        for phrase in self.phrases:
+            by_text.setdefault(phrase.text, []).append(phrase)
+        self._by_text = by_text
+        # Longest first, so the alternation reports the longest phrase at a
+        # position; shorter phrases at the same position are its prefixes.
+        texts = sorted(by_text, key=len, reverse=True)
+        self._prefixes = {
+            text: tuple(other for other in texts if len(other) < len(text) and text.startswith(other))
+            for text in texts
+        }
+        self.pattern = re.compile("|".join(re.escape(text) for text in texts))
+
+    def _hits_at(self, text: str, start: int, phrase_text: str) -> Iterator[PhraseHit]:
+        end = start + len(phrase_text)
+        for phrase in self._by_text[phrase_text]:
+            if phrase.whole_word and (
+                (start > 0 and is_word_char(text[start - 1])) or (end < len(text) and is_word_char(text[end]))
+            ):
+                continue
+            yield PhraseHit(phrase, start, end)
+
+    def iter_hits(self, text: str) -> Iterator[PhraseHit]:
+        """Yield hits in `text` (already normalized) ordered by start offset."""
+        search = self.pattern.search
+        match = search(text)
+        while match is not None:
+            start = match.start()
+            longest = match.group()
+            yield from self._hits_at(text, start, longest)
+            for shorter in self._prefixes[longest]:
+                yield from self._hits_at(text, start, shorter)
+            match = search(text, start + 1)
+
+    def first_hit(self, text: str) -> PhraseHit | None:
+        return next(self.iter_hits(text), None)
+
+
+AGENT_DOCS_MARKER = "agent-docs"
+AGENT_DOCS_KEYWORDS = (
+    "implement",
+    "implementing",
+    "refactor",
+    "refactoring",
+    "rewrite",
+    "rewriting",
+    "scaffold",
+    "scaffolding",
+    "integrate",
+    "integrating",
+    "migrate",
+    "migration",
+    "migrating",
+    "optimize",
+    "optimise",
+    "optimizing",
+    "optimising",
+)
+AGENT_DOCS_PHRASES = (
+    "add a test",
+    "add the test",
+    "add tests",
+    "add new test",
+    "add more test",
+    "write a test",
+    "write the test",
+    "write tests",
+    "write new test",
+    "build a ",
+    "build an ",
+    "build the ",
+    "create a ",
+    "create an ",
+    "create the ",
+    "add a feature",
+    "add the feature",
+    "add new feature",
+    "fix the bug",
+    "fix this bug",
+    "fix a bug",
+    "hook up ",
+    "wire up ",
+)
+AGENT_DOCS_MATCHER = PhraseMatcher(
+    (
+        *(Phrase(keyword, "keyword", whole_word=True) for keyword in AGENT_DOCS_KEYWORDS),
+        *(Phrase(phrase, "phrase") for phrase in AGENT_DOCS_PHRASES),
+    )
+)
+
+
+def wants_agent_docs_reminder(prompt: str) -> bool:
+    """True for implementation-style prompts that do not already mention agent-docs."""
+    text = normalize_prompt(prompt)
+    return AGENT_DOCS_MARKER not in text and AGENT_DOCS_MATCHER.first_hit(text) is not None
@@ -0,0 +1,175 @@
+"""Shared secret and credential detection for agent-kit hooks and validators.
+
+Every detector is compiled into one alternation with a named group per
+detector, so a scan walks the text once instead of once per pattern. Callers
+pick the detector set they need; `.mcp.json` scanning and skill-usage record
+validation keep different policies over the same engine.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Longest text a bounded detector needs to see across a chunk boundary.
+DEFAULT_OVERLAP = 4096
+# Unbounded matches (for example `Cookie: \S+`) stop deferring past this size.
+MAX_DEFERRED_MATCH = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Detector:
+    name: str
+    pattern: str
+
+
+@dataclass(frozen=True)
+class SecretHit:
+    name: str
+    start: int
+    end: int
+    value: str
+
+
+DETECTORS: dict[str, Detector] = {
+    detector.name: detector
+    for detector in (
+        Detector("Anthropic key", r"\bsk-ant-[A-Za-z0-9_-]{16,}\b"),
+        Detector("OpenAI-style key", r"\bsk-(?!ant-)[A-Za-z0-9_-]{16,}\b"),
+        Detector("GitHub PAT", r"\bghp_[A-Za-z0-9]{20,}\b"),
+        Detector("GitLab PAT", r"\bglpat-[A-Za-z0-9_-]{16,}\b"),
+        Detector("Slack bot token", r"\bxoxb-[A-Za-z0-9-]{10,}\b"),
+        Detector("Slack user token", r"\bxoxp-[A-Za-z0-9-]{10,}\b"),
+        Detector("xAI key", r"\bxai-[A-Za-z0-9_-]{16,}\b"),
+        Detector("AWS access key", r"\bAKIA[0-9A-Z]{16}\b"),
+        Detector("Bearer token", r"\bBearer\s+[A-Za-z0-9\-_.=]{8,}"),
+        Detector("macOS home path", r"/Users/[^/\s\"']+/"),
+        Detector("Linux home path", r"/home/[^/\s\"']+/"),
+        Detector("Private key block", r"-----BEGIN [A-Z ]*PRIVATE KEY-----"),
+        Detector("Authorization header", r"(?i:\bAuthorization:\s*Bearer\s+\S+)"),
+        Detector("Cookie header", r"(?i:\bCookie:\s*\S+)"),
+        Detector("Credential assignment", r"(?i:\b(?:api[_-]?key|token|secret|password)\s*=\s*\S+)"),
+        Detector("API key", r"\bsk-[A-Za-z0-9_-]{12,}"),
+    )
+}
+
+MCP_DETECTORS = (
+    "Anthropic key",
+    "OpenAI-style key",
+    "GitHub PAT",
+    "GitLab PAT",
+    "Slack bot token",
+    "Slack user token",
+    "xAI key",
+    "AWS access key",
+    "Bearer token",
+    "macOS home path",
+    "Linux home path",
+)
+RECORD_DETECTORS = (
+    "Private key block",
+    "Authorization header",
+    "Cookie header",
+    "Credential assignment",
+    "API key",
+)
+
+
+class SecretScanner:
+    """Single-pass scanner over a fixed, ordered set of detectors.
+
+    Hits match what running each detector's pattern with `finditer` would
+    report, merged and ordered by start offset and then detector order.
+    """
+
+    def __init__(self, names: Iterable[str], *, overlap: int = DEFAULT_OVERLAP) -> None:
+        self.names = tuple(names)
+        self.overlap = overlap
+        self._groups = {f"d{index}": index for index in range(len(self.names))}
+        self._single = tuple(re.compile(DETECTORS[name].pattern) for name in self.names)
+        self.pattern = re.compile(
+            "|".join(f"(?P<d{index}>{DETECTORS[name].pattern})" for index, name in enumerate(self.names))
+        )
+
+    def _iter_hits(
+        self,
+        text: str,
+        pos: int = 0,
+        offset: int = 0,
+        last_end: dict[str, int] | None = None,
+    ) -> Iterator[SecretHit]:
+        # Alternation reports one detector per position; restarting one
+        # character after each match start also finds hits that begin inside
+        # an earlier match, such as a key inside a Bearer header. `last_end`
+        # (absolute offsets) drops a detector's hits nested in its own match.
+        last_end = {} if last_end is None else last_end
+        search = self.pattern.search
+        match = search(text, pos)
+        while match is not None:
+            group = match.lastgroup
+            if group is not None:
+                local_start = match.start()
+                start = offset + local_start
+                first = self._groups[group]
+                for index in range(first, len(self.names)):
+                    # The alternation stops at the first detector matching
+                    # here; later detectors may match at the same offset too.
+                    found = match if index == first else self._single[index].match(text, local_start)
+                    name = self.names[index]
+                    if found is not None and start >= last_end.get(name, -1):
+                        last_end[name] = offset + found.end()
+                        yield SecretHit(name, start, offset + found.end(), found.group())
+            match = search(text, match.start() + 1)
+
+    def scan(self, text: str) -> list[SecretHit]:
+        """Return every hit in `text`, ordered by start offset."""
+        return list(self._iter_hits(text))
+
+    def search(self, text: str) -> SecretHit | None:
+        return next(self._iter_hits(text), None)
+
+    def scan_chunks(self, chunks: Iterable[str]) -> Iterator[SecretHit]:
+        """Yield hits from streamed text with absolute offsets.
+
+        Each chunk is scanned together with the tail of the previous one so
+        matches that straddle a boundary are found exactly once.
+        """
+        buffer = ""
+        offset = 0
+        pos = 0
+        last_end: dict[str, int] = {}
+        for chunk in chunks:
+            buffer += chunk
+            safe = len(buffer) - self.overlap
+            if safe <= pos:
+                continue
+            cut = safe
+            pending = dict(last_end)
+            for hit in self._iter_hits(buffer, pos, offset, pending):
+                local_start = hit.start - offset
+                if local_start >= safe:
+                    break
+                if hit.end - offset > safe and len(buffer) - local_start < MAX_DEFERRED_MATCH:
+                    # A match reaching into the overlap may come out longer
+                    # (or end elsewhere after backtracking) once more text
+                    # arrives; rescan it with the next chunk.
+                    cut = local_start
+                    break
+                last_end[hit.name] = hit.end
+                yield hit
+            # Keep one character before the cut so `\b` sees real context.
+            keep = max(cut - 1, 0)
+            buffer = buffer[keep:]
+            offset += keep
+            pos = cut - keep
+        yield from self._iter_hits(buffer, pos, offset, last_end)
+
+
+def first_hit_per_detector(hits: Iterable[SecretHit], names: Iterable[str]) -> list[SecretHit]:
+    """Collapse hits to the first one per detector, in detector order."""
+    first: dict[str, SecretHit] = {}
+    for hit in hits:
+        first.setdefault(hit.name, hit)
+    return [first[name] for name in names if name in first]
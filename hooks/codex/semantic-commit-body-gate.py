@@ -6,7 +6,7 @@ from __future__ import annotations
 import re
 import sys
 
-from hook_common import ALLOW, command_from, emit_block, read_payload
+from hook_common import ALLOW, ShellCommand, SimpleCommand, emit_block, read_payload, shell_command_from
 
 BLOCK_REASON_TEMPLATE = (
     "semantic-commit message is missing a body\n"
@@ -19,62 +19,44 @@ BLOCK_REASON_TEMPLATE = (
 
 TRIVIAL_TYPES = {"chore", "docs", "style", "build"}
 TRIVIAL_KEYWORDS = ("bump", "refresh", "regenerate", "pin", "lockfile")
+NON_COMMITTING_FLAGS = {"--validate-only", "--dry-run", "-h", "--help"}
+MESSAGE_FLAGS = {"--message", "-m"}
+
+
+def semantic_commit_command(shell: ShellCommand) -> SimpleCommand | None:
+    for command in shell.commands:
+        argv = command.argv
+        if command.name != "semantic-commit" or argv[1:2] != ("commit",):
+            continue
+        if NON_COMMITTING_FLAGS.intersection(argv):
+            return None
+        return command
+    return None
 
 
-def is_semantic_commit_commit(command: str) -> bool:
-    if not re.search(r"\bsemantic-commit\s+commit\b", command):
-        return False
-    if re.search(r"(--validate-only|--dry-run|-h\b|--help\b)", command):
-        return False
-    return not re.search(
-        r"\bsemantic-commit\s+(staged-context|config|help|--help)\b",
-        command,
-    )
-
-
-def extract_message(command: str) -> str | None:
-    heredoc_re = re.compile(
-        r"""(?:--message|-m)
-            \s+
-            ["']?
-            \$\(
-            \s*cat\s*<<(?P<dash>-)?
-            \s*
-            (?P<q>['"])?
-            (?P<tag>\w+)
-            (?P=q)?
-            \s*\n
-            (?P<body>.*?)
-            \n
-            (?P<leading>[ \t]*)
-            (?P=tag)
-            \s*
-            \n?
-            \s*\)
-            ["']?""",
-        re.DOTALL | re.VERBOSE,
-    )
-    match = heredoc_re.search(command)
-    if match:
-        return match.group("body")
-
-    double_quoted_re = re.compile(r'(?:--message|-m)\s+"((?:\\.|[^"\\])*)"', re.DOTALL)
-    match = double_quoted_re.search(command)
-    if match:
-        raw = match.group(1)
-        return (
-            raw.replace("\\\\", "\x00")
-            .replace('\\"', '"')
-            .replace("\\n", "\n")
-            .replace("\\t", "\t")
-            .replace("\x00", "\\")
-        )
-
-    single_quoted_re = re.compile(r"(?:--message|-m)\s+'([^']*)'", re.DOTALL)
-    match = single_quoted_re.search(command)
-    if match:
-        return match.group(1)
-
+def extract_message(shell: ShellCommand, command: SimpleCommand) -> str | None:
+    words = command.words[command.argv_start :]
+    for index, word in enumerate(words[:-1]):
+        if word.text not in MESSAGE_FLAGS:
+            continue
+        value = words[index + 1]
+        # `--message "$(cat <<'EOF' ... EOF)"` carries the heredoc it feeds.
+        if value.heredocs:
+            return value.heredocs[0]
+        # An unquoted `$(` splits into a bare `$` word before the `(`
+        # operator; the substitution is the next simple command.
+        if value.text == "$" and value is words[-1] and command.separator == "(":
+            position = next(offset for offset, candidate in enumerate(shell.commands) if candidate is command)
+            following = shell.commands[position + 1 : position + 2]
+            return following[0].heredocs[0] if following and following[0].heredocs else None
+        if value.quote == "'":
+            return value.text
+        if "$(" in value.text or "`" in value.text:
+            # The output of a command the hook cannot see.
+            return None
+        if value.quote == '"':
+            return value.text.replace("\\n", "\n").replace("\\t", "\t")
+        return None
     return None
 
 
@@ -114,11 +96,12 @@ def is_trivial_subject(subject: str) -> bool:
 
 
 def main() -> int:
-    command = command_from(read_payload())
-    if not command or not is_semantic_commit_commit(command):
+    shell = shell_command_from(read_payload())
+    command = semantic_commit_command(shell)
+    if command is None:
         return ALLOW
 
-    message = extract_message(command)
+    message = extract_message(shell, command)
     if message is None:
         return ALLOW
 
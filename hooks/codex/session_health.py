@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Cached, asynchronous agent-docs baseline check for the SessionStart hook.
+
+The baseline result is stored under a key built from `AGENT_HOME`, the
+project root, the `agent-docs` binary, and a content hash of every watched
+baseline doc. A session with a cached result for the current key reads it
+instantly; a session without one starts the check in the background and
+the next session reports it. The check re-runs only when a watched doc
+changes, and a new result replaces the older ones for the same `AGENT_HOME`
+and project.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+import tomllib
+from pathlib import Path
+from typing import Any
+
+CACHE_VERSION = 1
+BASELINE_TIMEOUT_SECONDS = 120
+# A refresh lock older than this belongs to a crashed or hung check.
+STALE_LOCK_SECONDS = BASELINE_TIMEOUT_SECONDS + 30
+BASELINE_DOC_NAMES = ("AGENTS.md", "AGENTS.override.md", "AGENT_DOCS.toml")
+MISSING_REQUIRED_RE = re.compile(r"^missing_required: ([0-9]+)", re.MULTILINE)
+
+
+def cache_dir() -> Path:
+    return Path.home() / ".cache" / "agent-kit" / "health"
+
+
+def project_root(cwd: Path) -> Path:
+    result = subprocess.run(
+        ["git", "rev-parse", "--show-toplevel"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    toplevel = result.stdout.strip()
+    return Path(toplevel) if result.returncode == 0 and toplevel else cwd
+
+
+def configured_docs(config_path: Path, agent_home: Path, project: Path) -> list[Path]:
+    try:
+        config = tomllib.loads(config_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
+        return []
+    documents = config.get("document")
+    if not isinstance(documents, list):
+        return []
+    paths: list[Path] = []
+    for document in documents:
+        if not isinstance(document, dict) or not isinstance(document.get("path"), str):
+            continue
+        base = agent_home if document.get("scope") == "home" else project
+        paths.append(base / document["path"])
+    return paths
+
+
+def watched_paths(agent_home: Path, project: Path) -> list[Path]:
+    paths: list[Path] = []
+    for root in dict.fromkeys((agent_home, project)):
+        paths.extend(root / name for name in BASELINE_DOC_NAMES)
+        paths.extend(configured_docs(root / "AGENT_DOCS.toml", agent_home, project))
+    return list(dict.fromkeys(paths))
+
+
+def baseline_key(agent_home: Path, project: Path, agent_docs: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}\0{agent_home}\0{project}\0".encode())
+    try:
+        binary = os.stat(agent_docs)
+        digest.update(f"{agent_docs}\0{binary.st_mtime_ns}\0{binary.st_size}\0".encode())
+    except OSError:
+        digest.update(f"{agent_docs}\0-\0".encode())
+    for path in watched_paths(agent_home, project):
+        digest.update(os.fsencode(path) + b"\0")
+        try:
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def read_json(path: Path) -> dict[str, Any] | None:
+    try:
+        loaded = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return loaded if isinstance(loaded, dict) else None
+
+
+def write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def run_baseline(agent_docs: str, agent_home: Path, project: Path) -> str:
+    try:
+        completed = subprocess.run(
+            [
+                agent_docs,
+                "--docs-home",
+                str(agent_home),
+                "baseline",
+                "--check",
+                "--target",
+                "all",
+                "--strict",
+                "--format",
+                "text",
+            ],
+            cwd=project,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=BASELINE_TIMEOUT_SECONDS,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    return completed.stdout.strip()
+
+
+def prune_results(key: str, agent_home: Path, project: Path) -> None:
+    """Remove results stored under older keys for the same AGENT_HOME and project."""
+    for path in cache_dir().glob("*.json"):
+        if path.stem == key:
+            continue
+        result = read_json(path)
+        if result and result.get("agent_home") == str(agent_home) and result.get("project") == str(project):
+            path.unlink(missing_ok=True)
+
+
+def refresh(key: str, agent_docs: str, agent_home: Path, project: Path) -> int:
+    lock_path = cache_dir() / f"{key}.lock"
+    try:
+        output = run_baseline(agent_docs, agent_home, project)
+        if not output:
+            # No answer (failure or timeout): let the next session retry.
+            return 0
+        match = MISSING_REQUIRED_RE.search(output)
+        write_json(
+            cache_dir() / f"{key}.json",
+            {
+                "version": CACHE_VERSION,
+                "checked_at": time.time(),
+                "agent_home": str(agent_home),
+                "project": str(project),
+                "missing_required": int(match.group(1)) if match else 0,
+                "output": output,
+            },
+        )
+        prune_results(key, agent_home, project)
+    finally:
+        lock_path.unlink(missing_ok=True)
+    return 0
+
+
+def acquire_refresh_lock(lock_path: Path) -> bool:
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if time.time() - lock_path.stat().st_mtime > STALE_LOCK_SECONDS:
+            lock_path.unlink(missing_ok=True)
+    except OSError:
+        pass
+    try:
+        fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except OSError:
+        return False
+    os.close(fd)
+    return True
+
+
+def start_refresh(key: str, agent_docs: str, agent_home: Path, project: Path) -> None:
+    if not acquire_refresh_lock(cache_dir() / f"{key}.lock"):
+        return
+    subprocess.Popen(
+        [
+            sys.executable,
+            str(Path(__file__).resolve()),
+            "refresh",
+            "--key",
+            key,
+            "--agent-docs",
+            agent_docs,
+            "--agent-home",
+            str(agent_home),
+            "--project",
+            str(project),
+        ],
+        cwd=project,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def emit_context(output: str) -> None:
+    context = f"""[agent-kit health]
+Required baseline docs are missing in the current workspace:
+
+{output}"""
+    print(
+        json.dumps(
+            {
+                "hookSpecificOutput": {
+                    "hookEventName": "SessionStart",
+                    "additionalContext": context,
+                }
+            }
+        )
+    )
+
+
+def run_hook(agent_docs: str, agent_home: Path) -> int:
+    project = project_root(Path.cwd())
+    key = baseline_key(agent_home, project, agent_docs)
+    result_path = cache_dir() / f"{key}.json"
+    result = read_json(result_path)
+    if result is None or result.get("version") != CACHE_VERSION:
+        start_refresh(key, agent_docs, agent_home, project)
+        return 0
+
+    if not result.get("missing_required") or not result.get("output"):
+        return 0
+    # Unchanged findings are surfaced once per day, not on every session.
+    today = dt.date.today().isoformat()
+    if result.get("reported_on") == today:
+        return 0
+    emit_context(str(result["output"]))
+    write_json(result_path, result | {"reported_on": today})
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run or read the cached agent-docs baseline check.")
+    parser.add_argument("action", choices=("hook", "refresh"))
+    parser.add_argument("--key", help="Cache key computed by the hook (refresh only).")
+    parser.add_argument("--agent-docs", help="agent-docs executable (default: from PATH).")
+    parser.add_argument("--agent-home", help="agent-kit home (default: $AGENT_HOME or ~/.agents).")
+    parser.add_argument("--project", help="Project root (refresh only).")
+    args = parser.parse_args(argv)
+
+    agent_docs = args.agent_docs or shutil.which("agent-docs")
+    if not agent_docs:
+        return 0
+    agent_home = Path(args.agent_home or os.environ.get("AGENT_HOME") or Path.home() / ".agents")
+
+    if args.action == "refresh":
+        if not args.key or not args.project:
+            parser.error("refresh requires --key and --project")
+        return refresh(args.key, agent_docs, agent_home, Path(args.project))
+    return run_hook(agent_docs, agent_home)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ from collections.abc import Iterable, Mapping
 from typing import Any
 
 from hook_common import ALLOW, read_payload
+from prompt_match import Phrase, PhraseMatcher, normalize_prompt
 
 
 PROMPT_KEYS = ("prompt", "user_prompt", "message", "input")
@@ -42,6 +43,20 @@ ACTION_HINTS = (
 )
 
 
+def explicit_markers(skill: str) -> tuple[str, ...]:
+    # `[$skill]` links contain `$skill`, so one marker covers both forms.
+    return (f"${skill}", f"<name>{skill}</name>", f"/{skill}/SKILL.md".lower())
+
+
+SKILL_MATCHER = PhraseMatcher(
+    (
+        *(Phrase(alias, f"alias:{skill}") for skill, aliases in SKILL_ALIASES.items() for alias in aliases),
+        *(Phrase(marker, f"marker:{skill}") for skill in SKILL_ALIASES for marker in explicit_markers(skill)),
+        *(Phrase(hint, "hint") for hint in ACTION_HINTS),
+    )
+)
+
+
 def _iter_strings(value: Any) -> Iterable[str]:
     if isinstance(value, str):
         yield value
@@ -69,28 +84,44 @@ def prompt_text(payload: Mapping[str, Any]) -> str:
     return "\n".join(parts)
 
 
-def explicit_skill_invocation(text: str, skill: str) -> bool:
-    return any(
-        marker in text
-        for marker in (
-            f"${skill}",
-            f"[${skill}]",
-            f"<name>{skill}</name>",
-            f"/{skill}/SKILL.md".lower(),
-        )
-    )
+def has_hint_outside(spans: list[tuple[int, int]], hint_spans: list[tuple[int, int]]) -> bool:
+    """True when a hint does not overlap any span; both lists are sorted by start."""
+    merged: list[tuple[int, int]] = []
+    for start, end in spans:
+        if merged and start < merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    index = 0
+    for hint_start, hint_end in hint_spans:
+        while index < len(merged) and merged[index][1] <= hint_start:
+            index += 1
+        if index == len(merged) or merged[index][0] >= hint_end:
+            return True
+    return False
 
 
 def matched_skills(prompt: str) -> list[str]:
-    text = prompt.lower()
+    alias_spans: dict[str, list[tuple[int, int]]] = {}
+    explicit: set[str] = set()
+    hint_spans: list[tuple[int, int]] = []
+    for hit in SKILL_MATCHER.iter_hits(normalize_prompt(prompt)):
+        kind, _, skill = hit.phrase.label.partition(":")
+        if kind == "alias":
+            alias_spans.setdefault(skill, []).append((hit.start, hit.end))
+        elif kind == "marker":
+            explicit.add(skill)
+        else:
+            hint_spans.append((hit.start, hit.end))
+
     matches: list[str] = []
-    for skill, aliases in SKILL_ALIASES.items():
-        alias_match = any(alias in text for alias in aliases)
-        stripped = text
-        for alias in aliases:
-            stripped = stripped.replace(alias, " ")
-        actionish = any(hint in stripped for hint in ACTION_HINTS)
-        if alias_match and (actionish or explicit_skill_invocation(text, skill)):
+    for skill in SKILL_ALIASES:
+        spans = alias_spans.get(skill)
+        if not spans:
+            continue
+        # Hints that are part of the skill's own alias ("fix" in "fix ci")
+        # do not make a prompt actionable.
+        if has_hint_outside(spans, hint_spans) or skill in explicit:
             matches.append(skill)
     return matches
 
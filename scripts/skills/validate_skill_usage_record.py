@@ -2,13 +2,29 @@
 from __future__ import annotations
 
 import argparse
+import importlib.util
 import json
-import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
+SECRET_SCAN_PATH = Path(__file__).resolve().parents[2] / "hooks" / "codex" / "secret_scan.py"
+
+
+def load_secret_scan() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("agent_kit_secret_scan", SECRET_SCAN_PATH)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load secret scanner: {SECRET_SCAN_PATH}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+secret_scan = load_secret_scan()
+
 SCHEMA_ID = "skill-usage.record.v1"
 
 ROOT_REQUIRED = (
@@ -41,13 +57,7 @@ FAILURE_CLASSIFICATIONS = {
 }
 FAILURE_RESULTS = {"fixed", "worked_around", "blocked", "accepted_risk"}
 FAILURE_REQUIRED = ("phase", "symptom", "classification", "diagnosis", "handling", "result")
-SECRET_LIKE_PATTERNS = (
-    re.compile(r"-----BEGIN [A-Z ]*PRIVATE KEY-----"),
-    re.compile(r"\bAuthorization:\s*Bearer\s+\S+", re.IGNORECASE),
-    re.compile(r"\bCookie:\s*\S+", re.IGNORECASE),
-    re.compile(r"\b(?:api[_-]?key|token|secret|password)\s*=\s*\S+", re.IGNORECASE),
-    re.compile(r"\bsk-[A-Za-z0-9_-]{12,}"),
-)
+SECRET_LIKE_SCANNER = secret_scan.SecretScanner(secret_scan.RECORD_DETECTORS)
 
 
 @dataclass(frozen=True)
@@ -103,16 +113,14 @@ def _scan_secret_like_values(violations: list[Violation], value: Any, path: str
     if not isinstance(value, str):
         return
 
-    for pattern in SECRET_LIKE_PATTERNS:
-        if pattern.search(value):
-            violations.append(
-                Violation(
-                    "secret_like_value",
-                    path,
-                    "contains a token, credential, cookie, or private-key-like value",
-                )
+    if SECRET_LIKE_SCANNER.search(value) is not None:
+        violations.append(
+            Violation(
+                "secret_like_value",
+                path,
+                "contains a token, credential, cookie, or private-key-like value",
             )
-            return
+        )
 
 
 def validate_record(record: Any) -> list[Violation]:
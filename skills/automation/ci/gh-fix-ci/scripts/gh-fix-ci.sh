@@ -5,7 +5,8 @@ usage() {
   cat <<'USAGE'
 Usage:
   gh-fix-ci.sh [--repo <path>] [--pr <number|url>] [--ref <branch|sha>] [--branch <name>] [--commit <sha>]
-               [--limit <n>] [--required] [--max-lines <n>] [--context <n>] [--json]
+               [--limit <n>] [--required] [--max-lines <n>] [--context <n>] [--jobs <n>] [--no-cache] [--json]
+               [--watch [--watch-until first-failure|complete] [--watch-timeout <seconds>]]
 
 Runs the bundled inspect_ci_checks.py to fetch failing PR or branch checks and log snippets.
 
@@ -14,6 +15,7 @@ Examples:
   gh-fix-ci.sh --repo . --pr https://github.com/org/repo/pull/123 --json
   gh-fix-ci.sh --ref main
   gh-fix-ci.sh --commit 1a2b3c4d
+  gh-fix-ci.sh --pr 123 --watch
 
 Notes:
   Requires gh authentication. Run `gh auth status` first.
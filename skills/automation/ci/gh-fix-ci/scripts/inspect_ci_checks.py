@@ -2,14 +2,24 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
 import json
+import mmap
+import os
 import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from shutil import which
-from typing import Any, Iterable, Sequence
+from shutil import copyfileobj, which
+from typing import Any, Callable, Iterable, Sequence, TypeVar
 
 FAILURE_CONCLUSIONS = {
     "failure",
@@ -30,6 +40,15 @@ FAILURE_STATES = {
 
 FAILURE_BUCKETS = {"fail"}
 
+PENDING_STATES = {
+    "pending",
+    "queued",
+    "in_progress",
+    "waiting",
+    "requested",
+    "expected",
+}
+
 FAILURE_MARKERS = (
     "error",
     "fail",
@@ -42,17 +61,141 @@ FAILURE_MARKERS = (
     "timeout",
     "segmentation fault",
 )
+FAILURE_MARKER_RE = re.compile(b"|".join(re.escape(marker.encode()) for marker in FAILURE_MARKERS), re.IGNORECASE)
 
 DEFAULT_MAX_LINES = 160
 DEFAULT_CONTEXT_LINES = 30
 DEFAULT_RUN_LIMIT = 20
+DEFAULT_JOBS = 4
+DEFAULT_LOG_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Logs are scanned backwards for failure markers in blocks of about this size.
+LOG_SCAN_BLOCK_BYTES = 1024 * 1024
+LOG_COPY_CHUNK_BYTES = 1024 * 1024
+LOG_ERROR_HEAD_BYTES = 64 * 1024
+# Zipped job logs name step files `<n>_<step>.txt`, under `<job>/` in run archives.
+ZIP_LOG_ORDER_RE = re.compile(r"^(\d+)_")
+# Hits of one classifier this many lines apart or closer form one failure block.
+FAILURE_BLOCK_GAP_LINES = 3
+MAX_FAILURE_BLOCKS = 50
+MAX_SIGNATURE_CHARS = 240
 PENDING_EXIT_CODE_PR_CHECKS = 8
+DEFAULT_WATCH_TIMEOUT_SECONDS = 3600
+# Watch polls start fast and back off while nothing changes; any check state
+# change drops the interval back to the minimum.
+WATCH_MIN_INTERVAL_SECONDS = 5.0
+WATCH_MAX_INTERVAL_SECONDS = 60.0
+WATCH_BACKOFF_FACTOR = 1.5
+WATCH_MAX_FETCH_ERRORS = 3
+GRAPHQL_MAX_PAGES = 20
+PR_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+# One round trip for the check rollup of a PR's head commit, including the
+# workflow run behind each check run, so failing checks need no `gh run view`.
+PR_CHECKS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    pullRequest(number: $number) {
+      commits(last: 1) {
+        nodes {
+          commit {
+            oid
+            statusCheckRollup {
+              contexts(first: 100, after: $after) {
+                pageInfo { hasNextPage endCursor }
+                nodes {
+                  __typename
+                  ... on CheckRun {
+                    name
+                    databaseId
+                    status
+                    conclusion
+                    detailsUrl
+                    startedAt
+                    completedAt
+                    isRequired(pullRequestNumber: $number)
+                    checkSuite {
+                      status
+                      conclusion
+                      branch { name }
+                      workflowRun { databaseId event url workflow { name } }
+                    }
+                  }
+                  ... on StatusContext {
+                    context
+                    state
+                    targetUrl
+                    description
+                    createdAt
+                    isRequired(pullRequestNumber: $number)
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
 PENDING_LOG_MARKERS = (
     "still in progress",
     "log will be available when it is complete",
 )
 
 
+@dataclass(frozen=True)
+class SignatureRule:
+    """A failure classifier: every match of `pattern` contains one of `anchors`.
+
+    The literal anchors drive a cheap prefilter over the whole log; `pattern`
+    only runs on lines that contain an anchor.
+    """
+
+    label: str
+    pattern: bytes
+    anchors: tuple[bytes, ...]
+
+
+# Classifiers for the failure output of common CI tools. Add a rule here to
+# teach the inspector a new tool; the leftmost match on a line labels it.
+FAILURE_SIGNATURE_RULES = (
+    SignatureRule(
+        "pytest",
+        rb"(?:FAILED|ERROR) [\w./-]+\.py::\S+|E(?<!\wE) {3}\S|={3,} (?:[^\n=]*?, )?\d+ (?:failed|errors?)\b",
+        (b"FAILED ", b"ERROR ", b"E   ", b"==="),
+    ),
+    SignatureRule("pyright", rb"\.pyi?:\d+:\d+ - error: ", (b" - error: ",)),
+    SignatureRule(
+        "mypy",
+        rb"\.pyi?:\d+(?::\d+)?: error: |Found \d+ errors? in \d+ files? \(checked",
+        (b": error: ", b"Found "),
+    ),
+    SignatureRule(
+        "ruff",
+        rb"\.pyi?:\d+:\d+: [A-Z]{1,4}\d{1,4}\b|Found \d+ errors?\.(?=\s|$)",
+        (b".py", b"Found "),
+    ),
+    SignatureRule(
+        "shellcheck",
+        rb"\^-+ SC\d{4}\b|\[SC\d{4}\]|\bIn \S+ line \d+:",
+        (b" SC", b"[SC", b" line "),
+    ),
+    SignatureRule(
+        "semgrep",
+        "(?:\u276f\u276f)?\u2771 [\\w.-]+".encode() + rb"|\b[1-9]\d* (?:Code|Blocking) Findings?\b",
+        ("\u2771".encode(), b" Finding"),
+    ),
+    SignatureRule(
+        "exit-code",
+        rb"\b[Ee]xit(?:ed with)? (?:code|status) [1-9]\d*\b|\*\*\* \[[^\]\n]*\] Error \d+",
+        (b"xit code", b"xit status", b"xited with", b"] Error "),
+    ),
+)
+# GitHub run logs prefix lines with job and step names, job logs with a timestamp.
+LOG_LINE_PREFIX_RE = re.compile(rb"(?:[^\t\n]*\t){0,2}(?:\d{4}-\d\d-\d\dT[\d:.]+Z )?")
+
+
 @dataclass(frozen=True)
 class Target:
     kind: str  # "pr" or "ref"
@@ -60,6 +203,214 @@ class Target:
     ref_type: str | None = None  # "branch" or "commit"
 
 
+T = TypeVar("T")
+
+
+class GhMemo:
+    """Per-invocation memo for gh lookups shared by concurrent check analyses.
+
+    Concurrent callers asking for the same key wait for one fetch instead of
+    starting their own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], Any] = {}
+        self._key_locks: dict[tuple[str, ...], threading.Lock] = {}
+
+    def get(self, key: tuple[str, ...], fetch: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+            value = fetch()
+            with self._lock:
+                self._values[key] = value
+            return value
+
+    def put(self, key: tuple[str, ...], value: Any) -> None:
+        """Seed `key` from a lookup that already returned it; never overwrites."""
+        with self._lock:
+            self._values.setdefault(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._key_locks.clear()
+
+
+GH_MEMO = GhMemo()
+
+
+class LogCache:
+    """Size-bounded on-disk cache of completed, immutable CI logs.
+
+    Entries are gzip-compressed and keyed by repo, run id, run attempt, and
+    job id. When the directory grows past `max_bytes`, the least recently
+    read entries are evicted first.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_LOG_CACHE_MAX_BYTES, enabled: bool = True):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+    def path_for(self, key: Sequence[str]) -> Path:
+        digest = hashlib.sha256("\0".join(key).encode("utf-8")).hexdigest()
+        return self.root / f"{digest}.log.gz"
+
+    def get(self, key: Sequence[str], dest: Path) -> bool:
+        """Decompress the entry for `key` into `dest`; False on a miss."""
+        if not self.enabled:
+            return False
+        path = self.path_for(key)
+        try:
+            with gzip.open(path, "rb") as source, dest.open("wb") as target:
+                copyfileobj(source, target, LOG_COPY_CHUNK_BYTES)
+            os.utime(path)
+        except (OSError, EOFError):
+            return False
+        return True
+
+    def put(self, key: Sequence[str], source: Path) -> None:
+        if not self.enabled:
+            return
+        path = self.path_for(key)
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with source.open("rb") as log_file, gzip.open(tmp_path, "wb", compresslevel=6) as target:
+                copyfileobj(log_file, target, LOG_COPY_CHUNK_BYTES)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self.evict()
+        except OSError:
+            return
+
+    def evict(self) -> None:
+        entries = []
+        for path in self.root.glob("*.log.gz"):
+            try:
+                info = path.stat()
+            except OSError:
+                continue
+            entries.append((info.st_mtime, info.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def default_log_cache_dir() -> Path:
+    return Path.home() / ".cache" / "agent-kit" / "gh-fix-ci" / "logs"
+
+
+LOG_CACHE = LogCache(default_log_cache_dir())
+
+
+class LogWorkspace:
+    """Per-invocation scratch directory for downloaded logs.
+
+    Logs stay on disk so snippet extraction can map them instead of holding
+    whole run logs in memory. The directory is removed at interpreter exit.
+    """
+
+    def __init__(self) -> None:
+        self._directory: tempfile.TemporaryDirectory[str] | None = None
+        self._lock = threading.Lock()
+
+    def new_path(self, label: str) -> Path:
+        with self._lock:
+            if self._directory is None:
+                self._directory = tempfile.TemporaryDirectory(prefix="gh-fix-ci-logs-")
+            fd, name = tempfile.mkstemp(prefix=f"{label}-", suffix=".log", dir=self._directory.name)
+        os.close(fd)
+        return Path(name)
+
+
+LOG_WORKSPACE = LogWorkspace()
+
+
+@dataclass
+class FailureBlock:
+    label: str
+    start_line: int
+    end_line: int
+    signature: str
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "label": self.label,
+            "startLine": self.start_line,
+            "endLine": self.end_line,
+            "signature": self.signature,
+        }
+
+
+class SignatureClassifier:
+    """Single-pass failure classifier over a fixed, ordered set of rules.
+
+    One pass of a literal prefilter finds candidate lines; the rules, compiled
+    into one alternation with a group per rule, classify each candidate line
+    once. Nearby hits of one rule merge into a block, and blocks repeating an
+    earlier label and signature are dropped; the last MAX_FAILURE_BLOCKS stay.
+    """
+
+    def __init__(self, rules: Sequence[SignatureRule]):
+        self.rules = tuple(rules)
+        self._labels = {f"r{index}": rule.label for index, rule in enumerate(self.rules)}
+        self.pattern = re.compile(
+            b"|".join(b"(?P<r%d>%s)" % (index, rule.pattern) for index, rule in enumerate(self.rules)),
+            re.MULTILINE,
+        )
+        anchors = dict.fromkeys(anchor for rule in self.rules for anchor in rule.anchors)
+        self.prefilter = re.compile(b"|".join(re.escape(anchor) for anchor in anchors))
+
+    def classify(self, buffer: bytes | mmap.mmap) -> list[FailureBlock]:
+        blocks: deque[FailureBlock] = deque(maxlen=MAX_FAILURE_BLOCKS)
+        seen: set[tuple[str, str]] = set()
+        current: FailureBlock | None = None
+        line_number = 1
+        counted_to = 0
+        size = len(buffer)
+        candidate = self.prefilter.search(buffer)
+        while candidate is not None:
+            start = line_start(buffer, candidate.start())
+            newline = buffer.find(b"\n", candidate.end())
+            end = size if newline < 0 else newline
+            match = self.pattern.search(buffer, start, end)
+            if match is not None:
+                line_number += count_newlines(buffer, counted_to, start)
+                counted_to = start
+                label = self._labels[match.lastgroup or "r0"]
+                if (
+                    current is not None
+                    and current.label == label
+                    and line_number - current.end_line <= FAILURE_BLOCK_GAP_LINES
+                ):
+                    current.end_line = line_number
+                else:
+                    signature = signature_text(buffer[start:end])
+                    current = FailureBlock(label, line_number, line_number, signature)
+                    if (label, signature) not in seen:
+                        seen.add((label, signature))
+                        blocks.append(current)
+            if newline < 0:
+                break
+            candidate = self.prefilter.search(buffer, newline + 1)
+        return list(blocks)
+
+
+FAILURE_CLASSIFIER = SignatureClassifier(FAILURE_SIGNATURE_RULES)
+
+
 class GhResult:
     def __init__(self, returncode: int, stdout: str, stderr: str):
         self.returncode = returncode
@@ -77,14 +428,24 @@ def run_gh_command(args: Sequence[str], cwd: Path) -> GhResult:
     return GhResult(process.returncode, process.stdout, process.stderr)
 
 
-def run_gh_command_raw(args: Sequence[str], cwd: Path) -> tuple[int, bytes, str]:
-    process = subprocess.run(
-        ["gh", *args],
-        cwd=cwd,
-        capture_output=True,
-    )
-    stderr = process.stderr.decode(errors="replace")
-    return process.returncode, process.stdout, stderr
+def run_gh_command_to_file(args: Sequence[str], cwd: Path, dest: Path) -> GhResult:
+    """Run gh with stdout streamed into `dest`; only stderr is captured."""
+    with dest.open("wb") as stdout:
+        process = subprocess.run(
+            ["gh", *args],
+            cwd=cwd,
+            stdout=stdout,
+            stderr=subprocess.PIPE,
+        )
+    return GhResult(process.returncode, "", process.stderr.decode(errors="replace"))
+
+
+def read_log_head(path: Path, limit: int = LOG_ERROR_HEAD_BYTES) -> str:
+    try:
+        with path.open("rb") as log_file:
+            return log_file.read(limit).decode(errors="replace")
+    except OSError:
+        return ""
 
 
 def parse_args() -> argparse.Namespace:
@@ -114,12 +475,41 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--max-lines", type=int, default=DEFAULT_MAX_LINES)
     parser.add_argument("--context", type=int, default=DEFAULT_CONTEXT_LINES)
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Failing checks to analyze concurrently (log downloads run in parallel).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk cache of completed CI logs (~/.cache/agent-kit/gh-fix-ci/logs).",
+    )
     parser.add_argument("--json", action="store_true", help="Emit JSON instead of text output.")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Poll until checks finish, analyzing each failing check once as it fails; emits NDJSON events.",
+    )
+    parser.add_argument(
+        "--watch-until",
+        choices=("first-failure", "complete"),
+        default="first-failure",
+        help="Watch mode: stop at the first analyzed failure, or only once every check has completed.",
+    )
+    parser.add_argument(
+        "--watch-timeout",
+        type=int,
+        default=DEFAULT_WATCH_TIMEOUT_SECONDS,
+        help="Watch mode: give up after this many seconds with exit code 8.",
+    )
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
+    LOG_CACHE.enabled = not args.no_cache
     repo_root = find_git_root(Path(args.repo))
     if repo_root is None:
         print("Error: not inside a Git repository.", file=sys.stderr)
@@ -132,16 +522,10 @@ def main() -> int:
     if target is None:
         return 1
 
-    if target.kind == "pr":
-        checks = fetch_pr_checks(target.value, repo_root, required=args.required)
-    else:
-        checks = fetch_runs_for_ref(
-            target.value,
-            target.ref_type or "branch",
-            repo_root,
-            max(1, args.limit),
-        )
+    if args.watch:
+        return watch_checks(target, repo_root, args)
 
+    checks = fetch_checks(target, repo_root, args)
     if checks is None:
         return 1
 
@@ -154,16 +538,13 @@ def main() -> int:
         print(f"{format_target_label(target)}: no failing checks detected.")
         return 0
 
-    results = []
-    for check in failing:
-        results.append(
-            analyze_check(
-                check,
-                repo_root=repo_root,
-                max_lines=max(1, args.max_lines),
-                context=max(1, args.context),
-            )
-        )
+    results = analyze_checks(
+        failing,
+        repo_root=repo_root,
+        max_lines=max(1, args.max_lines),
+        context=max(1, args.context),
+        jobs=max(1, args.jobs),
+    )
 
     if args.json:
         print(json.dumps(build_payload(target, results), indent=2))
@@ -173,6 +554,145 @@ def main() -> int:
     return 1
 
 
+def fetch_checks(target: Target, repo_root: Path, args: argparse.Namespace) -> list[dict[str, Any]] | None:
+    if target.kind == "pr":
+        return fetch_pr_checks(target.value, repo_root, required=args.required)
+    return fetch_runs_for_ref(
+        target.value,
+        target.ref_type or "branch",
+        repo_root,
+        max(1, args.limit),
+    )
+
+
+def watch_checks(target: Target, repo_root: Path, args: argparse.Namespace) -> int:
+    """Poll checks and analyze each failing one once, emitting NDJSON events.
+
+    Events: `check` when a check first appears or changes state, `failure`
+    once with the analysis of each failing check, `failure_pending` when a
+    check has failed but its log cannot be downloaded yet, `poll` after each
+    round, and a final `done` with the reason (`first-failure`, `complete`,
+    `timeout`, or `error`). A failed conclusion counts toward `first-failure`
+    right away; pending logs are retried on later polls and, once the watch
+    has its answer, until they arrive or the timeout passes. Exit codes: 0
+    all checks passed, 1 failures, 8 timed out.
+    """
+    started = time.monotonic()
+    deadline = started + max(0, args.watch_timeout)
+    interval = WATCH_MIN_INTERVAL_SECONDS
+    states: dict[tuple[str, ...], str] = {}
+    analyzed: set[tuple[str, ...]] = set()
+    log_pending: dict[tuple[str, ...], dict[str, Any]] = {}
+    failed: list[str] = []
+    fetch_errors = 0
+    polls = 0
+
+    def analyze(fresh: list[dict[str, Any]]) -> None:
+        results = analyze_checks(
+            fresh,
+            repo_root=repo_root,
+            max_lines=max(1, args.max_lines),
+            context=max(1, args.context),
+            jobs=max(1, args.jobs),
+        )
+        for check, result in zip(fresh, results):
+            key = check_key(check)
+            if key not in log_pending:
+                failed.append(str(check.get("name", "")))
+            if result.get("status") == "log_pending":
+                if key not in log_pending:
+                    log_pending[key] = check
+                    emit_event("failure_pending", **result)
+                continue
+            log_pending.pop(key, None)
+            analyzed.add(key)
+            emit_event("failure", **result)
+
+    def done(reason: str, exit_code: int) -> int:
+        if reason in ("first-failure", "complete"):
+            # The outcome is settled; keep fetching logs that were not ready.
+            retry = WATCH_MIN_INTERVAL_SECONDS
+            while log_pending and (remaining := deadline - time.monotonic()) > 0:
+                time.sleep(min(retry, remaining))
+                retry = min(retry * WATCH_BACKOFF_FACTOR, WATCH_MAX_INTERVAL_SECONDS)
+                GH_MEMO.clear()
+                analyze(list(log_pending.values()))
+        elapsed = round(time.monotonic() - started, 1)
+        emit_event("done", reason=reason, failing=failed, polls=polls, elapsedSeconds=elapsed)
+        return exit_code
+
+    while True:
+        # Run metadata and logs change while checks run; only the on-disk
+        # cache of completed logs carries over between polls.
+        GH_MEMO.clear()
+        polls += 1
+        checks = fetch_checks(target, repo_root, args)
+        if checks is None:
+            fetch_errors += 1
+            if fetch_errors >= WATCH_MAX_FETCH_ERRORS:
+                return done("error", 1)
+            checks = []
+        else:
+            fetch_errors = 0
+
+        changed = False
+        for check in checks:
+            key = check_key(check)
+            state = check_state(check)
+            if states.get(key) != state:
+                states[key] = state
+                changed = True
+                emit_event("check", name=check.get("name", ""), state=state, runId=key[1] or None, jobId=key[2] or None)
+
+        analyze([check for check in checks if is_failing(check) and check_key(check) not in analyzed])
+
+        pending = [check for check in checks if is_pending(check)]
+        if failed and args.watch_until == "first-failure":
+            return done("first-failure", 1)
+        if checks and not pending:
+            return done("complete", 1 if any(is_failing(check) for check in checks) else 0)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return done("timeout", PENDING_EXIT_CODE_PR_CHECKS)
+
+        if changed:
+            interval = WATCH_MIN_INTERVAL_SECONDS
+        else:
+            interval = min(interval * WATCH_BACKOFF_FACTOR, WATCH_MAX_INTERVAL_SECONDS)
+        emit_event(
+            "poll",
+            total=len(checks),
+            pending=len(pending),
+            failing=len(failed),
+            nextPollSeconds=round(min(interval, remaining), 1),
+        )
+        time.sleep(min(interval, remaining))
+
+
+def emit_event(event: str, **fields: Any) -> None:
+    print(json.dumps({"event": event, **fields}), flush=True)
+
+
+def check_key(check: dict[str, Any]) -> tuple[str, ...]:
+    # A re-run creates new job ids, so a retried check is analyzed again.
+    link = str(check.get("detailsUrl") or check.get("link") or "")
+    run_id = check.get("runId") or extract_run_id(link) or ""
+    job_id = check.get("jobId") or extract_job_id(link) or ""
+    return (str(check.get("name", "")), str(run_id), str(job_id), link)
+
+
+def check_state(check: dict[str, Any]) -> str:
+    conclusion = normalize_field(check.get("conclusion"))
+    return conclusion or normalize_field(check.get("state") or check.get("status") or check.get("bucket"))
+
+
+def is_pending(check: dict[str, Any]) -> bool:
+    if is_failing(check):
+        return False
+    state = normalize_field(check.get("state") or check.get("status"))
+    return state in PENDING_STATES or normalize_field(check.get("bucket")) == "pending"
+
+
 def find_git_root(start: Path) -> Path | None:
     result = subprocess.run(
         ["git", "rev-parse", "--show-toplevel"],
@@ -282,6 +802,146 @@ def is_probable_sha(value: str) -> bool:
 
 
 def fetch_pr_checks(pr_value: str, repo_root: Path, *, required: bool) -> list[dict[str, Any]] | None:
+    checks = fetch_pr_checks_graphql(pr_value, repo_root, required=required)
+    if checks is not None:
+        return checks
+    return fetch_pr_checks_cli(pr_value, repo_root, required=required)
+
+
+def pr_graphql_variables(pr_value: str) -> list[str] | None:
+    match = PR_URL_RE.search(pr_value)
+    if match:
+        owner, name, number = match.groups()
+    elif pr_value.isdigit():
+        # gh fills `{owner}` and `{repo}` from the current repository.
+        owner, name, number = "{owner}", "{repo}", pr_value
+    else:
+        return None
+    return ["-F", f"owner={owner}", "-F", f"name={name}", "-F", f"number={number}"]
+
+
+def dig(data: Any, *keys: str) -> Any:
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def fetch_pr_checks_graphql(pr_value: str, repo_root: Path, *, required: bool) -> list[dict[str, Any]] | None:
+    """Fetch PR checks with `gh api graphql`; None means fall back to `gh pr checks`.
+
+    Workflow run metadata, the newest job id of each run, and the repository
+    slug from the same response are seeded into GH_MEMO.
+    """
+    variables = pr_graphql_variables(pr_value)
+    if variables is None:
+        return None
+    checks: list[dict[str, Any]] = []
+    runs: dict[str, dict[str, Any]] = {}
+    latest_jobs: dict[str, int] = {}
+    slug = ""
+    after = ""
+    for _ in range(GRAPHQL_MAX_PAGES):
+        args = ["api", "graphql", "-f", f"query={PR_CHECKS_QUERY}", *variables]
+        if after:
+            args += ["-f", f"after={after}"]
+        result = run_gh_command(args, cwd=repo_root)
+        if result.returncode != 0:
+            return None
+        try:
+            data = json.loads(result.stdout or "{}")
+        except json.JSONDecodeError:
+            return None
+        repository = dig(data, "data", "repository")
+        pull_request = dig(repository, "pullRequest")
+        if dig(data, "errors") or not isinstance(pull_request, dict):
+            return None
+        slug = str(dig(repository, "nameWithOwner") or "")
+        commits = dig(pull_request, "commits", "nodes")
+        commit = dig(commits[-1], "commit") if isinstance(commits, list) and commits else None
+        contexts = dig(commit, "statusCheckRollup", "contexts")
+        if not isinstance(contexts, dict):
+            break
+        for node in contexts.get("nodes") or []:
+            check = rollup_context_check(node, str(dig(commit, "oid") or ""), runs)
+            if check is None:
+                continue
+            if check.get("runId") and check.get("jobId"):
+                run_id = check["runId"]
+                latest_jobs[run_id] = max(latest_jobs.get(run_id, 0), int(check["jobId"]))
+            if node.get("isRequired") or not required:
+                checks.append(check)
+        if not dig(contexts, "pageInfo", "hasNextPage"):
+            break
+        after = str(dig(contexts, "pageInfo", "endCursor") or "")
+        if not after:
+            break
+
+    for run_id, metadata in runs.items():
+        GH_MEMO.put(("run-metadata", str(repo_root), run_id), metadata)
+    for run_id, job_id in latest_jobs.items():
+        GH_MEMO.put(("run-latest-job", str(repo_root), run_id), str(job_id))
+    if slug and not PR_URL_RE.search(pr_value):
+        GH_MEMO.put(("repo-slug", str(repo_root)), slug)
+    return checks
+
+
+def rollup_context_check(node: Any, head_sha: str, runs: dict[str, dict[str, Any]]) -> dict[str, Any] | None:
+    """Shape a rollup context like a `gh pr checks --json` entry.
+
+    Check runs backed by a workflow run also record that run's metadata, in
+    the shape `gh run view --json` returns, into `runs`.
+    """
+    if not isinstance(node, dict):
+        return None
+    if node.get("__typename") == "StatusContext":
+        return {
+            "name": node.get("context") or "",
+            "state": node.get("state"),
+            "link": node.get("targetUrl") or "",
+            "description": node.get("description") or "",
+            "startedAt": node.get("createdAt"),
+        }
+    if node.get("__typename") != "CheckRun":
+        return None
+    status = normalize_field(node.get("status"))
+    conclusion = normalize_field(node.get("conclusion"))
+    run = dig(node, "checkSuite", "workflowRun")
+    workflow = str(dig(run, "workflow", "name") or "")
+    check: dict[str, Any] = {
+        "name": node.get("name") or "",
+        "state": conclusion or status,
+        "conclusion": conclusion,
+        "link": node.get("detailsUrl") or "",
+        "workflow": workflow,
+        "startedAt": node.get("startedAt"),
+        "completedAt": node.get("completedAt"),
+        "runId": None,
+        "jobId": str(node["databaseId"]) if node.get("databaseId") else None,
+    }
+    if not isinstance(run, dict) or not run.get("databaseId"):
+        return check
+    run_id = str(run["databaseId"])
+    check["runId"] = run_id
+    check["event"] = run.get("event") or ""
+    runs.setdefault(
+        run_id,
+        {
+            "conclusion": normalize_field(dig(node, "checkSuite", "conclusion")),
+            "status": normalize_field(dig(node, "checkSuite", "status")),
+            "workflowName": workflow,
+            "name": workflow,
+            "event": normalize_field(run.get("event")),
+            "headBranch": dig(node, "checkSuite", "branch", "name") or "",
+            "headSha": head_sha,
+            "url": run.get("url") or "",
+        },
+    )
+    return check
+
+
+def fetch_pr_checks_cli(pr_value: str, repo_root: Path, *, required: bool) -> list[dict[str, Any]] | None:
     # `gh pr checks --json` fields drift across gh versions. Prefer the
     # currently documented fields first, then fall back to older candidates.
     candidate_field_sets: list[list[str]] = [
@@ -434,6 +1094,22 @@ def is_failing(check: dict[str, Any]) -> bool:
     return bucket in FAILURE_BUCKETS
 
 
+def analyze_checks(
+    checks: Sequence[dict[str, Any]],
+    repo_root: Path,
+    max_lines: int,
+    context: int,
+    jobs: int,
+) -> list[dict[str, Any]]:
+    """Analyze failing checks with at most `jobs` in flight, in input order."""
+    if jobs <= 1 or len(checks) <= 1:
+        return [analyze_check(check, repo_root, max_lines, context) for check in checks]
+    # Each analysis is dominated by gh subprocess and network wait, so threads
+    # overlap the downloads; `map` keeps results in the order of `checks`.
+    with ThreadPoolExecutor(max_workers=min(jobs, len(checks))) as executor:
+        return list(executor.map(lambda check: analyze_check(check, repo_root, max_lines, context), checks))
+
+
 def analyze_check(
     check: dict[str, Any],
     repo_root: Path,
@@ -464,10 +1140,12 @@ def analyze_check(
         return base
 
     metadata = fetch_run_metadata(run_id, repo_root)
-    log_text, log_error, log_status = fetch_check_log(
+    log_path, log_error, log_status = fetch_check_log(
         run_id=run_id,
         job_id=job_id,
         repo_root=repo_root,
+        job_name=str(check.get("name") or "") if job_id else None,
+        attempt=run_attempt_key(metadata, GH_MEMO.get(("run-latest-job", str(repo_root), run_id), lambda: "")),
     )
 
     if log_status == "pending":
@@ -484,11 +1162,12 @@ def analyze_check(
             base["run"] = metadata
         return base
 
-    snippet = extract_failure_snippet(log_text, max_lines=max_lines, context=context)
+    snippet, tail = extract_log_excerpts(log_path, max_lines=max_lines, context=context)
     base["status"] = "ok"
     base["run"] = metadata or {}
     base["logSnippet"] = snippet
-    base["logTail"] = tail_lines(log_text, max_lines)
+    base["logTail"] = tail
+    base["failureBlocks"] = [block.as_dict() for block in classify_log_file(log_path)]
     return base
 
 
@@ -515,6 +1194,10 @@ def extract_job_id(url: str) -> str | None:
 
 
 def fetch_run_metadata(run_id: str, repo_root: Path) -> dict[str, Any] | None:
+    return GH_MEMO.get(("run-metadata", str(repo_root), run_id), lambda: fetch_run_metadata_uncached(run_id, repo_root))
+
+
+def fetch_run_metadata_uncached(run_id: str, repo_root: Path) -> dict[str, Any] | None:
     fields = [
         "conclusion",
         "status",
@@ -525,7 +1208,11 @@ def fetch_run_metadata(run_id: str, repo_root: Path) -> dict[str, Any] | None:
         "headSha",
         "url",
     ]
-    result = run_gh_command(["run", "view", run_id, "--json", ",".join(fields)], cwd=repo_root)
+    # `attempt` keys the log cache; gh builds without it fall back to the
+    # base fields and simply skip caching.
+    result = run_gh_command(["run", "view", run_id, "--json", ",".join([*fields, "attempt"])], cwd=repo_root)
+    if result.returncode != 0:
+        result = run_gh_command(["run", "view", run_id, "--json", ",".join(fields)], cwd=repo_root)
     if result.returncode != 0:
         return None
     try:
@@ -537,54 +1224,218 @@ def fetch_run_metadata(run_id: str, repo_root: Path) -> dict[str, Any] | None:
     return data
 
 
+def run_attempt_key(metadata: dict[str, Any] | None, latest_job_id: str = "") -> str:
+    """Identify the run attempt a log belongs to, for the log cache.
+
+    GraphQL rollups carry no attempt number, but every re-run creates new
+    check runs, so the newest job id seen for the run identifies the attempt.
+    """
+    metadata = metadata or {}
+    if metadata.get("attempt"):
+        return str(metadata["attempt"])
+    if latest_job_id:
+        return f"job-{latest_job_id}"
+    return ""
+
+
 def fetch_check_log(
     run_id: str,
     job_id: str | None,
     repo_root: Path,
-) -> tuple[str, str, str]:
-    log_text, log_error = fetch_run_log(run_id, repo_root)
-    if not log_error:
-        return log_text, "", "ok"
+    job_name: str | None = None,
+    attempt: str = "",
+) -> tuple[Path | None, str, str]:
+    log_path, log_error = fetch_run_log(run_id, repo_root, attempt)
+    if log_path is not None:
+        return slice_job_log(log_path, job_name), "", "ok"
 
     if is_log_pending_message(log_error) and job_id:
-        job_log, job_error = fetch_job_log(job_id, repo_root)
-        if job_log:
+        job_log, job_error = fetch_job_log(job_id, repo_root, run_id, attempt, job_name)
+        if job_log is not None and job_log.stat().st_size:
             return job_log, "", "ok"
         if job_error and is_log_pending_message(job_error):
-            return "", job_error, "pending"
+            return None, job_error, "pending"
         if job_error:
-            return "", job_error, "error"
-        return "", log_error, "pending"
+            return None, job_error, "error"
+        return None, log_error, "pending"
 
     if is_log_pending_message(log_error):
-        return "", log_error, "pending"
+        return None, log_error, "pending"
+
+    return None, log_error, "error"
+
 
-    return "", log_error, "error"
+def log_cache_key(repo_root: Path, run_id: str, attempt: str, job_id: str = "") -> tuple[str, ...] | None:
+    if not LOG_CACHE.enabled or not attempt:
+        return None
+    repo_slug = fetch_repo_slug(repo_root)
+    if not repo_slug:
+        return None
+    return (repo_slug, run_id, attempt, job_id)
+
+
+def cached_log(
+    key: tuple[str, ...] | None,
+    label: str,
+    fetch: Callable[[Path], str],
+) -> tuple[Path | None, str]:
+    """Serve a completed log from LOG_CACHE, storing successful downloads.
+
+    `fetch` writes the log into the path it is given and returns an error
+    message, or "" on success.
+    """
+    log_path = LOG_WORKSPACE.new_path(label)
+    if key is not None and LOG_CACHE.get(key, log_path):
+        return log_path, ""
+    log_error = fetch(log_path)
+    if log_error:
+        log_path.unlink(missing_ok=True)
+        return None, log_error
+    # Only successful downloads reach the cache; pending runs report through
+    # `log_error` and are fetched again next time.
+    if key is not None and log_path.stat().st_size:
+        LOG_CACHE.put(key, log_path)
+    return log_path, ""
+
+
+def fetch_run_log(run_id: str, repo_root: Path, attempt: str = "") -> tuple[Path | None, str]:
+    # Several failing jobs usually share one run; download its log once.
+    return GH_MEMO.get(
+        ("run-log", str(repo_root), run_id),
+        lambda: cached_log(
+            log_cache_key(repo_root, run_id, attempt),
+            f"run-{run_id}",
+            lambda dest: fetch_run_log_uncached(run_id, repo_root, dest),
+        ),
+    )
 
 
-def fetch_run_log(run_id: str, repo_root: Path) -> tuple[str, str]:
-    result = run_gh_command(["run", "view", run_id, "--log"], cwd=repo_root)
+def fetch_run_log_uncached(run_id: str, repo_root: Path, dest: Path) -> str:
+    result = run_gh_command_to_file(["run", "view", run_id, "--log"], cwd=repo_root, dest=dest)
     if result.returncode != 0:
-        error = (result.stderr or result.stdout or "").strip()
-        return "", error or "gh run view failed"
-    return result.stdout, ""
+        error = (result.stderr or read_log_head(dest)).strip()
+        return error or "gh run view failed"
+    return ""
+
+
+def slice_job_log(log_path: Path, job_name: str | None) -> Path:
+    """Keep the lines of one job from a `gh run view --log` run log.
+
+    Run logs prefix every line with tab-separated job and step names. When no
+    line belongs to `job_name` (for example a renamed matrix job), the full log
+    is returned so the snippet search still has something to work with.
+    """
+    if not job_name or not log_path.stat().st_size:
+        return log_path
+    line_re = re.compile(rb"^" + re.escape(f"{job_name}\t".encode()) + rb"[^\n]*\n?", re.MULTILINE)
+    sliced = LOG_WORKSPACE.new_path("job")
+    kept = False
+    with log_path.open("rb") as log_file, sliced.open("wb") as target:
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for match in line_re.finditer(buffer):
+                target.write(match.group())
+                kept = True
+    if not kept:
+        sliced.unlink(missing_ok=True)
+        return log_path
+    return sliced
+
+
+def fetch_job_log(
+    job_id: str,
+    repo_root: Path,
+    run_id: str = "",
+    attempt: str = "",
+    job_name: str | None = None,
+) -> tuple[Path | None, str]:
+    return GH_MEMO.get(
+        ("job-log", str(repo_root), job_id),
+        lambda: cached_log(
+            log_cache_key(repo_root, run_id, attempt, job_id) if run_id else None,
+            f"job-{job_id}",
+            lambda dest: fetch_job_log_uncached(job_id, repo_root, dest, job_name),
+        ),
+    )
 
 
-def fetch_job_log(job_id: str, repo_root: Path) -> tuple[str, str]:
+def fetch_job_log_uncached(job_id: str, repo_root: Path, dest: Path, job_name: str | None = None) -> str:
     repo_slug = fetch_repo_slug(repo_root)
     if not repo_slug:
-        return "", "Error: unable to resolve repository name for job logs."
+        return "Error: unable to resolve repository name for job logs."
     endpoint = f"/repos/{repo_slug}/actions/jobs/{job_id}/logs"
-    returncode, stdout_bytes, stderr = run_gh_command_raw(["api", endpoint], cwd=repo_root)
-    if returncode != 0:
-        message = (stderr or stdout_bytes.decode(errors="replace")).strip()
-        return "", message or "gh api job logs failed"
-    if is_zip_payload(stdout_bytes):
-        return "", "Job logs returned a zip archive; unable to parse."
-    return stdout_bytes.decode(errors="replace"), ""
+    result = run_gh_command_to_file(["api", endpoint], cwd=repo_root, dest=dest)
+    if result.returncode != 0:
+        message = (result.stderr or read_log_head(dest)).strip()
+        return message or "gh api job logs failed"
+    with dest.open("rb") as log_file:
+        if not is_zip_payload(log_file.read(2)):
+            return ""
+    return extract_zip_log(dest, job_name)
+
+
+def extract_zip_log(archive: Path, job_name: str | None) -> str:
+    """Replace a zipped job log download with the plain text of its job.
+
+    The archive is already on disk, so `zipfile` seeks its central directory
+    there and only the selected members are decompressed, one chunk at a
+    time, into the file that snippet extraction maps.
+    """
+    extracted = LOG_WORKSPACE.new_path("unzipped")
+    try:
+        with zipfile.ZipFile(archive) as bundle, extracted.open("wb") as target:
+            members = zip_log_members(bundle.infolist(), job_name)
+            for member in members:
+                last = b"\n"
+                with bundle.open(member) as source:
+                    while chunk := source.read(LOG_COPY_CHUNK_BYTES):
+                        target.write(chunk)
+                        last = chunk[-1:]
+                if last != b"\n":
+                    target.write(b"\n")
+    except (OSError, zipfile.BadZipFile) as exc:
+        extracted.unlink(missing_ok=True)
+        return f"Job logs returned an unreadable zip archive: {exc}"
+    if not members:
+        extracted.unlink(missing_ok=True)
+        return "Job log archive contains no log files."
+    os.replace(extracted, archive)
+    return ""
+
+
+def zip_log_members(members: list[zipfile.ZipInfo], job_name: str | None) -> list[zipfile.ZipInfo]:
+    """Pick the log files of one job from a GitHub Actions log archive.
+
+    A job archive holds the job log, its per-step logs, or both. Run
+    archives add a top-level `<n>_<job>.txt` per job next to a `<job>/`
+    folder of step logs. The whole-job file wins over the step files, and
+    step files are joined in step order.
+    """
+    files = sorted(
+        (member for member in members if not member.is_dir()),
+        key=lambda member: zip_log_order(member.filename),
+    )
+    top_level = [member for member in files if "/" not in member.filename]
+    if job_name:
+        whole_job = [member for member in top_level if zip_log_order(member.filename)[2] == f"{job_name}.txt"]
+        steps = [member for member in files if member.filename.startswith(f"{job_name}/")]
+        if whole_job or steps:
+            return whole_job[:1] or steps
+    return top_level or files
+
+
+def zip_log_order(name: str) -> tuple[str, int, str]:
+    folder, _, base = name.rpartition("/")
+    match = ZIP_LOG_ORDER_RE.match(base)
+    if match is None:
+        return folder, -1, base
+    return folder, int(match.group(1)), base[match.end() :]
 
 
 def fetch_repo_slug(repo_root: Path) -> str | None:
+    return GH_MEMO.get(("repo-slug", str(repo_root)), lambda: fetch_repo_slug_uncached(repo_root))
+
+
+def fetch_repo_slug_uncached(repo_root: Path) -> str | None:
     result = run_gh_command(["repo", "view", "--json", "nameWithOwner"], cwd=repo_root)
     if result.returncode != 0:
         return None
@@ -631,36 +1482,121 @@ def is_zip_payload(payload: bytes) -> bool:
     return payload.startswith(b"PK")
 
 
-def extract_failure_snippet(log_text: str, max_lines: int, context: int) -> str:
-    lines = log_text.splitlines()
-    if not lines:
-        return ""
+def extract_log_excerpts(log_path: Path, max_lines: int, context: int) -> tuple[str, str]:
+    """Return the failure snippet and the tail of a log file.
+
+    The file is memory-mapped and only the lines that end up in the excerpts
+    are decoded, so memory use does not grow with the size of the log.
+    """
+    with log_path.open("rb") as log_file:
+        if not os.fstat(log_file.fileno()).st_size:
+            return "", ""
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return log_excerpts(buffer, max_lines, context)
+
+
+def log_excerpts(buffer: bytes | mmap.mmap, max_lines: int, context: int) -> tuple[str, str]:
+    # Same windows as splitting the log into lines: a trailing newline does
+    # not start another line, and "\r\n" endings lose their "\r".
+    end = len(buffer)
+    if not end:
+        return "", ""
+    if buffer[end - 1 : end] == b"\n":
+        end -= 1
+    tail = ""
+    if max_lines > 0:
+        tail_start = lines_before(buffer, line_start(buffer, end), max_lines - 1)
+        tail = decode_lines(buffer[tail_start:end])
+
+    marker = find_last_marker(buffer, end)
+    if marker is None:
+        return tail, tail
+    marker_line = line_start(buffer, marker)
+    window_start = lines_before(buffer, marker_line, context)
+    window_end = line_end_after(buffer, marker_line, context, end)
+    if window_end < window_start:
+        return "", tail
+    window = buffer[window_start:window_end].split(b"\n")
+    if len(window) > max_lines:
+        window = window[-max_lines:] if max_lines > 0 else []
+    return decode_lines(b"\n".join(window)), tail
 
-    marker_index = find_failure_index(lines)
-    if marker_index is None:
-        return "\n".join(lines[-max_lines:])
 
-    start = max(0, marker_index - context)
-    end = min(len(lines), marker_index + context)
-    window = lines[start:end]
-    if len(window) > max_lines:
-        window = window[-max_lines:]
-    return "\n".join(window)
+def classify_log_file(log_path: Path) -> list[FailureBlock]:
+    with log_path.open("rb") as log_file:
+        if not os.fstat(log_file.fileno()).st_size:
+            return []
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return FAILURE_CLASSIFIER.classify(buffer)
+
 
+def classify_failures(log_text: str) -> list[FailureBlock]:
+    return FAILURE_CLASSIFIER.classify(log_text.encode())
 
-def find_failure_index(lines: Sequence[str]) -> int | None:
-    for idx in range(len(lines) - 1, -1, -1):
-        lowered = lines[idx].lower()
-        if any(marker in lowered for marker in FAILURE_MARKERS):
-            return idx
+
+def count_newlines(buffer: bytes | mmap.mmap, start: int, end: int) -> int:
+    # mmap has no count(); copy bounded slices instead of the whole range.
+    total = 0
+    for block_start in range(start, end, LOG_SCAN_BLOCK_BYTES):
+        total += buffer[block_start : min(end, block_start + LOG_SCAN_BLOCK_BYTES)].count(b"\n")
+    return total
+
+
+def signature_text(line: bytes) -> str:
+    prefix = LOG_LINE_PREFIX_RE.match(line)
+    text = line[prefix.end() if prefix else 0 :].decode(errors="replace").strip()
+    return text[:MAX_SIGNATURE_CHARS]
+
+
+def find_last_marker(buffer: bytes | mmap.mmap, end: int) -> int | None:
+    """Offset of the last failure marker before `end`, scanning backwards."""
+    stop = end
+    while stop > 0:
+        # Blocks start on a line boundary, so no marker straddles two blocks.
+        start = line_start(buffer, max(0, stop - LOG_SCAN_BLOCK_BYTES))
+        last = None
+        for last in FAILURE_MARKER_RE.finditer(buffer, start, stop):
+            pass
+        if last is not None:
+            return last.start()
+        stop = start
     return None
 
 
+def line_start(buffer: bytes | mmap.mmap, pos: int) -> int:
+    return buffer.rfind(b"\n", 0, pos) + 1
+
+
+def lines_before(buffer: bytes | mmap.mmap, start: int, count: int) -> int:
+    """Move the line start `start` back by up to `count` lines."""
+    for _ in range(count):
+        if start == 0:
+            break
+        start = line_start(buffer, start - 1)
+    return start
+
+
+def line_end_after(buffer: bytes | mmap.mmap, start: int, count: int, end: int) -> int:
+    """End offset of the `count` lines beginning at the line start `start`."""
+    stop = start
+    for _ in range(count):
+        newline = buffer.find(b"\n", stop, end)
+        if newline < 0:
+            return end
+        stop = newline + 1
+    return stop - 1
+
+
+def decode_lines(data: bytes) -> str:
+    return "\n".join(line.removesuffix("\r") for line in data.decode(errors="replace").split("\n"))
+
+
+def extract_failure_snippet(log_text: str, max_lines: int, context: int) -> str:
+    return log_excerpts(log_text.encode(), max_lines, context)[0]
+
+
 def tail_lines(text: str, max_lines: int) -> str:
-    if max_lines <= 0:
-        return ""
-    lines = text.splitlines()
-    return "\n".join(lines[-max_lines:])
+    return log_excerpts(text.encode(), max_lines, 1)[1]
 
 
 def render_results(target: Target, results: Iterable[dict[str, Any]]) -> None:
@@ -699,6 +1635,13 @@ def render_results(target: Target, results: Iterable[dict[str, Any]]) -> None:
             print(f"Error fetching logs: {result['error']}")
             continue
 
+        blocks = result.get("failureBlocks") or []
+        if blocks:
+            print("Failure signatures:")
+            for block in blocks:
+                lines = f"{block['startLine']}-{block['endLine']}"
+                print(f"  [{block['label']}] lines {lines}: {block['signature']}")
+
         snippet = result.get("logSnippet") or ""
         if snippet:
             print("Failure snippet:")
@@ -709,9 +1652,15 @@ def render_results(target: Target, results: Iterable[dict[str, Any]]) -> None:
 
 
 def build_payload(target: Target, results: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    results_list = list(results)
+    signatures: dict[str, int] = {}
+    for result in results_list:
+        for block in result.get("failureBlocks") or []:
+            signatures[block["label"]] = signatures.get(block["label"], 0) + 1
     payload: dict[str, Any] = {
         "target": {"type": target.kind, "value": target.value},
-        "results": list(results),
+        "results": results_list,
+        "failureSignatures": signatures,
     }
     if target.kind == "pr":
         payload["pr"] = target.value
@@ -2,12 +2,21 @@ from __future__ import annotations
 
 import importlib.util
 import json
+import os
+import subprocess
 import sys
+import zipfile
 from pathlib import Path
 
+import pytest
+
 from skills._shared.python.skill_testing import assert_entrypoints_exist, assert_skill_contract
 
 
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "inspect_ci_checks.py"
+STUB_BIN = Path(__file__).resolve().parents[5] / "tests" / "stubs" / "bin"
+
+
 def skill_text() -> str:
     return (Path(__file__).resolve().parents[1] / "SKILL.md").read_text(encoding="utf-8")
 
@@ -23,6 +32,18 @@ def load_inspector_module():
     return module
 
 
+def patch_gh(monkeypatch, inspector, fake_run_gh_command) -> None:
+    """Route captured and file-streamed gh calls through one fake."""
+
+    def fake_run_gh_command_to_file(args, cwd, dest):
+        result = fake_run_gh_command(args, cwd)
+        dest.write_text(result.stdout, encoding="utf-8")
+        return inspector.GhResult(result.returncode, "", result.stderr)
+
+    monkeypatch.setattr(inspector, "run_gh_command", fake_run_gh_command)
+    monkeypatch.setattr(inspector, "run_gh_command_to_file", fake_run_gh_command_to_file)
+
+
 def test_automation_gh_fix_ci_contract() -> None:
     skill_root = Path(__file__).resolve().parents[1]
     assert_skill_contract(skill_root)
@@ -169,3 +190,561 @@ def test_inspector_keeps_startup_failures_for_newest_branch_sha(monkeypatch) ->
         },
     ]
     assert [check["name"] for check in checks if inspector.is_failing(check)] == ["CodeQL"]
+
+
+def test_inspector_analyzes_failing_checks_concurrently_in_order(monkeypatch) -> None:
+    import threading
+    import time
+
+    inspector = load_inspector_module()
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_analyze_check(check, repo_root, max_lines, context):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Later checks finish first, so ordering must not follow completion.
+        time.sleep(0.05 * (4 - int(check["name"][-1])))
+        with lock:
+            in_flight -= 1
+        return {"name": check["name"]}
+
+    monkeypatch.setattr(inspector, "analyze_check", fake_analyze_check)
+    checks = [{"name": f"job-{index}"} for index in range(4)]
+
+    started = time.monotonic()
+    results = inspector.analyze_checks(checks, Path("."), max_lines=10, context=2, jobs=2)
+    elapsed = time.monotonic() - started
+
+    assert [result["name"] for result in results] == ["job-0", "job-1", "job-2", "job-3"]
+    assert peak == 2
+    assert elapsed < 0.05 * (4 + 3 + 2 + 1)
+
+
+def test_inspector_fetches_each_run_once_and_slices_job_logs(monkeypatch) -> None:
+    inspector = load_inspector_module()
+    calls: list[tuple[str, ...]] = []
+    run_log = "\n".join(
+        [
+            "lint\tRun ruff\tE501 line too long",
+            "lint\tRun ruff\tError: Process completed with exit code 1.",
+            "test (3.11)\tRun pytest\tFAILED tests/test_x.py::test_y",
+            "test (3.12)\tRun pytest\tFAILED tests/test_z.py::test_w",
+        ]
+    )
+
+    def fake_run_gh_command(args, cwd):
+        calls.append(tuple(args))
+        if args[:2] == ["run", "view"] and "--log" in args:
+            return inspector.GhResult(0, run_log, "")
+        if args[:2] == ["run", "view"]:
+            return inspector.GhResult(0, json.dumps({"conclusion": "failure", "workflowName": "CI"}), "")
+        raise AssertionError(f"unexpected gh call: {args}")
+
+    patch_gh(monkeypatch, inspector, fake_run_gh_command)
+    checks = [
+        {"name": name, "link": f"https://github.com/o/r/actions/runs/42/job/{job_id}"}
+        for job_id, name in ((1, "lint"), (2, "test (3.11)"), (3, "test (3.12)"))
+    ]
+
+    results = inspector.analyze_checks(checks, Path("."), max_lines=20, context=5, jobs=3)
+
+    assert [call[:2] + (call[-1],) for call in calls].count(("run", "view", "--log")) == 1
+    assert len(calls) == 2
+    assert "E501" in results[0]["logSnippet"]
+    assert "test_x" not in results[0]["logSnippet"]
+    assert "test_x" in results[1]["logSnippet"]
+    assert "test_w" in results[2]["logSnippet"]
+    assert all(result["run"]["workflowName"] == "CI" for result in results)
+
+
+def test_inspector_resolves_repo_slug_once_for_pending_run_logs(monkeypatch) -> None:
+    inspector = load_inspector_module()
+    calls: list[tuple[str, ...]] = []
+
+    def fake_run_gh_command(args, cwd):
+        calls.append(tuple(args))
+        if args[:2] == ["run", "view"] and "--log" in args:
+            return inspector.GhResult(1, "", "run 42 is still in progress; logs will be available when it is complete")
+        if args[:2] == ["run", "view"]:
+            return inspector.GhResult(0, "{}", "")
+        if args[:2] == ["repo", "view"]:
+            return inspector.GhResult(0, json.dumps({"nameWithOwner": "o/r"}), "")
+        if args[0] == "api":
+            return inspector.GhResult(0, f"job log for {args[1]}\nerror: boom\n", "")
+        raise AssertionError(f"unexpected gh call: {args}")
+
+    patch_gh(monkeypatch, inspector, fake_run_gh_command)
+    checks = [
+        {"name": name, "link": f"https://github.com/o/r/actions/runs/42/job/{job_id}"}
+        for job_id, name in ((1, "a"), (2, "b"))
+    ]
+
+    results = inspector.analyze_checks(checks, Path("."), max_lines=20, context=5, jobs=2)
+
+    assert [result["status"] for result in results] == ["ok", "ok"]
+    assert sum(1 for call in calls if call[:2] == ("repo", "view")) == 1
+    assert sum(1 for call in calls if "--log" in call) == 1
+    assert "/repos/o/r/actions/jobs/1/logs" in results[0]["logSnippet"]
+    assert "/repos/o/r/actions/jobs/2/logs" in results[1]["logSnippet"]
+
+
+def test_inspector_extracts_zipped_job_logs(monkeypatch, tmp_path) -> None:
+    inspector = load_inspector_module()
+    archive = tmp_path / "logs.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as bundle:
+        bundle.writestr("0_lint.txt", "lint ok\n")
+        bundle.writestr("build/2_Run tests.txt", "FAILED tests/test_api.py::test_get\nerror: 1 failed")
+        bundle.writestr("build/1_Set up job.txt", "Runner image ubuntu-24.04\n")
+        bundle.writestr("deploy/1_Set up job.txt", "error: not this job\n")
+
+    def fake_run_gh_command(args, cwd):
+        if args[:2] == ["run", "view"] and "--log" in args:
+            return inspector.GhResult(1, "", "run 42 is still in progress; logs will be available when it is complete")
+        if args[:2] == ["run", "view"]:
+            return inspector.GhResult(0, "{}", "")
+        if args[:2] == ["repo", "view"]:
+            return inspector.GhResult(0, json.dumps({"nameWithOwner": "o/r"}), "")
+        raise AssertionError(f"unexpected gh call: {args}")
+
+    def fake_run_gh_command_to_file(args, cwd, dest):
+        if args[0] == "api":
+            dest.write_bytes(archive.read_bytes())
+            return inspector.GhResult(0, "", "")
+        result = fake_run_gh_command(args, cwd)
+        return inspector.GhResult(result.returncode, "", result.stderr)
+
+    monkeypatch.setattr(inspector, "run_gh_command", fake_run_gh_command)
+    monkeypatch.setattr(inspector, "run_gh_command_to_file", fake_run_gh_command_to_file)
+    check = {"name": "build", "link": "https://github.com/o/r/actions/runs/42/job/7"}
+
+    result = inspector.analyze_checks([check], Path("."), max_lines=20, context=5, jobs=1)[0]
+
+    assert result["status"] == "ok", result
+    assert result["logTail"].splitlines() == [
+        "Runner image ubuntu-24.04",
+        "FAILED tests/test_api.py::test_get",
+        "error: 1 failed",
+    ]
+    assert "not this job" not in result["logSnippet"]
+
+
+def test_zip_log_members_prefer_whole_job_file_then_ordered_steps() -> None:
+    inspector = load_inspector_module()
+
+    def names(files: list[str], job_name: str | None) -> list[str]:
+        members = [zipfile.ZipInfo(name) for name in files]
+        return [member.filename for member in inspector.zip_log_members(members, job_name)]
+
+    run_archive = ["build/", "build/10_Post.txt", "build/2_Test.txt", "1_build.txt", "0_lint.txt"]
+    assert names(run_archive, "build") == ["1_build.txt"]
+    assert names(run_archive[:3], "build") == ["build/2_Test.txt", "build/10_Post.txt"]
+    assert names(["job/2_b.txt", "job/1_a.txt"], None) == ["job/1_a.txt", "job/2_b.txt"]
+    assert names(["0_lint.txt", "1_build.txt", "build/1_a.txt"], "renamed") == ["0_lint.txt", "1_build.txt"]
+
+
+def test_inspector_reuses_cached_completed_logs_across_inspections(monkeypatch, tmp_path) -> None:
+    inspector = load_inspector_module()
+    calls: list[tuple[str, ...]] = []
+    pending = {"value": True}
+
+    def fake_run_gh_command(args, cwd):
+        calls.append(tuple(args))
+        if args[:2] == ["run", "view"] and "--log" in args:
+            if pending["value"]:
+                return inspector.GhResult(1, "", "run 7 is still in progress; logs will be available when it is complete")
+            return inspector.GhResult(0, "build\tstep\terror: compile failed\n", "")
+        if args[:2] == ["run", "view"]:
+            return inspector.GhResult(0, json.dumps({"status": "completed", "attempt": 2}), "")
+        if args[:2] == ["repo", "view"]:
+            return inspector.GhResult(0, json.dumps({"nameWithOwner": "o/r"}), "")
+        raise AssertionError(f"unexpected gh call: {args}")
+
+    patch_gh(monkeypatch, inspector, fake_run_gh_command)
+    monkeypatch.setattr(inspector, "LOG_CACHE", inspector.LogCache(tmp_path / "logs", max_bytes=1024 * 1024))
+    check = {"name": "build", "link": "https://github.com/o/r/actions/runs/7"}
+
+    def inspect() -> dict:
+        inspector.GH_MEMO.clear()
+        return inspector.analyze_checks([check], Path("."), max_lines=20, context=5, jobs=1)[0]
+
+    assert inspect()["status"] == "log_pending"
+    assert list((tmp_path / "logs").glob("*")) == []
+
+    pending["value"] = False
+    assert "compile failed" in inspect()["logSnippet"]
+    assert len(list((tmp_path / "logs").glob("*.log.gz"))) == 1
+
+    calls.clear()
+    assert "compile failed" in inspect()["logSnippet"]
+    assert not any("--log" in call for call in calls)
+
+    inspector.LOG_CACHE.enabled = False
+    calls.clear()
+    inspect()
+    assert any("--log" in call for call in calls)
+
+
+def test_log_cache_evicts_least_recently_used_entries(tmp_path) -> None:
+    import os
+
+    inspector = load_inspector_module()
+    cache = inspector.LogCache(tmp_path / "cache", max_bytes=10**9)
+    logs = {name: tmp_path / f"{name}.log" for name in ("first", "second", "third", "read")}
+    logs["first"].write_text("first " * 100, encoding="utf-8")
+    logs["second"].write_text("second " * 100, encoding="utf-8")
+    logs["third"].write_text("x", encoding="utf-8")
+    cache.put(("o/r", "1", "1", ""), logs["first"])
+    cache.put(("o/r", "2", "1", ""), logs["second"])
+    first, second = cache.path_for(("o/r", "1", "1", "")), cache.path_for(("o/r", "2", "1", ""))
+    os.utime(first, (1, 1))
+    os.utime(second, (2, 2))
+    assert cache.get(("o/r", "1", "1", ""), logs["read"])
+    assert logs["read"].read_text(encoding="utf-8") == "first " * 100
+
+    # Room for the recently read entry and the new one, not the stale one.
+    cache.max_bytes = 2 * first.stat().st_size
+    cache.put(("o/r", "3", "1", ""), logs["third"])
+    assert first.exists()
+    assert not second.exists()
+
+
+def test_log_excerpts_match_line_based_extraction() -> None:
+    inspector = load_inspector_module()
+    lines = [f"step {index}: ok" for index in range(40)]
+    lines[12] = "Traceback (most recent call last):"
+    lines[25] = "E   AssertionError: expected 1"
+    log_text = "\r\n".join(lines) + "\r\n"
+
+    snippet = inspector.extract_failure_snippet(log_text, max_lines=8, context=5)
+    assert snippet == "\n".join(lines[22:30])
+    assert inspector.tail_lines(log_text, 3) == "\n".join(lines[-3:])
+    assert inspector.extract_failure_snippet("step 1: ok\nstep 2: ok\n", max_lines=1, context=5) == "step 2: ok"
+    assert inspector.extract_failure_snippet("", max_lines=5, context=5) == ""
+
+
+def test_log_excerpts_step_back_block_by_block_to_an_early_marker(monkeypatch, tmp_path) -> None:
+    inspector = load_inspector_module()
+    lines = [f"step {index}: compiled module {'x' * (index % 7)}" for index in range(60)]
+    lines[4] = "E   AssertionError: expected 1"
+    log_path = tmp_path / "job.log"
+    log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    # Blocks shorter than, close to, and a few lines longer than one line all
+    # have to land on line starts and keep walking back to line 4.
+    for block_bytes in (16, 37, 64, 100):
+        monkeypatch.setattr(inspector, "LOG_SCAN_BLOCK_BYTES", block_bytes)
+        snippet, tail = inspector.extract_log_excerpts(log_path, max_lines=8, context=3)
+        assert snippet == "\n".join(lines[1:7]), block_bytes
+        assert tail == "\n".join(lines[-8:]), block_bytes
+
+
+def test_log_excerpts_scan_huge_logs_in_bounded_memory(tmp_path) -> None:
+    """Opt-in benchmark: GH_FIX_CI_BENCH_LOG_MB=500 reproduces the 500 MB case."""
+    import time
+    import tracemalloc
+
+    target_mb = int(os.environ.get("GH_FIX_CI_BENCH_LOG_MB", "0"))
+    if target_mb <= 0:
+        pytest.skip("set GH_FIX_CI_BENCH_LOG_MB to run the large-log benchmark")
+    inspector = load_inspector_module()
+    block = "".join(f"build\tcompile\t2026-01-01T00:00:00Z compiling module {index}\n" for index in range(2000))
+    log_path = tmp_path / "huge.log"
+    with log_path.open("w", encoding="utf-8") as log_file:
+        log_file.write("build\tcompile\terror: stale warning from the first step\n")
+        written = 0
+        while written < target_mb * 1024 * 1024:
+            log_file.write(block)
+            written += len(block)
+        log_file.write("build\ttest\tFAILED tests/test_core.py::test_roundtrip\n")
+        log_file.write("build\ttest\tProcess completed with exit code 1.\n")
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    snippet, tail = inspector.extract_log_excerpts(log_path, max_lines=160, context=30)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert "test_roundtrip" in snippet
+    assert "stale warning" not in snippet
+    assert tail.endswith("Process completed with exit code 1.")
+    assert peak < 4 * 1024 * 1024, f"{target_mb} MiB in {elapsed:.3f}s, peak {peak / 2**10:.0f} KiB"
+
+
+def test_failure_classifier_labels_distinct_blocks_with_line_ranges() -> None:
+    inspector = load_inspector_module()
+    log_text = "\n".join(
+        [
+            "lint\tRun ruff\t2026-01-01T00:00:00.1Z src/app.py:3:1: F401 [*] `os` imported but unused",
+            "lint\tRun ruff\t2026-01-01T00:00:00.1Z src/app.py:9:5: E501 Line too long",
+            "lint\tRun ruff\t2026-01-01T00:00:00.1Z ##[error]Process completed with exit code 1.",
+            "types\tmypy\tsrc/app.py:12: error: Incompatible return value  [return-value]",
+            "types\tpyright\t/w/src/app.py:4:10 - error: \"x\" is not defined",
+            "test\tpytest\tcollected 4 items",
+            "test\tpytest\tE   AssertionError: boom",
+            "test\tpytest\tFAILED tests/test_x.py::test_y - AssertionError: boom",
+            "sh\tshellcheck\t     ^-- SC2086 (info): Double quote to prevent globbing.",
+            "sg\tsemgrep\t   1 Code Finding",
+            "test\tpytest\tE   AssertionError: boom",
+            "build\tmake\tmake: *** [Makefile:3: all] Error 2",
+        ]
+    )
+
+    blocks = [
+        (block.label, block.start_line, block.end_line, block.signature)
+        for block in inspector.classify_failures(log_text)
+    ]
+
+    assert blocks == [
+        ("ruff", 1, 2, "src/app.py:3:1: F401 [*] `os` imported but unused"),
+        ("exit-code", 3, 3, "##[error]Process completed with exit code 1."),
+        ("mypy", 4, 4, "src/app.py:12: error: Incompatible return value  [return-value]"),
+        ("pyright", 5, 5, '/w/src/app.py:4:10 - error: "x" is not defined'),
+        ("pytest", 7, 8, "E   AssertionError: boom"),
+        ("shellcheck", 9, 9, "^-- SC2086 (info): Double quote to prevent globbing."),
+        ("semgrep", 10, 10, "1 Code Finding"),
+        ("exit-code", 12, 12, "make: *** [Makefile:3: all] Error 2"),
+    ]
+    assert inspector.classify_failures("compiling module 3 of 4\nok\n") == []
+
+
+def test_payload_exposes_failure_blocks_per_check(monkeypatch) -> None:
+    inspector = load_inspector_module()
+
+    def fake_run_gh_command(args, cwd):
+        if args[:2] == ["run", "view"] and "--log" in args:
+            return inspector.GhResult(0, "test\tpytest\tFAILED tests/test_x.py::test_y\ntest\tpytest\texit code 1\n", "")
+        if args[:2] == ["run", "view"]:
+            return inspector.GhResult(0, "{}", "")
+        raise AssertionError(f"unexpected gh call: {args}")
+
+    patch_gh(monkeypatch, inspector, fake_run_gh_command)
+    results = inspector.analyze_checks(
+        [{"name": "test", "link": "https://github.com/o/r/actions/runs/9"}], Path("."), max_lines=20, context=5, jobs=1
+    )
+    payload = inspector.build_payload(inspector.Target(kind="pr", value="12"), results)
+
+    assert payload["results"][0]["failureBlocks"] == [
+        {"label": "pytest", "startLine": 1, "endLine": 1, "signature": "FAILED tests/test_x.py::test_y"},
+        {"label": "exit-code", "startLine": 2, "endLine": 2, "signature": "exit code 1"},
+    ]
+    assert payload["failureSignatures"] == {"pytest": 1, "exit-code": 1}
+
+
+def check_run_node(name: str, job_id: int, run_id: int, conclusion: str) -> dict:
+    return {
+        "__typename": "CheckRun",
+        "name": name,
+        "databaseId": job_id,
+        "status": "COMPLETED",
+        "conclusion": conclusion,
+        "detailsUrl": f"https://github.com/o/r/actions/runs/{run_id}/job/{job_id}",
+        "startedAt": "2026-01-01T00:00:00Z",
+        "completedAt": "2026-01-01T00:01:00Z",
+        "isRequired": True,
+        "checkSuite": {
+            "status": "COMPLETED",
+            "conclusion": "FAILURE",
+            "branch": {"name": "feat/x"},
+            "workflowRun": {
+                "databaseId": run_id,
+                "event": "PULL_REQUEST",
+                "url": f"https://github.com/o/r/actions/runs/{run_id}",
+                "workflow": {"name": "CI"},
+            },
+        },
+    }
+
+
+def rollup_page(nodes: list[dict], end_cursor: str | None) -> str:
+    contexts = {"pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor}, "nodes": nodes}
+    commit = {"oid": "abc123", "statusCheckRollup": {"contexts": contexts}}
+    repository = {"nameWithOwner": "o/r", "pullRequest": {"commits": {"nodes": [{"commit": commit}]}}}
+    return json.dumps({"data": {"repository": repository}})
+
+
+def run_inspector_with_stub(tmp_path: Path, extra_env: dict[str, str]) -> tuple[dict, list[str]]:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    log_dir = tmp_path / "gh-log"
+    env = {
+        "PATH": os.pathsep.join([str(STUB_BIN), os.environ.get("PATH", "")]),
+        "HOME": str(tmp_path / "home"),
+        "CODEX_GH_STUB_MODE_ENABLED": "true",
+        "CODEX_STUB_LOG_DIR": str(log_dir),
+        **extra_env,
+    }
+    completed = subprocess.run(
+        [sys.executable, str(SCRIPT), "--repo", str(repo), "--pr", "12", "--json"],
+        cwd=repo,
+        env=env,
+        text=True,
+        capture_output=True,
+        check=False,
+    )
+    assert completed.returncode == 1, completed.stderr
+    calls = (log_dir / "gh.calls.txt").read_text(encoding="utf-8").splitlines()
+    return json.loads(completed.stdout), calls
+
+
+def test_inspector_reads_pr_checks_and_runs_from_one_graphql_query(tmp_path) -> None:
+    graphql_dir = tmp_path / "graphql"
+    graphql_dir.mkdir()
+    lint = check_run_node("lint", 101, 42, "FAILURE")
+    test = check_run_node("test", 102, 42, "FAILURE")
+    docs = check_run_node("docs", 103, 43, "SUCCESS")
+    status = {"__typename": "StatusContext", "context": "deploy", "state": "ERROR", "targetUrl": "https://ci.example/1"}
+    (graphql_dir / "first.json").write_text(rollup_page([lint, docs], "cursor-1"), encoding="utf-8")
+    (graphql_dir / "cursor-1.json").write_text(rollup_page([test, status], None), encoding="utf-8")
+
+    payload, calls = run_inspector_with_stub(tmp_path, {"CODEX_GH_STUB_GRAPHQL_DIR": str(graphql_dir)})
+
+    assert [result["name"] for result in payload["results"]] == ["lint", "test", "deploy"]
+    lint_result = payload["results"][0]
+    assert (lint_result["runId"], lint_result["jobId"]) == ("42", "101")
+    assert lint_result["run"]["workflowName"] == "CI"
+    assert lint_result["run"]["headSha"] == "abc123"
+    # Same fields as `gh run view --json`; the attempt key is kept out of it.
+    assert set(lint_result["run"]) == {
+        "conclusion",
+        "status",
+        "workflowName",
+        "name",
+        "event",
+        "headBranch",
+        "headSha",
+        "url",
+    }
+    assert payload["results"][2]["status"] == "external"
+    assert sum(1 for call in calls if call.startswith("gh api graphql")) == 2
+    assert not any(call.startswith(("gh pr checks", "gh repo view")) for call in calls)
+    assert not any(call.startswith("gh run view") and "--json" in call for call in calls)
+
+
+def test_inspector_falls_back_to_pr_checks_without_graphql(tmp_path) -> None:
+    checks = [{"name": "ci", "state": "FAILURE", "bucket": "fail", "link": "https://ci.example/2"}]
+
+    payload, calls = run_inspector_with_stub(
+        tmp_path,
+        {"CODEX_GH_STUB_PR_CHECKS_MODE": "custom", "CODEX_GH_STUB_PR_CHECKS_JSON": json.dumps(checks)},
+    )
+
+    assert [result["name"] for result in payload["results"]] == ["ci"]
+    assert any(call.startswith("gh api graphql") for call in calls)
+    assert sum(1 for call in calls if call.startswith("gh pr checks")) == 1
+
+
+def watch_args(**overrides):
+    import argparse
+
+    values = {
+        "required": False,
+        "limit": 20,
+        "max_lines": 20,
+        "context": 5,
+        "jobs": 2,
+        "watch_until": "first-failure",
+        "watch_timeout": 3600,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def run_watch(monkeypatch, capsys, snapshots, statuses=None, **overrides):
+    inspector = load_inspector_module()
+    polls = iter(snapshots)
+    statuses = statuses or {}
+    analyzed: list[str] = []
+    sleeps: list[float] = []
+
+    def fake_fetch_pr_checks(pr_value, repo_root, *, required):
+        return next(polls)
+
+    def fake_analyze_check(check, repo_root, max_lines, context):
+        analyzed.append(check["name"])
+        pending = statuses.get(check["name"], [])
+        return {"name": check["name"], "status": pending.pop(0) if pending else "ok"}
+
+    monkeypatch.setattr(inspector, "fetch_pr_checks", fake_fetch_pr_checks)
+    monkeypatch.setattr(inspector, "analyze_check", fake_analyze_check)
+    monkeypatch.setattr(inspector.time, "sleep", sleeps.append)
+    exit_code = inspector.watch_checks(inspector.Target("pr", "12"), Path("."), watch_args(**overrides))
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    return exit_code, events, analyzed, sleeps
+
+
+def test_watch_stops_at_first_failed_conclusion_with_adaptive_polls(monkeypatch, capsys) -> None:
+    queued = {"name": "lint", "state": "QUEUED", "link": "https://github.com/o/r/actions/runs/1/job/11"}
+    running = dict(queued, state="IN_PROGRESS")
+    failed = {"name": "test", "state": "FAILURE", "link": "https://github.com/o/r/actions/runs/1/job/12"}
+    snapshots = [[queued], [queued], [running, failed]]
+
+    # The failed conclusion ends the watch; the pending log is fetched afterwards.
+    exit_code, events, analyzed, sleeps = run_watch(
+        monkeypatch, capsys, snapshots, {"test": ["log_pending", "log_pending"]}
+    )
+
+    assert exit_code == 1
+    assert analyzed == ["test", "test", "test"]
+    assert [event["event"] for event in events] == [
+        "check",
+        "poll",
+        "poll",
+        "check",
+        "check",
+        "failure_pending",
+        "failure",
+        "done",
+    ]
+    assert events[3] == {"event": "check", "name": "lint", "state": "in_progress", "runId": "1", "jobId": "11"}
+    assert [events[5]["status"], events[6]["status"]] == ["log_pending", "ok"]
+    assert {key: events[-1][key] for key in ("reason", "failing", "polls")} == {
+        "reason": "first-failure",
+        "failing": ["test"],
+        "polls": 3,
+    }
+    # Unchanged polls back off; log retries start again at the minimum interval.
+    assert sleeps == [5.0, 7.5, 5.0, 7.5]
+
+
+def test_watch_reports_a_log_pending_failure_once(monkeypatch, capsys) -> None:
+    failed = {"name": "a", "state": "FAILURE", "link": "https://github.com/o/r/actions/runs/1/job/1"}
+    running = {"name": "b", "state": "IN_PROGRESS", "link": "https://github.com/o/r/actions/runs/1/job/2"}
+    passed = dict(running, state="SUCCESS")
+
+    exit_code, events, analyzed, _ = run_watch(
+        monkeypatch,
+        capsys,
+        [[failed, running], [failed, running], [failed, passed]],
+        {"a": ["log_pending", "log_pending"]},
+        watch_until="complete",
+    )
+
+    assert exit_code == 1
+    assert analyzed == ["a", "a", "a"]
+    assert [event["event"] for event in events if event["event"].startswith("failure")] == [
+        "failure_pending",
+        "failure",
+    ]
+    assert events[-1]["failing"] == ["a"]
+
+
+def test_watch_until_complete_skips_already_analyzed_checks(monkeypatch, capsys) -> None:
+    failed = {"name": "a", "state": "FAILURE", "link": "https://github.com/o/r/actions/runs/1/job/1"}
+    running = {"name": "b", "state": "IN_PROGRESS", "link": "https://github.com/o/r/actions/runs/1/job/2"}
+    passed = dict(running, state="SUCCESS")
+
+    exit_code, events, analyzed, _ = run_watch(
+        monkeypatch, capsys, [[failed, running], [failed, passed]], watch_until="complete"
+    )
+    assert exit_code == 1
+    assert analyzed == ["a"]
+    assert events[-1]["reason"] == "complete"
+
+    exit_code, events, analyzed, _ = run_watch(monkeypatch, capsys, [[passed]])
+    assert (exit_code, analyzed, events[-1]["reason"]) == (0, [], "complete")
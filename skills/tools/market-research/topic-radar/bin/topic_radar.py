@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import hashlib
 import json
 import math
 import os
 import re
-import subprocess
 import sys
 import tempfile
 import time
@@ -15,13 +15,20 @@ import urllib.error
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
+from collections.abc import Generator, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import UTC, date, datetime, timedelta
 from email.utils import parsedate_to_datetime
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+numpy: Any
+try:
+    import numpy
+except ImportError:  # NumPy is optional; scoring falls back to the pure-Python columnar path.
+    numpy = None
 
 VERSION = "0.4.0"
 
@@ -107,6 +114,42 @@ SOURCE_WEIGHTS = {
 }
 USER_AGENT = "agent-kit-topic-radar/0.3 (+https://github.com/sympoies/agent-kit)"
 POLYMARKET_MCP_SOURCE_DETAIL = "polymarket-mcp"
+POLYMARKET_MCP_CHILD_KINDS: dict[str, str | None] = {
+    "events": "events",
+    "eventResults": "events",
+    "gamma_list_events": "events",
+    "markets": "markets",
+    "marketResults": "markets",
+    "gamma_list_markets": "markets",
+    "results": None,
+    "search": "search",
+    "searchResults": "search",
+    "gamma_search_public": "search",
+}
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+NUMPY_SCORE_MIN_ITEMS = 512
+NEAR_DUPLICATE_BANDS = 4
+NEAR_DUPLICATE_MAX_DISTANCE = 3
+NEAR_DUPLICATE_MIN_TITLE_TOKENS = 3
+NEAR_DUPLICATE_SUMMARY_TOKENS = 24
+NEAR_DUPLICATE_STOPWORDS = frozenset(
+    ("a", "an", "and", "are", "as", "at", "by", "for", "from", "in", "is", "it", "of", "on", "or", "the", "to", "with")
+)
+NEWS_TITLE_PUBLISHER_SUFFIX = re.compile(r"\s+[-|\u2013\u2014]\s+[^-|\u2013\u2014]{2,80}$")
+JSON_NUMBER_START = "-0123456789"
+JSON_NUMBER_TOKEN = re.compile(r"[-+0-9.eE]*")
+POLYMARKET_GAMMA_API = "https://gamma-api.polymarket.com"
+POLYMARKET_REPORT_DAYS = {"daily": 1, "weekly": 7, "monthly": 31}
+POLYMARKET_UNSAFE_ENV_NAMES = (
+    "POLYMARKET_PRIVATE_KEY",
+    "POLYMARKET_API_KEY",
+    "POLYMARKET_API_SECRET",
+    "POLYMARKET_API_PASSPHRASE",
+    "POLYMARKET_BUILDER_API_KEY",
+    "POLYMARKET_BUILDER_API_SECRET",
+    "POLYMARKET_BUILDER_API_PASSPHRASE",
+    "POLYMARKET_BUILDER_AUTH_HEADER",
+)
 
 OFFICIAL_FEEDS = [
     ("OpenAI News", "https://openai.com/news/rss.xml"),
@@ -295,6 +338,7 @@ class RadarItem:
     raw: dict[str, Any] = field(default_factory=dict)
     also_seen_in: list[str] = field(default_factory=list)
     cross_source_count: int = 1
+    merged_from: list[dict[str, str]] = field(default_factory=list)
 
     def to_json(self) -> dict[str, Any]:
         return {
@@ -311,6 +355,7 @@ class RadarItem:
             "tags": self.tags,
             "alsoSeenIn": self.also_seen_in,
             "crossSourceCount": self.cross_source_count,
+            "mergedFrom": self.merged_from,
             "raw": self.raw,
         }
 
@@ -449,11 +494,15 @@ def topic_terms(topics: list[str]) -> list[str]:
 
 
 def interest_match_score(item: RadarItem, topics: list[str]) -> float:
+    return interest_terms_score(item, topic_terms(topics))
+
+
+def interest_terms_score(item: RadarItem, terms: list[str]) -> float:
     haystack = " ".join([item.title, item.summary or "", " ".join(item.tags)]).lower()
     if not haystack:
         return 0.0
     score = 0.0
-    for term in topic_terms(topics):
+    for term in terms:
         if topic_term_matches(haystack, term):
             score += 1.0 if " " in term else 0.4
     return min(score, 6.0)
@@ -469,27 +518,87 @@ def topic_term_matches(haystack: str, term: str) -> bool:
     return term in haystack
 
 
-def recency_score(published_at: str | None, days: int, reference_dt: datetime | None = None) -> float:
-    published = parse_iso_datetime(published_at)
-    if published is None:
-        return 0.0
-    reference = reference_dt or now_utc()
-    age_hours = max(0.0, (reference - published).total_seconds() / 3600.0)
-    window_hours = max(float(days * 24), 1.0)
-    return max(0.0, 8.0 * (1.0 - min(age_hours / window_hours, 1.0)))
+@dataclass
+class ScoreColumns:
+    weights: list[float]
+    engagement: list[float]
+    published_epoch: list[float]
+    interest: list[float]
 
 
-def compute_score(
-    item: RadarItem,
+def build_score_columns(items: list[RadarItem], topics: list[str]) -> ScoreColumns:
+    terms = topic_terms(topics)
+    columns = ScoreColumns(weights=[], engagement=[], published_epoch=[], interest=[])
+    for item in items:
+        published = parse_iso_datetime(item.published_at)
+        columns.weights.append(SOURCE_WEIGHTS.get(item.source, 10.0))
+        columns.engagement.append(max(item.engagement, 0.0))
+        columns.published_epoch.append(published.timestamp() if published is not None else math.nan)
+        columns.interest.append(interest_terms_score(item, terms))
+    return columns
+
+
+def score_columns_python(columns: ScoreColumns, reference_epoch: float, window_hours: float) -> list[float]:
+    scores: list[float] = []
+    for weight, engagement, published, interest in zip(
+        columns.weights,
+        columns.engagement,
+        columns.published_epoch,
+        columns.interest,
+        strict=True,
+    ):
+        recency = 0.0
+        if not math.isnan(published):
+            age_hours = max(0.0, (reference_epoch - published) / 3600.0)
+            recency = max(0.0, 8.0 * (1.0 - min(age_hours / window_hours, 1.0)))
+        scores.append(weight + math.log1p(engagement) * 2.0 + interest * 6.0 + recency)
+    return scores
+
+
+def score_columns_numpy(columns: ScoreColumns, reference_epoch: float, window_hours: float) -> list[float]:
+    weights = numpy.asarray(columns.weights, dtype=numpy.float64)
+    engagement = numpy.asarray(columns.engagement, dtype=numpy.float64)
+    published = numpy.asarray(columns.published_epoch, dtype=numpy.float64)
+    interest = numpy.asarray(columns.interest, dtype=numpy.float64)
+    age_hours = numpy.maximum(0.0, (reference_epoch - published) / 3600.0)
+    recency = numpy.maximum(0.0, 8.0 * (1.0 - numpy.minimum(age_hours / window_hours, 1.0)))
+    recency = numpy.where(numpy.isnan(published), 0.0, recency)
+    scores = weights + numpy.log1p(engagement) * 2.0 + interest * 6.0 + recency
+    return [float(score) for score in scores]
+
+
+def resolve_score_backend(backend: str, item_count: int) -> str:
+    if backend == "auto":
+        return "numpy" if numpy is not None and item_count >= NUMPY_SCORE_MIN_ITEMS else "python"
+    if backend == "numpy" and numpy is None:
+        raise UsageError("score backend numpy requires NumPy to be installed")
+    return backend
+
+
+def score_items(
+    items: list[RadarItem],
     topics: list[str],
     days: int,
     reference_dt: datetime | None = None,
-) -> RadarItem:
-    base = SOURCE_WEIGHTS.get(item.source, 10.0)
-    engagement = math.log1p(max(item.engagement, 0.0)) * 2.0
-    interest = interest_match_score(item, topics) * 6.0
-    item.score = base + engagement + interest + recency_score(item.published_at, days, reference_dt)
-    return item
+    *,
+    backend: str = "auto",
+) -> list[RadarItem]:
+    """Score items in one columnar pass: source weight, log engagement, topic match, and recency.
+
+    The arithmetic is NumPy-vectorized when available and large enough to pay off.
+    """
+    if not items:
+        return items
+    columns = build_score_columns(items, topics)
+    reference_epoch = (reference_dt or now_utc()).timestamp()
+    window_hours = max(float(days * 24), 1.0)
+    if resolve_score_backend(backend, len(items)) == "numpy":
+        scores = score_columns_numpy(columns, reference_epoch, window_hours)
+    else:
+        scores = score_columns_python(columns, reference_epoch, window_hours)
+    for item, score in zip(items, scores, strict=True):
+        item.score = score
+    return items
 
 
 def canonical_key(item: RadarItem) -> str:
@@ -502,31 +611,133 @@ def canonical_key(item: RadarItem) -> str:
     return f"title:{title[:120]}"
 
 
+def near_duplicate_tokens(text: str) -> list[str]:
+    return [
+        token
+        for token in re.findall(r"[a-z0-9][a-z0-9.+#-]*", text.lower())
+        if len(token) >= 2 and token not in NEAR_DUPLICATE_STOPWORDS
+    ]
+
+
+def near_duplicate_title(item: RadarItem) -> str:
+    if item.source == "news":
+        # Google News and GDELT titles usually end with " - Publisher".
+        return NEWS_TITLE_PUBLISHER_SUFFIX.sub("", item.title)
+    return item.title
+
+
+def simhash_fingerprint(item: RadarItem) -> int | None:
+    title_tokens = near_duplicate_tokens(near_duplicate_title(item))
+    if len(title_tokens) < NEAR_DUPLICATE_MIN_TITLE_TOKENS:
+        return None
+    features: dict[str, int] = {}
+    for token in title_tokens:
+        features[token] = features.get(token, 0) + 3
+    for first, second in zip(title_tokens, title_tokens[1:]):
+        bigram = f"{first} {second}"
+        features[bigram] = features.get(bigram, 0) + 2
+    for token in near_duplicate_tokens(item.summary or "")[:NEAR_DUPLICATE_SUMMARY_TOKENS]:
+        features[token] = features.get(token, 0) + 1
+    weights = [0] * 64
+    for feature, weight in features.items():
+        digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += weight if digest >> bit & 1 else -weight
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def near_duplicate_groups(items: list[RadarItem]) -> list[list[int]]:
+    """Group items whose SimHash fingerprints are within NEAR_DUPLICATE_MAX_DISTANCE bits.
+
+    Fingerprints are split into NEAR_DUPLICATE_BANDS bands and indexed per band;
+    by pigeonhole, any pair within the distance budget shares at least one band,
+    so only items landing in a common bucket are compared.
+    """
+    band_bits = 64 // NEAR_DUPLICATE_BANDS
+    band_mask = (1 << band_bits) - 1
+    fingerprints: list[int | None] = [simhash_fingerprint(item) for item in items]
+    parents = list(range(len(items)))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    first_by_fingerprint: dict[int, int] = {}
+    buckets: dict[tuple[int, int], list[tuple[int, int]]] = {}
+    for index, fingerprint in enumerate(fingerprints):
+        if fingerprint is None:
+            continue
+        if fingerprint in first_by_fingerprint:
+            # Identical fingerprints join directly and stay out of the buckets, which keeps them small.
+            parents[find(index)] = find(first_by_fingerprint[fingerprint])
+            continue
+        first_by_fingerprint[fingerprint] = index
+        for band in range(NEAR_DUPLICATE_BANDS):
+            bucket = buckets.setdefault((band, fingerprint >> (band * band_bits) & band_mask), [])
+            for other, other_fingerprint in bucket:
+                if find(index) == find(other):
+                    continue
+                if (fingerprint ^ other_fingerprint).bit_count() <= NEAR_DUPLICATE_MAX_DISTANCE:
+                    parents[find(index)] = find(other)
+            bucket.append((index, fingerprint))
+
+    grouped: dict[int, list[int]] = {}
+    for index in range(len(items)):
+        grouped.setdefault(find(index), []).append(index)
+    return [members for members in grouped.values() if len(members) > 1]
+
+
+def merge_radar_item(existing: RadarItem, item: RadarItem) -> None:
+    existing.score = max(existing.score, item.score)
+    existing.engagement += item.engagement
+    if item.source not in existing.also_seen_in and item.source != existing.source:
+        existing.also_seen_in.append(item.source)
+    if not existing.summary and item.summary:
+        existing.summary = item.summary
+    if not existing.published_at and item.published_at:
+        existing.published_at = item.published_at
+
+
 def dedupe_and_rank(
     items: list[RadarItem],
     topics: list[str],
     days: int,
     reference_dt: datetime | None = None,
+    *,
+    score_backend: str = "auto",
 ) -> list[RadarItem]:
+    """Score, merge, and rank items.
+
+    Merges go into copies, so the given items keep their own engagement and
+    merge members and ranking them again gives the same result.
+    """
     merged: dict[str, RadarItem] = {}
     seen_sources: dict[str, set[str]] = {}
+    score_items(items, topics, days, reference_dt, backend=score_backend)
     for item in items:
-        compute_score(item, topics, days, reference_dt)
         key = canonical_key(item)
         if key not in merged:
-            merged[key] = item
+            merged[key] = replace(item, also_seen_in=list(item.also_seen_in), merged_from=list(item.merged_from))
             seen_sources[key] = {item.source}
             continue
-        existing = merged[key]
         seen_sources[key].add(item.source)
-        existing.score = max(existing.score, item.score)
-        existing.engagement += item.engagement
-        if item.source not in existing.also_seen_in and item.source != existing.source:
-            existing.also_seen_in.append(item.source)
-        if not existing.summary and item.summary:
-            existing.summary = item.summary
-        if not existing.published_at and item.published_at:
-            existing.published_at = item.published_at
+        merge_radar_item(merged[key], item)
+
+    keys = list(merged)
+    for group in near_duplicate_groups([merged[key] for key in keys]):
+        member_keys = [keys[index] for index in group]
+        primary_key = max(member_keys, key=lambda key: merged[key].score)
+        primary = merged[primary_key]
+        for key in member_keys:
+            if key == primary_key:
+                continue
+            duplicate = merged.pop(key)
+            merge_radar_item(primary, duplicate)
+            seen_sources[primary_key].update(seen_sources.pop(key))
+            primary.merged_from.append({"source": duplicate.source, "title": duplicate.title, "url": duplicate.url})
+
     for key, item in merged.items():
         item.cross_source_count = len(seen_sources[key])
         if item.cross_source_count > 1:
@@ -669,20 +880,69 @@ def http_error_record(
     return record
 
 
-def load_json_path(path_value: str, errors: list[dict[str, Any]], source: str, source_detail: str) -> Any | None:
-    try:
-        if path_value == "-":
-            text = sys.stdin.read()
-        else:
-            text = Path(path_value).read_text(encoding="utf-8")
-        return json.loads(text)
-    except FileNotFoundError:
-        errors.append({"source": source, "sourceDetail": source_detail, "error": "json_file_not_found", "path": path_value})
-    except PermissionError:
-        errors.append({"source": source, "sourceDetail": source_detail, "error": "json_file_permission_denied", "path": path_value})
-    except json.JSONDecodeError as exc:
-        errors.append({"source": source, "sourceDetail": source_detail, "error": f"invalid_json:{exc}", "path": path_value})
-    return None
+def open_json_path(path_value: str) -> contextlib.AbstractContextManager[TextIO]:
+    if path_value == "-":
+        return contextlib.nullcontext(sys.stdin)
+    return open(path_value, encoding="utf-8")
+
+
+class JsonStreamReader:
+    """Decode a JSON text stream one value at a time without loading the whole document."""
+
+    def __init__(self, stream: TextIO, chunk_size: int = JSON_STREAM_CHUNK_SIZE) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self, min_size: int = 0) -> bool:
+        if self.eof:
+            return False
+        if self.pos:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        chunk = self.stream.read(max(self.chunk_size, min_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def take(self, expected: str) -> None:
+        if self.peek() != expected:
+            raise json.JSONDecodeError(f"Expecting {expected!r} delimiter", self.buffer, self.pos)
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        if self.peek() in JSON_NUMBER_START:
+            # raw_decode happily returns a prefix such as "1" from a chunk ending in "1e"; read past the token first.
+            token = JSON_NUMBER_TOKEN.match(self.buffer, self.pos)
+            while token is not None and token.end() == len(self.buffer) and self.fill():
+                token = JSON_NUMBER_TOKEN.match(self.buffer, self.pos)
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Grow reads geometrically so one large value is not re-decoded once per chunk.
+                if self.fill(len(self.buffer)):
+                    continue
+                raise
+            # A scalar that ends exactly at the buffer edge may continue in the next chunk.
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
 
 
 def maybe_parse_json_text(value: Any) -> Any | None:
@@ -721,64 +981,129 @@ def infer_polymarket_kind(record: dict[str, Any], default_kind: str) -> str:
     return default_kind
 
 
+def polymarket_child_kind(key: str, default_kind: str) -> str:
+    kind = POLYMARKET_MCP_CHILD_KINDS[key]
+    return kind or default_kind
+
+
 def iter_polymarket_mcp_records(
     payload: Any,
     *,
     default_kind: str = "mcp",
     source_detail: str = POLYMARKET_MCP_SOURCE_DETAIL,
-) -> list[tuple[str, str, dict[str, Any]]]:
+) -> Iterator[tuple[str, str, dict[str, Any]]]:
     parsed_text = maybe_parse_json_text(payload)
     if parsed_text is not None:
-        return iter_polymarket_mcp_records(parsed_text, default_kind=default_kind, source_detail=source_detail)
+        yield from iter_polymarket_mcp_records(parsed_text, default_kind=default_kind, source_detail=source_detail)
+        return
 
-    records: list[tuple[str, str, dict[str, Any]]] = []
     if isinstance(payload, list):
         for item in payload:
-            records.extend(iter_polymarket_mcp_records(item, default_kind=default_kind, source_detail=source_detail))
-        return records
+            yield from iter_polymarket_mcp_records(item, default_kind=default_kind, source_detail=source_detail)
+        return
 
     if not isinstance(payload, dict):
-        return records
+        return
 
     for text_key in ("result", "text"):
         parsed = maybe_parse_json_text(payload.get(text_key))
         if parsed is not None:
-            records.extend(iter_polymarket_mcp_records(parsed, default_kind=default_kind, source_detail=source_detail))
+            yield from iter_polymarket_mcp_records(parsed, default_kind=default_kind, source_detail=source_detail)
 
     if isinstance(payload.get("content"), list):
-        records.extend(
-            iter_polymarket_mcp_records(
-                payload["content"],
-                default_kind=default_kind,
-                source_detail=source_detail,
-            )
+        yield from iter_polymarket_mcp_records(
+            payload["content"],
+            default_kind=default_kind,
+            source_detail=source_detail,
         )
 
-    keyed_children = {
-        "events": "events",
-        "eventResults": "events",
-        "gamma_list_events": "events",
-        "markets": "markets",
-        "marketResults": "markets",
-        "gamma_list_markets": "markets",
-        "results": default_kind,
-        "search": "search",
-        "searchResults": "search",
-        "gamma_search_public": "search",
-    }
-    for key, kind in keyed_children.items():
+    for key in POLYMARKET_MCP_CHILD_KINDS:
         if key in payload:
-            records.extend(
-                iter_polymarket_mcp_records(
-                    payload[key],
-                    default_kind=kind,
-                    source_detail=f"{source_detail}/{key}",
-                )
+            yield from iter_polymarket_mcp_records(
+                payload[key],
+                default_kind=polymarket_child_kind(key, default_kind),
+                source_detail=f"{source_detail}/{key}",
             )
 
     if looks_like_polymarket_record(payload):
-        records.append((infer_polymarket_kind(payload, default_kind), source_detail, payload))
-    return records
+        yield (infer_polymarket_kind(payload, default_kind), source_detail, payload)
+
+
+def iter_polymarket_mcp_stream(
+    reader: JsonStreamReader,
+    *,
+    default_kind: str = "mcp",
+    source_detail: str = POLYMARKET_MCP_SOURCE_DETAIL,
+) -> Generator[tuple[str, str, dict[str, Any]], None, None]:
+    """Stream-walk the same shapes as iter_polymarket_mcp_records, in document order.
+
+    Containers under record-bearing keys are walked incrementally, so large
+    events/markets/search arrays never need to be materialized; any other value
+    is decoded whole and stored on the enclosing record, with streamed children
+    left as empty placeholders of the same type.
+    """
+    head = reader.peek()
+    if head == "[":
+        reader.take("[")
+        if reader.peek() == "]":
+            reader.take("]")
+            return
+        while True:
+            yield from iter_polymarket_mcp_stream(reader, default_kind=default_kind, source_detail=source_detail)
+            if reader.peek() != ",":
+                reader.take("]")
+                return
+            reader.take(",")
+
+    if head != "{":
+        yield from iter_polymarket_mcp_records(
+            reader.decode_value(),
+            default_kind=default_kind,
+            source_detail=source_detail,
+        )
+        return
+
+    reader.take("{")
+    record: dict[str, Any] = {}
+    while reader.peek() != "}":
+        if record:
+            reader.take(",")
+        key = reader.decode_value()
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting property name", reader.buffer, reader.pos)
+        reader.take(":")
+        value_head = reader.peek()
+        if key in POLYMARKET_MCP_CHILD_KINDS and value_head in "[{":
+            record[key] = [] if value_head == "[" else {}
+            yield from iter_polymarket_mcp_stream(
+                reader,
+                default_kind=polymarket_child_kind(key, default_kind),
+                source_detail=f"{source_detail}/{key}",
+            )
+        elif key == "content" and value_head == "[":
+            record[key] = []
+            yield from iter_polymarket_mcp_stream(reader, default_kind=default_kind, source_detail=source_detail)
+        else:
+            value = reader.decode_value()
+            record[key] = value
+            if key in POLYMARKET_MCP_CHILD_KINDS:
+                yield from iter_polymarket_mcp_records(
+                    value,
+                    default_kind=polymarket_child_kind(key, default_kind),
+                    source_detail=f"{source_detail}/{key}",
+                )
+            elif key in ("result", "text"):
+                parsed = maybe_parse_json_text(value)
+                if parsed is not None:
+                    yield from iter_polymarket_mcp_records(
+                        parsed,
+                        default_kind=default_kind,
+                        source_detail=source_detail,
+                    )
+    reader.take("}")
+
+    if looks_like_polymarket_record(record):
+        yield (infer_polymarket_kind(record, default_kind), source_detail, record)
 
 
 def polymarket_url(kind: str, record: dict[str, Any]) -> str:
@@ -842,89 +1167,126 @@ def polymarket_record_to_item(kind: str, source_detail: str, record: dict[str, A
 def fetch_polymarket_mcp_json(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
     if not args.polymarket_mcp_json:
         return []
-    payload = load_json_path(args.polymarket_mcp_json, errors, "polymarket", "mcp-json")
-    if payload is None:
-        return []
-    records = iter_polymarket_mcp_records(payload)
+    path_value = args.polymarket_mcp_json
+    error_base = {"source": "polymarket", "sourceDetail": "mcp-json", "path": path_value}
     items: list[RadarItem] = []
     seen: set[tuple[str, str]] = set()
-    for kind, source_detail, record in records:
-        item = polymarket_record_to_item(kind, source_detail, record)
-        if item is None:
-            continue
-        key = (item.url, item.title)
-        if key in seen:
-            continue
-        seen.add(key)
-        items.append(item)
-        if len(items) >= args.limit:
-            break
+    try:
+        with (
+            open_json_path(path_value) as stream,
+            contextlib.closing(iter_polymarket_mcp_stream(JsonStreamReader(stream))) as records,
+        ):
+            for kind, source_detail, record in records:
+                item = polymarket_record_to_item(kind, source_detail, record)
+                if item is None:
+                    continue
+                key = (item.url, item.title)
+                if key in seen:
+                    continue
+                seen.add(key)
+                items.append(item)
+                if len(items) >= args.limit:
+                    break
+    except FileNotFoundError:
+        errors.append({**error_base, "error": "json_file_not_found"})
+        return []
+    except PermissionError:
+        errors.append({**error_base, "error": "json_file_permission_denied"})
+        return []
+    except json.JSONDecodeError as exc:
+        # Records yielded before the malformed region are still usable.
+        errors.append({**error_base, "error": f"invalid_json:{exc}"})
+        return items
     if not items:
-        errors.append(
-            {
-                "source": "polymarket",
-                "sourceDetail": "mcp-json",
-                "error": "mcp_json_no_usable_records",
-                "path": args.polymarket_mcp_json,
-            }
-        )
+        errors.append({**error_base, "error": "mcp_json_no_usable_records"})
     return items
 
 
-def fetch_polymarket_helper(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
+def unsafe_polymarket_env_names() -> list[str]:
+    return [name for name in POLYMARKET_UNSAFE_ENV_NAMES if os.environ.get(name)]
+
+
+def polymarket_ranking_metric(days: int) -> str:
+    if days == 1:
+        return "volume24hr"
+    if days <= 7:
+        return "volume1wk"
+    return "volume1mo"
+
+
+def polymarket_ranking_mode(days: int) -> str:
+    return "native" if days in (1, 7) else "proxy"
+
+
+def polymarket_gamma_results(payload: Any) -> list[dict[str, Any]]:
+    if isinstance(payload, list):
+        results = payload
+    elif isinstance(payload, dict):
+        results = payload.get("data") or payload.get("events") or payload.get("markets") or []
+    else:
+        results = []
+    return [result for result in results if isinstance(result, dict)]
+
+
+def fetch_polymarket_gamma(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
     if args.window_mode == "fixed":
         errors.append(
             {
                 "source": "polymarket",
                 "error": "historical_window_unavailable",
-                "detail": "Polymarket helper rankings are current snapshots, not fixed-window history.",
+                "detail": "Polymarket Gamma rankings are current snapshots, not fixed-window history.",
             }
         )
         return []
-    skill_dir = Path(__file__).resolve().parents[1]
-    script = skill_dir.parent / "polymarket-readonly/scripts/polymarket-readonly.sh"
-    if not script.exists():
-        errors.append({"source": "polymarket", "error": "helper_not_found", "path": str(script)})
-        return []
-    proc = subprocess.run(
-        [str(script), "--report", args.report, "--scope", "both", "--format", "json", "--limit", str(args.limit)],
-        text=True,
-        capture_output=True,
-        timeout=args.timeout + 10,
-    )
-    if proc.returncode == 3:
-        errors.append({"source": "polymarket", "error": "unsafe_trading_credential_environment", "unsafe": True})
-        return []
-    if proc.returncode != 0:
-        errors.append({"source": "polymarket", "error": "helper_failed", "stderr": proc.stderr.strip()})
-        return []
-    try:
-        payload = json.loads(proc.stdout)
-    except json.JSONDecodeError as exc:
-        errors.append({"source": "polymarket", "error": f"invalid_json:{exc}"})
+    unsafe_names = unsafe_polymarket_env_names()
+    if unsafe_names:
+        errors.append(
+            {
+                "source": "polymarket",
+                "error": "unsafe_trading_credential_environment",
+                "env": unsafe_names,
+                "unsafe": True,
+            }
+        )
         return []
-    generated_at = payload.get("generatedAt")
+    window_days = POLYMARKET_REPORT_DAYS.get(args.report, 1)
+    metric = polymarket_ranking_metric(window_days)
+    mode = polymarket_ranking_mode(window_days)
+    generated_at = iso_now()
     items: list[RadarItem] = []
-    sections = payload.get("sections") or {}
     for section_name in ("events", "markets"):
-        section = sections.get(section_name) or {}
-        for result in section.get("results") or []:
-            title = result.get("title") or result.get("question") or result.get("slug") or "Untitled Polymarket signal"
-            ranking_value = as_float(result.get("rankingValue"))
-            metric = section.get("rankingMetric") or payload.get("rankingMetric")
+        params = {
+            "active": "true",
+            "closed": "false",
+            "limit": str(args.limit),
+            "order": metric,
+            "ascending": "false",
+        }
+        url = f"{POLYMARKET_GAMMA_API}/{section_name}?{urllib.parse.urlencode(params)}"
+        payload = get_json(url, args.timeout, errors, "polymarket", args)
+        if payload is None:
+            continue
+        url_path = "market" if section_name == "markets" else "event"
+        for result in polymarket_gamma_results(payload):
+            if section_name == "events":
+                title = result.get("title") or result.get("slug")
+            else:
+                title = result.get("question") or result.get("slug")
+            slug = result.get("slug")
+            ranking_value = as_float(result.get(metric))
             items.append(
                 RadarItem(
                     source="polymarket",
                     source_detail=f"gamma-api/{section_name}",
-                    title=normalize_space(title),
-                    url=result.get("url") or "",
+                    title=normalize_space(title or "Untitled Polymarket signal"),
+                    url=f"https://polymarket.com/{url_path}/{slug}" if slug else "",
                     published_at=generated_at,
                     engagement=ranking_value,
                     reason=f"{metric} ranking value {format_number(ranking_value)}",
                     raw={
-                        "slug": result.get("slug"),
+                        "slug": slug,
                         "rankingMetric": metric,
-                        "rankingMode": section.get("rankingMode") or payload.get("rankingMode"),
+                        "rankingMode": mode,
                     },
                 )
             )
@@ -937,7 +1299,7 @@ def fetch_polymarket(args: argparse.Namespace, errors: list[dict[str, Any]]) ->
         return mcp_items
     if args.polymarket_mcp_json and args.polymarket_fallback == "none":
         return []
-    return fetch_polymarket_helper(args, errors)
+    return fetch_polymarket_gamma(args, errors)
 
 
 def fetch_hn(args: argparse.Namespace, errors: list[dict[str, Any]]) -> list[RadarItem]:
@@ -1551,12 +1913,16 @@ def sample_items() -> list[RadarItem]:
     ]
 
 
+def rank_items(args: argparse.Namespace, items: list[RadarItem]) -> list[RadarItem]:
+    return dedupe_and_rank(items, args.topics, args.days, args.window_reference_dt, score_backend=args.score_backend)
+
+
 def gather(args: argparse.Namespace) -> tuple[list[RadarItem], dict[str, list[RadarItem]], list[dict[str, Any]]]:
     errors: list[dict[str, Any]] = []
     if args.sample:
         items = [item for item in sample_items() if item.source in args.sources]
         sections = group_by_source(items)
-        ranked = dedupe_and_rank(items, args.topics, args.days, args.window_reference_dt)
+        ranked = rank_items(args, items)
         return ranked, sections, errors
 
     fetchers = {
@@ -1589,10 +1955,10 @@ def gather(args: argparse.Namespace) -> tuple[list[RadarItem], dict[str, list[Ra
                 results.append(future.result())
 
     for source, source_items, source_errors in results:
-        sections[source] = dedupe_and_rank(source_items, args.topics, args.days, args.window_reference_dt)
+        sections[source] = rank_items(args, source_items)
         all_items.extend(source_items)
         errors.extend(source_errors)
-    ranked = dedupe_and_rank(all_items, args.topics, args.days, args.window_reference_dt)
+    ranked = rank_items(args, all_items)
     return ranked, sections, errors
 
 
@@ -1616,19 +1982,63 @@ def item_search_text(item: RadarItem) -> str:
     ).lower()
 
 
-def classify_brief_cluster(item: RadarItem) -> str:
-    haystack = item_search_text(item)
-    for cluster_name, keywords in BRIEF_CLUSTERS:
-        if any(keyword in haystack for keyword in keywords):
-            return cluster_name
-    return OTHER_BRIEF_CLUSTER
+class BriefClusterMatcher:
+    """All BRIEF_CLUSTERS keywords compiled into one pattern that reports every matching cluster in a single scan.
+
+    The pattern is tried at every offset through a lookahead and prefers the
+    longest keyword there, so each keyword also carries the clusters of any
+    shorter keyword it contains ("claude code" implies "claude").
+    """
+
+    def __init__(self, clusters: list[tuple[str, tuple[str, ...]]]) -> None:
+        self.cluster_names = [name for name, _ in clusters]
+        keyword_clusters: dict[str, set[int]] = {}
+        for index, (_, keywords) in enumerate(clusters):
+            for keyword in keywords:
+                keyword_clusters.setdefault(keyword.lower(), set()).add(index)
+        self.keyword_clusters = {
+            keyword: frozenset(
+                index
+                for other, indexes in keyword_clusters.items()
+                if other in keyword
+                for index in indexes
+            )
+            for keyword in keyword_clusters
+        }
+        alternation = "|".join(re.escape(keyword) for keyword in sorted(self.keyword_clusters, key=len, reverse=True))
+        self.pattern = re.compile(f"(?=({alternation}))")
+
+    def match(self, text: str) -> tuple[str, ...]:
+        matched: set[int] = set()
+        for found in self.pattern.finditer(text):
+            matched.update(self.keyword_clusters[found.group(1)])
+            if len(matched) == len(self.cluster_names):
+                break
+        return tuple(self.cluster_names[index] for index in sorted(matched))
+
+
+BRIEF_CLUSTER_MATCHER = BriefClusterMatcher(BRIEF_CLUSTERS)
+
+
+def classify_brief_clusters(item: RadarItem, memo: dict[int, tuple[str, ...]] | None = None) -> tuple[str, ...]:
+    if memo is not None and id(item) in memo:
+        return memo[id(item)]
+    clusters = BRIEF_CLUSTER_MATCHER.match(item_search_text(item))
+    if memo is not None:
+        memo[id(item)] = clusters
+    return clusters
+
+
+def classify_brief_cluster(item: RadarItem, memo: dict[int, tuple[str, ...]] | None = None) -> str:
+    clusters = classify_brief_clusters(item, memo)
+    return clusters[0] if clusters else OTHER_BRIEF_CLUSTER
 
 
 def build_brief_clusters(args: argparse.Namespace, ranked: list[RadarItem]) -> list[dict[str, Any]]:
     grouped: dict[str, list[RadarItem]] = {name: [] for name, _ in BRIEF_CLUSTERS}
     grouped[OTHER_BRIEF_CLUSTER] = []
     for item in ranked[: args.limit]:
-        grouped[classify_brief_cluster(item)].append(item)
+        grouped[classify_brief_cluster(item, args.brief_cluster_memo)].append(item)
     clusters: list[dict[str, Any]] = []
     for cluster_name in [name for name, _ in BRIEF_CLUSTERS] + [OTHER_BRIEF_CLUSTER]:
         cluster_items = grouped.get(cluster_name) or []
@@ -1651,6 +2061,19 @@ def cache_metadata(args: argparse.Namespace) -> dict[str, Any]:
     }
 
 
+def merge_groups(items: list[RadarItem]) -> list[dict[str, Any]]:
+    return [
+        {
+            "source": item.source,
+            "title": item.title,
+            "url": item.url,
+            "members": list(item.merged_from),
+        }
+        for item in items
+        if item.merged_from
+    ]
+
+
 def window_metadata(args: argparse.Namespace) -> dict[str, Any]:
     return {
         "mode": args.window_mode,
@@ -1695,11 +2118,9 @@ def render_json(
         },
         "cache": cache_metadata(args),
         "items": [item.to_json() for item in ranked[: args.limit]],
+        "mergeGroups": merge_groups(ranked[: args.limit]),
         "sections": {
-            source: [
-                item.to_json()
-                for item in dedupe_and_rank(items, args.topics, args.days, args.window_reference_dt)[: args.limit]
-            ]
+            source: [item.to_json() for item in rank_items(args, items)[: args.limit]]
             for source, items in sections.items()
         },
         "errors": errors,
@@ -1745,10 +2166,17 @@ def render_markdown(
         if not section_items:
             lines.append("- No matching signals.")
         else:
-            for item in dedupe_and_rank(section_items, args.topics, args.days, args.window_reference_dt)[: args.limit]:
+            for item in rank_items(args, section_items)[: args.limit]:
                 lines.append(render_item_bullet(item))
         lines.append("")
 
+    groups = merge_groups(ranked[: args.limit])
+    if groups:
+        lines.extend(["## Merged Stories", ""])
+        for group in groups:
+            lines.append(render_merge_group_bullet(group))
+        lines.append("")
+
     if errors:
         lines.extend(["## Source Errors", ""])
         for error in errors:
@@ -1814,6 +2242,12 @@ def render_item_bullet(item: RadarItem) -> str:
     return f"- {link} | `{source}` | score: {score}{detail}{seen}"
 
 
+def render_merge_group_bullet(group: dict[str, Any]) -> str:
+    link = f"[{escape_md(group['title'])}]({group['url']})" if group["url"] else escape_md(group["title"])
+    members = "; ".join(f"`{member['source']}` {escape_md(truncate(member['title'], 80))}" for member in group["members"])
+    return f"- {link} | merged: {members}"
+
+
 def escape_md(value: str) -> str:
     return value.replace("[", "\\[").replace("]", "\\]")
 
@@ -1854,13 +2288,13 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--polymarket-mcp-json",
-        help="Path to JSON exported from Polymarket MCP tool results. Used before helper fallback.",
+        help="Path to JSON exported from Polymarket MCP tool results. Used before the read-only Gamma fallback.",
     )
     parser.add_argument(
         "--polymarket-fallback",
         choices=["helper", "none"],
         default="helper",
-        help="Fallback behavior when --polymarket-mcp-json has no usable records.",
+        help="Fallback behavior when --polymarket-mcp-json has no usable records; helper uses the in-process Gamma fetch.",
     )
     parser.add_argument("--report", choices=["daily", "weekly", "monthly"], default="daily", help="Report cadence.")
     parser.add_argument("--days", type=int, help="Window in days. Defaults to report cadence.")
@@ -1887,6 +2321,12 @@ def build_parser() -> argparse.ArgumentParser:
         choices=["auto", "gdelt", "google"],
         help="News provider strategy. Defaults to the preset.",
     )
+    parser.add_argument(
+        "--score-backend",
+        choices=["auto", "python", "numpy"],
+        default="auto",
+        help="Score arithmetic backend. auto uses NumPy for large item sets when it is installed.",
+    )
     parser.add_argument("--refresh", action="store_true", help="Bypass existing cache entries and rewrite them.")
     parser.add_argument("--no-cache", action="store_true", help="Disable public response caching for this run.")
     parser.add_argument("--sample", action="store_true", help="Emit deterministic sample data without network calls.")
@@ -1935,6 +2375,7 @@ def normalize_args(argv: list[str]) -> argparse.Namespace:
     args.cache_ttl_seconds = cache_ttl_minutes * 60
     args.cache_dir = default_cache_dir()
     args.cache_events = []
+    args.brief_cluster_memo = {}
     if args.news_provider is None:
         args.news_provider = str(preset["news_provider"])
     if args.days < 1 or args.days > 31:
@@ -1947,6 +2388,7 @@ def normalize_args(argv: list[str]) -> argparse.Namespace:
         raise UsageError("--jobs must be between 1 and 16")
     if args.cache_ttl_minutes < 0 or args.cache_ttl_minutes > 1440:
         raise UsageError("--cache-ttl-minutes must be between 0 and 1440")
+    resolve_score_backend(args.score_backend, 0)
     return args
 
 
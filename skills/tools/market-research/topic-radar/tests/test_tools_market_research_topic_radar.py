@@ -2,10 +2,18 @@ from __future__ import annotations
 
 import importlib.util
 import json
+import math
+import os
+import random
 import subprocess
 import sys
+import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from types import ModuleType
+from typing import Any
+
+import pytest
 
 from skills._shared.python.skill_testing import assert_entrypoints_exist, assert_skill_contract
 
@@ -309,3 +317,303 @@ def test_tools_market_research_topic_radar_reads_polymarket_mcp_json(tmp_path: P
     assert payload["items"][0]["source"] == "polymarket"
     assert payload["items"][0]["sourceDetail"].startswith("polymarket-mcp")
     assert "MCP" in payload["items"][0]["reason"]
+
+
+def polymarket_gamma_args(module: ModuleType, tmp_path: Path) -> object:
+    args = module.normalize_args(["--sources", "polymarket", "--report", "weekly", "--limit", "2"])
+    args.cache_dir = tmp_path / "cache"
+    return args
+
+
+def test_tools_market_research_topic_radar_polymarket_gamma_fetch_is_in_process(monkeypatch, tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    for name in module.POLYMARKET_UNSAFE_ENV_NAMES:
+        monkeypatch.delenv(name, raising=False)
+    responses = {
+        "events": [{"slug": "ai-lab-release", "title": "Will an AI lab ship a new model?", "volume1wk": 4200}],
+        "markets": {"data": [{"slug": "openai-model", "question": "Will OpenAI ship a model?", "volume1wk": 900}]},
+    }
+    requested: list[str] = []
+
+    def fake_http_get(url: str, timeout: int, headers=None, **kwargs) -> bytes:
+        requested.append(url)
+        section = url.split("?", 1)[0].rsplit("/", 1)[-1]
+        return json.dumps(responses[section]).encode("utf-8")
+
+    monkeypatch.setattr(module, "http_get", fake_http_get)
+    errors: list[dict[str, object]] = []
+    items = module.fetch_polymarket(polymarket_gamma_args(module, tmp_path), errors)
+
+    assert not errors
+    assert all("order=volume1wk" in url for url in requested)
+    assert [item.source_detail for item in items] == ["gamma-api/events", "gamma-api/markets"]
+    assert items[0].url == "https://polymarket.com/event/ai-lab-release"
+    assert items[1].title == "Will OpenAI ship a model?"
+    assert items[1].url == "https://polymarket.com/market/openai-model"
+    assert items[0].engagement == 4200
+    assert items[0].reason == "volume1wk ranking value 4.20K"
+    assert items[0].raw["rankingMode"] == "native"
+
+
+def test_tools_market_research_topic_radar_polymarket_gamma_rejects_unsafe_env(monkeypatch, tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    monkeypatch.setenv("POLYMARKET_PRIVATE_KEY", "do-not-use")
+
+    def fail_http_get(*args, **kwargs) -> bytes:
+        raise AssertionError("Gamma fetch must not run with trading credentials present")
+
+    monkeypatch.setattr(module, "http_get", fail_http_get)
+    errors: list[dict[str, object]] = []
+    items = module.fetch_polymarket(polymarket_gamma_args(module, tmp_path), errors)
+
+    assert items == []
+    assert errors[0]["error"] == "unsafe_trading_credential_environment"
+    assert errors[0]["unsafe"] is True
+
+
+def test_tools_market_research_topic_radar_streams_polymarket_mcp_json_until_limit(tmp_path: Path) -> None:
+    module = load_topic_radar_module()
+    events = [
+        {"slug": f"ai-event-{index}", "title": f"AI event {index}", "volume24hr": index}
+        for index in range(5)
+    ]
+    events.insert(1, dict(events[0]))
+    head = json.dumps({"content": [{"type": "text", "text": json.dumps({"events": events[:2]})}], "events": events})
+    # The tail after the first records is malformed on purpose: the reader must stop before reaching it.
+    mcp_path = tmp_path / "polymarket-mcp.json"
+    mcp_path.write_text(head[:-2] + ", {broken", encoding="utf-8")
+    args = module.normalize_args(["--polymarket-mcp-json", str(mcp_path), "--limit", "3"])
+
+    errors: list[dict[str, object]] = []
+    items = module.fetch_polymarket_mcp_json(args, errors)
+
+    assert not errors
+    assert [item.title for item in items] == ["AI event 0", "AI event 1", "AI event 2"]
+    assert {item.source_detail for item in items} == {"polymarket-mcp/events"}
+
+
+def synthetic_scoring_items(module: ModuleType, count: int) -> list:
+    rng = random.Random(20260519)
+    sources = list(module.SOURCE_WEIGHTS) + ["unknown"]
+    words = ["AI agents", "model release", "NVIDIA", "robotics", "weather", "sports", "inference serving", "LLM"]
+    reference = datetime(2026, 5, 19, tzinfo=UTC)
+    items = []
+    for index in range(count):
+        published = reference - timedelta(seconds=rng.randrange(0, 9 * 24 * 3600))
+        items.append(
+            module.RadarItem(
+                source=rng.choice(sources),
+                title=f"{rng.choice(words)} update {index}",
+                url=f"https://example.com/{index}",
+                published_at=None if index % 17 == 0 else published.isoformat().replace("+00:00", "Z"),
+                summary=rng.choice(words),
+                engagement=rng.choice([0.0, -5.0, rng.random() * 10_000]),
+            )
+        )
+    return items
+
+
+def rank_with_scoring_backends(module: ModuleType, count: int) -> dict[str, list[str]]:
+    rankings: dict[str, list[str]] = {}
+    backends = ["python", "numpy"] if module.numpy is not None else ["python"]
+    for backend in backends:
+        items = synthetic_scoring_items(module, count)
+        module.score_items(items, ["AI agents", "LLM", "robotics"], 7, datetime(2026, 5, 19, tzinfo=UTC), backend=backend)
+        ranked = sorted(items, key=lambda item: item.score, reverse=True)
+        rankings[backend] = [item.url for item in ranked]
+    return rankings
+
+
+def reference_score(module: ModuleType, item: Any, topics: list[str], days: int, reference: datetime) -> float:
+    recency = 0.0
+    published = module.parse_iso_datetime(item.published_at)
+    if published is not None:
+        age_hours = max(0.0, (reference - published).total_seconds() / 3600.0)
+        recency = max(0.0, 8.0 * (1.0 - min(age_hours / max(float(days * 24), 1.0), 1.0)))
+    return (
+        module.SOURCE_WEIGHTS.get(item.source, 10.0)
+        + math.log1p(max(item.engagement, 0.0)) * 2.0
+        + module.interest_match_score(item, topics) * 6.0
+        + recency
+    )
+
+
+def test_tools_market_research_topic_radar_scoring_backends_rank_identically() -> None:
+    module = load_topic_radar_module()
+    reference = datetime(2026, 5, 19, tzinfo=UTC)
+    per_item = synthetic_scoring_items(module, 2_000)
+    for item in per_item:
+        item.score = reference_score(module, item, ["AI agents", "LLM", "robotics"], 7, reference)
+
+    rankings = rank_with_scoring_backends(module, 2_000)
+
+    expected = [item.url for item in sorted(per_item, key=lambda item: item.score, reverse=True)]
+    for ranking in rankings.values():
+        assert ranking == expected
+
+
+def test_tools_market_research_topic_radar_numpy_scoring_matches_python() -> None:
+    module = load_topic_radar_module()
+    if module.numpy is None:
+        pytest.skip("NumPy is not installed")
+    columns = module.build_score_columns(synthetic_scoring_items(module, 2_000), ["AI agents", "LLM", "robotics"])
+    reference_epoch = datetime(2026, 5, 19, tzinfo=UTC).timestamp()
+
+    python_scores = module.score_columns_python(columns, reference_epoch, 7 * 24.0)
+    numpy_scores = module.score_columns_numpy(columns, reference_epoch, 7 * 24.0)
+
+    assert numpy_scores == pytest.approx(python_scores)
+
+
+def test_tools_market_research_topic_radar_numpy_scoring_benchmark() -> None:
+    """Opt-in benchmark: TOPIC_RADAR_BENCH_ITEMS=1000000 times the score arithmetic at scale."""
+    count = int(os.environ.get("TOPIC_RADAR_BENCH_ITEMS", "0"))
+    if count <= 0:
+        pytest.skip("set TOPIC_RADAR_BENCH_ITEMS to run the scoring benchmark")
+    module = load_topic_radar_module()
+    if module.numpy is None:
+        pytest.skip("NumPy is not installed")
+    columns = module.build_score_columns(synthetic_scoring_items(module, count), ["AI agents", "LLM", "robotics"])
+    reference_epoch = datetime(2026, 5, 19, tzinfo=UTC).timestamp()
+
+    started = time.perf_counter()
+    python_scores = module.score_columns_python(columns, reference_epoch, 7 * 24.0)
+    python_elapsed = time.perf_counter() - started
+    started = time.perf_counter()
+    numpy_scores = module.score_columns_numpy(columns, reference_epoch, 7 * 24.0)
+    numpy_elapsed = time.perf_counter() - started
+
+    assert numpy_scores == pytest.approx(python_scores)
+    assert numpy_elapsed < python_elapsed, f"{count} items: python {python_elapsed:.3f}s, numpy {numpy_elapsed:.3f}s"
+
+
+def test_tools_market_research_topic_radar_score_backend_flag_reaches_ranking(monkeypatch) -> None:
+    module = load_topic_radar_module()
+    backends: list[str] = []
+    real_score_items = module.score_items
+
+    def recording_score_items(*args, backend: str = "auto", **kwargs):
+        backends.append(backend)
+        return real_score_items(*args, backend=backend, **kwargs)
+
+    monkeypatch.setattr(module, "score_items", recording_score_items)
+    args = module.normalize_args(["--sample", "--topic", "AI agents", "--score-backend", "python"])
+
+    module.gather(args)
+
+    assert backends
+    assert set(backends) == {"python"}
+
+
+def test_tools_market_research_topic_radar_merges_near_duplicate_stories() -> None:
+    module = load_topic_radar_module()
+    items = [
+        module.RadarItem(
+            source="official",
+            title="Introducing GPT-6: our most capable agent model",
+            url="https://openai.com/news/gpt-6",
+        ),
+        module.RadarItem(
+            source="news",
+            title="Introducing GPT-6: our most capable agent model - The Verge",
+            url="https://news.google.com/rss/articles/abc123",
+        ),
+        module.RadarItem(
+            source="hn",
+            title="Introducing GPT-6: Our most capable agent model",
+            url="https://openai.com/index/gpt-6-launch",
+        ),
+        module.RadarItem(
+            source="hn",
+            title="Introducing GPT-6 mini for cheap inference workloads",
+            url="https://example.com/gpt-6-mini",
+        ),
+    ]
+
+    ranked = module.dedupe_and_rank(items, ["AI agents"], 1)
+
+    assert len(ranked) == 2
+    merged = next(item for item in ranked if item.merged_from)
+    assert merged.source == "official"
+    assert merged.cross_source_count == 3
+    assert sorted(member["source"] for member in merged.merged_from) == ["hn", "news"]
+    assert module.merge_groups(ranked)[0]["members"] == merged.merged_from
+
+
+def test_tools_market_research_topic_radar_dedupe_and_rank_leaves_inputs_unmerged() -> None:
+    module = load_topic_radar_module()
+    items = [
+        module.RadarItem(source="official", title="GPT-6 launch", url="https://openai.com/news/gpt-6", engagement=10),
+        module.RadarItem(source="hn", title="GPT-6 launch", url="https://openai.com/news/gpt-6/", engagement=90),
+        module.RadarItem(
+            source="official",
+            title="Introducing GPT-6: our most capable agent model",
+            url="https://openai.com/index/gpt-6-launch",
+        ),
+        module.RadarItem(
+            source="news",
+            title="Introducing GPT-6: our most capable agent model - The Verge",
+            url="https://news.google.com/rss/articles/abc123",
+        ),
+    ]
+    reference = datetime(2026, 5, 19, tzinfo=UTC)
+
+    first = [item.to_json() for item in module.dedupe_and_rank(items, ["AI agents"], 1, reference)]
+    second = [item.to_json() for item in module.dedupe_and_rank(items, ["AI agents"], 1, reference)]
+
+    assert first == second
+    assert [item.engagement for item in items] == [10, 90, 0, 0]
+    assert all(not item.merged_from and not item.also_seen_in for item in items)
+    assert any(entry["mergedFrom"] for entry in first)
+
+
+def test_tools_market_research_topic_radar_markdown_keeps_cross_source_merge_groups() -> None:
+    module = load_topic_radar_module()
+    items = [
+        module.RadarItem(
+            source="official",
+            title="Introducing GPT-6: our most capable agent model",
+            url="https://openai.com/news/gpt-6",
+        ),
+        module.RadarItem(
+            source="official",
+            title="Introducing GPT-6: Our most capable agent model",
+            url="https://openai.com/index/gpt-6-launch",
+        ),
+        module.RadarItem(
+            source="news",
+            title="Introducing GPT-6: our most capable agent model - The Verge",
+            url="https://news.google.com/rss/articles/abc123",
+        ),
+    ]
+    args = module.normalize_args(["--sources", "official,news", "--topic", "AI agents", "--limit", "5"])
+    ranked = module.dedupe_and_rank(items, args.topics, args.days, args.window_reference_dt)
+
+    markdown = module.render_markdown(args, ranked, module.group_by_source(items), [])
+
+    merged_section = markdown.split("## Merged Stories", 1)[1].split("## Notes", 1)[0]
+    assert "`news` Introducing GPT-6" in merged_section
+    assert "`official` Introducing GPT-6" in merged_section
+
+
+def test_tools_market_research_topic_radar_brief_matcher_returns_all_clusters_once() -> None:
+    module = load_topic_radar_module()
+    item = module.RadarItem(
+        source="hn",
+        title="Claude Code adds sandbox controls for enterprise rollout",
+        url="https://example.com/claude-code",
+    )
+    memo: dict[int, tuple[str, ...]] = {}
+
+    clusters = module.classify_brief_clusters(item, memo)
+
+    assert clusters == (
+        "Model And Product Releases",
+        "Agents And Developer Tools",
+        "Enterprise Adoption",
+        "Security Safety And Governance",
+    )
+    assert module.classify_brief_cluster(item, memo) == "Model And Product Releases"
+    item.title = "Unrelated"
+    assert module.classify_brief_clusters(item, memo) == clusters
+    assert module.classify_brief_cluster(module.RadarItem(source="hn", title="Weather", url="")) == "Other Signals"
@@ -0,0 +1,766 @@
+#!/usr/bin/env python3
+"""Adaptive CI check waiter shared by deliver-github-pr and deliver-gitlab-mr.
+
+One poll loop serves both providers. The interval follows what CI is doing:
+short while checks are queued or starting, backing off while jobs run, and
+the wait ends as soon as a required check fails. Every poll prints the
+provider status line (`CHECK_STATUS=` or `PIPELINE_STATUS=`) and a
+`WAIT_PROGRESS=` JSON record; the wait ends with a `WAIT_SUMMARY=` record
+that counts the CLI API calls spent.
+
+Several PRs (or MRs) can be watched by one process: each poll round is one
+GraphQL query per repository, whatever the number of targets, and a
+`WAIT_DONE=` record is printed as each target finishes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_MAX_POLL_SECONDS = 60
+DEFAULT_MAX_WAIT_SECONDS = 7200
+STARTING_POLL_SECONDS = 5.0
+RUNNING_POLL_SECONDS = 15.0
+RUNNING_BACKOFF_FACTOR = 1.5
+TIMEOUT_EXIT_CODE = 124
+
+GITHUB_FAILED_BUCKETS = {"fail", "cancel"}
+GITHUB_PENDING_BUCKETS = {"pending", "skipping"}
+GITHUB_FAILED_STATES = {
+    "fail",
+    "failed",
+    "cancel",
+    "cancelled",
+    "timed_out",
+    "action_required",
+    "startup_failure",
+    "blocked",
+    "skipped",
+}
+GITHUB_PENDING_STATES = {"pending", "queued", "waiting", "in_progress", "requested", "expected"}
+GITHUB_PASS_STATES = {"pass", "passed", "success", "successful", "completed"}
+GITHUB_STATUS_CODES = {"passed": 0, "missing": 3, "failed": 4, "unknown": 4, "pending": 5}
+GITHUB_MISSING_RE = re.compile(
+    r"no (required )?(checks|check runs|status checks|check suites)|checks? (have|has) not been reported"
+    r"|no checks reported|no check runs found|no status checks found",
+    re.IGNORECASE,
+)
+GITHUB_FAILED_RE = re.compile(
+    r"(^|\s)(fail|failed|cancel|cancelled|timed_out|timed out|action_required|startup_failure|blocked|skipped)(\s|$)",
+    re.IGNORECASE | re.MULTILINE,
+)
+GITHUB_PENDING_RE = re.compile(
+    r"(^|\s)(pending|queued|waiting|in_progress|in progress|requested|expected)(\s|$)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+GITHUB_PR_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+# `gh pr checks` buckets, keyed by CheckRun conclusion/status or StatusContext state.
+GITHUB_ROLLUP_BUCKETS = {
+    "success": "pass",
+    "skipped": "skipping",
+    "neutral": "skipping",
+    "error": "fail",
+    "failure": "fail",
+    "timed_out": "fail",
+    "action_required": "fail",
+    "cancelled": "cancel",
+}
+GITHUB_PR_FIELDS = """
+    {alias}: pullRequest(number: {number}) {{
+      commits(last: 1) {{
+        nodes {{
+          commit {{
+            statusCheckRollup {{
+              contexts(first: 100) {{
+                pageInfo {{ hasNextPage }}
+                nodes {{
+                  __typename
+                  ... on CheckRun {{ name status conclusion isRequired(pullRequestNumber: {number}) }}
+                  ... on StatusContext {{ context state isRequired(pullRequestNumber: {number}) }}
+                }}
+              }}
+            }}
+          }}
+        }}
+      }}
+    }}"""
+
+GITHUB_PRS_QUERY = """
+query($owner: String!, $name: String!) {{
+  repository(owner: $owner, name: $name) {{{fields}
+  }}
+}}"""
+
+GITLAB_MR_URL_RE = re.compile(r"https?://[^/]+/(.+?)/-/merge_requests/(\d+)")
+GITLAB_MR_QUERY = """
+query {{
+  project(fullPath: {project}) {{
+    mergeRequests(iids: {iids}) {{
+      nodes {{
+        iid
+        sourceBranch
+        headPipeline {{
+          status
+          jobs(first: 100) {{ nodes {{ name status allowFailure }} }}
+        }}
+      }}
+    }}
+  }}
+}}"""
+GITLAB_STATUS_KEYS = (
+    "pipeline.status",
+    "pipeline.detailed_status.group",
+    "pipeline.detailedStatus.group",
+    "status",
+    "detailed_status.group",
+    "detailedStatus.group",
+)
+GITLAB_PASSED = {"success", "succeeded", "passed", "pass"}
+GITLAB_BLOCKED = {"skipped", "manual", "blocked", "action_required"}
+GITLAB_FAILED = {"failed", "fail", "canceled", "cancelled"}
+GITLAB_STARTING = {"pending", "created", "preparing", "waiting_for_resource", "scheduled"}
+GITLAB_RUNNING = {"running"}
+
+
+@dataclass(frozen=True)
+class Poll:
+    """One observation of CI state.
+
+    `status` is printed on the provider status line, `phase` (`starting`,
+    `running`, or `done`) drives the poll interval, and `code` is the exit
+    code the wait returns if this poll ends it.
+    """
+
+    status: str
+    phase: str
+    code: int
+    failed_jobs: tuple[str, ...] = ()
+
+
+class CliRunner:
+    """Run provider CLI commands and count them as API calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, args: Sequence[str]) -> tuple[int, str, str]:
+        self.calls += 1
+        try:
+            completed = subprocess.run(list(args), text=True, capture_output=True, check=False)
+        except OSError as exc:
+            return 127, "", str(exc)
+        return completed.returncode, completed.stdout, completed.stderr
+
+
+Runner = Callable[[Sequence[str]], tuple[int, str, str]]
+
+
+class GitHubChecks:
+    name = "github"
+    status_key = "CHECK_STATUS"
+
+    def __init__(self, pr: str, allow_missing: bool, runner: Runner, repo: str | None = None) -> None:
+        self.pr = pr
+        self.repo = repo
+        self.allow_missing = allow_missing
+        self.runner = runner
+
+    @property
+    def label(self) -> str:
+        return f"{self.repo or ''}#{self.pr}"
+
+    def poll(self) -> Poll:
+        poll = self._poll(required=True)
+        if poll.status == "missing":
+            # Repos without branch protection report no required checks;
+            # fall back to every check on the PR.
+            poll = self._poll(required=False)
+        return poll
+
+    def _poll(self, *, required: bool) -> Poll:
+        args = ["gh", "pr", "checks", self.pr, *(["--required"] if required else []), "--json", "name,state,bucket"]
+        if self.repo:
+            args += ["--repo", self.repo]
+        code, stdout, stderr = self.runner(args)
+        # `gh pr checks` exits 8 while checks are pending.
+        if code in (0, 8):
+            poll = classify_github_checks(stdout)
+            if poll is not None:
+                return poll
+        return classify_github_text(f"{stdout}\n{stderr}")
+
+    def verdict(self, poll: Poll) -> int | None:
+        if poll.status == "passed":
+            print(f"ok: required GitHub checks passed for PR {self.label}")
+            return 0
+        if poll.status == "missing":
+            if self.allow_missing:
+                print(f"ok: no GitHub checks found for PR {self.label}; accepted by --allow-no-checks")
+                return 0
+            print(
+                f"error: no GitHub checks found for PR {self.label}; "
+                "use --allow-no-checks only after confirming this repo has no CI",
+                file=sys.stderr,
+            )
+            return 1
+        if poll.status == "failed":
+            print(f"error: GitHub checks are not mergeable for PR {self.label}", file=sys.stderr)
+            return 1
+        if poll.phase == "done":
+            return poll.code
+        return None
+
+    def timeout_message(self, elapsed: int, limit: int) -> str:
+        return f"error: timed out waiting for GitHub checks (elapsed={elapsed}s, limit={limit}s)"
+
+
+def classify_github_checks(payload: str) -> Poll | None:
+    """Classify `gh pr checks --json name,state,bucket` output; None if not JSON."""
+    try:
+        checks = json.loads(payload)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(checks, list):
+        return None
+    return classify_github_check_list(checks)
+
+
+def classify_github_check_list(checks: list[Any]) -> Poll:
+    if not checks:
+        return github_poll("missing")
+
+    # A failed check ends the wait even while others are still pending.
+    starting = running = unknown = 0
+    for check in checks:
+        if not isinstance(check, dict):
+            return github_poll("unknown")
+        bucket = str(check.get("bucket", "")).lower()
+        state = str(check.get("state", "")).lower()
+        if bucket in GITHUB_FAILED_BUCKETS or state in GITHUB_FAILED_STATES:
+            return github_poll("failed")
+        if bucket in GITHUB_PENDING_BUCKETS or state in GITHUB_PENDING_STATES:
+            if state == "in_progress":
+                running += 1
+            else:
+                starting += 1
+        elif bucket != "pass" and state not in GITHUB_PASS_STATES:
+            unknown += 1
+    if unknown:
+        return github_poll("unknown")
+    if starting:
+        return github_poll("pending", "starting")
+    if running:
+        return github_poll("pending", "running")
+    return github_poll("passed")
+
+
+def classify_github_text(output: str) -> Poll:
+    if GITHUB_MISSING_RE.search(output):
+        return github_poll("missing")
+    if GITHUB_FAILED_RE.search(output):
+        return github_poll("failed")
+    if GITHUB_PENDING_RE.search(output):
+        return github_poll("pending", "starting")
+    return github_poll("unknown")
+
+
+def github_poll(status: str, phase: str = "done") -> Poll:
+    return Poll(status, phase, GITHUB_STATUS_CODES[status])
+
+
+class GitLabPipeline:
+    name = "gitlab"
+    status_key = "PIPELINE_STATUS"
+
+    def __init__(
+        self,
+        branch: str,
+        allow_missing: bool,
+        runner: Runner,
+        mr: str | None = None,
+        project: str | None = None,
+    ) -> None:
+        self.branch = branch
+        self.mr = mr
+        self.project = project
+        self.allow_missing = allow_missing
+        self.runner = runner
+
+    @property
+    def label(self) -> str:
+        return f"{self.project or ''}!{self.mr}" if self.mr else self.branch
+
+    def poll(self) -> Poll:
+        code, stdout, stderr = self.runner(["glab", "ci", "status", "--branch", self.branch, "--output", "json"])
+        output = "\n".join(part for part in (stdout.strip(), stderr.strip()) if part)
+        if code != 0:
+            print(output, file=sys.stderr)
+            if "no pipeline found" in output.lower():
+                return Poll("missing", "done", 3)
+            return Poll("", "done", code)
+        try:
+            data = json.loads(stdout)
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, list):
+            data = data[0] if data else {}
+        status = next((value for key in GITLAB_STATUS_KEYS if (value := lookup(data, key)) is not None), None)
+        if status is None or status == "":
+            print(f"error: failed to parse pipeline status for branch {self.branch}", file=sys.stderr)
+            print(output, file=sys.stderr)
+            return Poll("", "done", 1)
+        return gitlab_poll(str(status), failed_gitlab_jobs(data))
+
+    def verdict(self, poll: Poll) -> int | None:
+        branch = self.branch or self.label
+        if poll.status == "missing" and poll.code == 3:
+            if self.allow_missing:
+                print(f"ok: no pipeline found for branch {branch}; accepted by --allow-no-pipeline")
+                return 0
+            print(
+                f"error: no pipeline found for branch {branch}; "
+                "use --allow-no-pipeline only after confirming this repo has no CI",
+                file=sys.stderr,
+            )
+            return 1
+        if poll.code != 0:
+            return poll.code
+        if poll.status in GITLAB_PASSED:
+            print(f"ok: pipeline passed for branch {branch}")
+            return 0
+        if poll.status in GITLAB_BLOCKED:
+            print(
+                f"error: source-branch pipeline is not mergeable for branch {branch} (status={poll.status})",
+                file=sys.stderr,
+            )
+            print(
+                "error: if this repo intentionally uses target-branch CI, verify MR mergeability and target-branch "
+                "validation, then use --skip-pipeline only after explicit user confirmation",
+                file=sys.stderr,
+            )
+            return 1
+        if poll.status in GITLAB_FAILED:
+            print(f"error: pipeline is not mergeable for branch {branch} (status={poll.status})", file=sys.stderr)
+            return 1
+        if poll.failed_jobs:
+            jobs = ", ".join(poll.failed_jobs)
+            print(f"error: pipeline job failed for branch {branch} (jobs={jobs})", file=sys.stderr)
+            return 1
+        if poll.phase in ("starting", "running"):
+            return None
+        print(f"error: unknown pipeline status for branch {branch}: {poll.status}", file=sys.stderr)
+        return 1
+
+    def timeout_message(self, elapsed: int, limit: int) -> str:
+        return f"error: timed out waiting for GitLab pipeline (elapsed={elapsed}s, limit={limit}s)"
+
+
+def lookup(data: Any, key: str) -> Any:
+    for part in key.split("."):
+        if not isinstance(data, dict) or part not in data:
+            return None
+        data = data[part]
+    return data
+
+
+def gitlab_poll(status: str, failed_jobs: tuple[str, ...] = ()) -> Poll:
+    status = status.lower()
+    phase = "starting" if status in GITLAB_STARTING else "running" if status in GITLAB_RUNNING else "done"
+    return Poll(status, phase, 0, failed_jobs)
+
+
+def failed_gitlab_jobs(data: Any) -> tuple[str, ...]:
+    jobs = lookup(data, "jobs")
+    if not isinstance(jobs, list):
+        return ()
+    return tuple(
+        str(job.get("name") or job.get("id") or "?")
+        for job in jobs
+        if isinstance(job, dict)
+        and str(job.get("status", "")).lower() == "failed"
+        and not job.get("allow_failure", job.get("allowFailure", False))
+    )
+
+
+def graphql_data(runner: Runner, args: list[str]) -> dict[str, Any] | None:
+    code, stdout, stderr = runner(args)
+    try:
+        payload = json.loads(stdout) if code == 0 else None
+    except json.JSONDecodeError:
+        payload = None
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(data, dict):
+        print(f"warning: batched status query failed: {(stderr or stdout).strip()[:500]}", file=sys.stderr)
+        return None
+    return data
+
+
+def poll_github_batch(targets: Sequence[GitHubChecks], runner: Runner) -> list[Poll]:
+    """Poll every PR with one `gh api graphql` query per repository.
+
+    PRs the query cannot answer (given by branch name, missing from the
+    response, or with more than 100 check contexts) fall back to their own
+    `gh pr checks` poll.
+    """
+    polls: dict[int, Poll] = {}
+    groups: dict[str | None, list[int]] = {}
+    for index, target in enumerate(targets):
+        if target.pr.isdigit():
+            groups.setdefault(target.repo, []).append(index)
+    for repo, indexes in groups.items():
+        owner, name = repo.split("/", 1) if repo else ("{owner}", "{repo}")
+        numbers = dict.fromkeys(targets[index].pr for index in indexes)
+        fields = "".join(GITHUB_PR_FIELDS.format(alias=f"pr{number}", number=number) for number in numbers)
+        query = GITHUB_PRS_QUERY.format(fields=fields)
+        data = graphql_data(
+            runner, ["gh", "api", "graphql", "-f", f"query={query}", "-F", f"owner={owner}", "-F", f"name={name}"]
+        )
+        repository = lookup(data, "repository")
+        for index in indexes:
+            checks = rollup_checks(lookup(repository, f"pr{targets[index].pr}"))
+            if checks is not None:
+                required = [check for check in checks if check["required"]]
+                polls[index] = classify_github_check_list(required or checks)
+    return [polls[index] if index in polls else target.poll() for index, target in enumerate(targets)]
+
+
+def rollup_checks(pr: Any) -> list[dict[str, Any]] | None:
+    """Checks on a PR's head commit shaped like `gh pr checks --json name,state,bucket`."""
+    commits = lookup(pr, "commits.nodes")
+    if not isinstance(commits, list):
+        return None
+    if not commits:
+        return []
+    contexts = lookup(commits[-1], "commit.statusCheckRollup.contexts")
+    if contexts is None:
+        return []
+    nodes = lookup(contexts, "nodes")
+    if lookup(contexts, "pageInfo.hasNextPage") or not isinstance(nodes, list):
+        return None
+    checks = []
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        if node.get("__typename") == "StatusContext":
+            name, state = node.get("context"), node.get("state")
+        else:
+            status = str(node.get("status") or "")
+            name, state = node.get("name"), node.get("conclusion") if status == "COMPLETED" else status
+        state = str(state or "").lower()
+        checks.append(
+            {
+                "name": name,
+                "state": state,
+                "bucket": GITHUB_ROLLUP_BUCKETS.get(state, "pending"),
+                "required": bool(node.get("isRequired")),
+            }
+        )
+    return checks
+
+
+def poll_gitlab_batch(targets: Sequence[GitLabPipeline], runner: Runner) -> list[Poll]:
+    """Poll every MR with one `glab api graphql` query per project."""
+    polls: dict[int, Poll] = {}
+    groups: dict[str | None, list[int]] = {}
+    for index, target in enumerate(targets):
+        groups.setdefault(target.project, []).append(index)
+    for project, indexes in groups.items():
+        iids = [str(targets[index].mr) for index in indexes]
+        query = GITLAB_MR_QUERY.format(project=json.dumps(project), iids=json.dumps(iids))
+        data = graphql_data(runner, ["glab", "api", "graphql", "-f", f"query={query}"])
+        nodes = lookup(data, "project.mergeRequests.nodes")
+        merge_requests = {str(node.get("iid")): node for node in nodes or [] if isinstance(node, dict)}
+        for index in indexes:
+            target = targets[index]
+            polls[index] = gitlab_mr_poll(target, merge_requests.get(str(target.mr)), data is not None)
+    return [polls[index] for index in range(len(targets))]
+
+
+def gitlab_mr_poll(target: GitLabPipeline, merge_request: dict[str, Any] | None, answered: bool) -> Poll:
+    if merge_request is None:
+        if answered:
+            print(f"error: merge request {target.label} not found", file=sys.stderr)
+            return Poll("", "done", 1)
+        # The query itself failed; keep polling until the deadline.
+        return Poll("", "starting", 0)
+    target.branch = str(merge_request.get("sourceBranch") or target.branch)
+    pipeline = merge_request.get("headPipeline")
+    if not isinstance(pipeline, dict):
+        print(f"No pipeline found for merge request {target.label}", file=sys.stderr)
+        return Poll("missing", "done", 3)
+    jobs = lookup(pipeline, "jobs.nodes")
+    return gitlab_poll(str(pipeline.get("status") or ""), failed_gitlab_jobs({"jobs": jobs}))
+
+
+def current_gitlab_project(runner: Runner) -> str | None:
+    code, stdout, _ = runner(["glab", "repo", "view", "--output", "json"])
+    try:
+        data = json.loads(stdout) if code == 0 else None
+    except json.JSONDecodeError:
+        data = None
+    project = lookup(data, "path_with_namespace") or lookup(data, "fullPath")
+    return str(project) if project else None
+
+
+class PollSchedule:
+    """Poll interval that follows the CI phase, capped at `ceiling` seconds."""
+
+    def __init__(self, ceiling: float) -> None:
+        self.ceiling = ceiling
+        self.interval = 0.0
+        self.phase = ""
+
+    def next(self, phase: str) -> float:
+        if phase == "starting":
+            self.interval = STARTING_POLL_SECONDS
+        elif phase != "running":
+            # A poll that settled nothing (e.g. a transient `unknown`) keeps
+            # the current interval instead of restarting the running back-off.
+            self.interval = self.interval or RUNNING_POLL_SECONDS
+            return min(self.interval, self.ceiling)
+        elif self.phase != "running":
+            self.interval = RUNNING_POLL_SECONDS
+        else:
+            self.interval *= RUNNING_BACKOFF_FACTOR
+        self.phase = phase
+        self.interval = min(self.interval, self.ceiling)
+        return self.interval
+
+
+def emit_record(key: str, record: dict[str, Any]) -> None:
+    print(f"{key}={json.dumps(record, sort_keys=True)}", flush=True)
+
+
+def wait(
+    provider: GitHubChecks | GitLabPipeline,
+    runner: CliRunner,
+    max_poll_seconds: int,
+    max_wait_seconds: int,
+) -> int:
+    schedule = PollSchedule(max_poll_seconds)
+    started = time.monotonic()
+    polls = 0
+    result = "timeout"
+    exit_code = TIMEOUT_EXIT_CODE
+    poll = Poll("", "done", 0)
+    while True:
+        polls += 1
+        poll = provider.poll()
+        print(f"{provider.status_key}={poll.status}", flush=True)
+        elapsed = time.monotonic() - started
+        verdict = provider.verdict(poll)
+        remaining = max_wait_seconds - elapsed
+        next_poll = None if verdict is not None or remaining <= 0 else min(schedule.next(poll.phase), remaining)
+        emit_record(
+            "WAIT_PROGRESS",
+            {
+                "poll": polls,
+                "status": poll.status,
+                "phase": poll.phase,
+                "elapsed_seconds": round(elapsed, 1),
+                "next_poll_seconds": None if next_poll is None else round(next_poll, 1),
+                "api_calls": runner.calls,
+            },
+        )
+        if verdict is not None:
+            exit_code = verdict
+            result = "passed" if verdict == 0 else "failed"
+            break
+        if next_poll is None:
+            print(provider.timeout_message(int(elapsed), max_wait_seconds), file=sys.stderr)
+            break
+        time.sleep(next_poll)
+
+    emit_record(
+        "WAIT_SUMMARY",
+        {
+            "provider": provider.name,
+            "result": result,
+            "status": poll.status,
+            "polls": polls,
+            "api_calls": runner.calls,
+            "elapsed_seconds": round(time.monotonic() - started, 1),
+        },
+    )
+    return exit_code
+
+
+def wait_many(
+    targets: Sequence[GitHubChecks] | Sequence[GitLabPipeline],
+    poll_batch: Callable[[Any, Runner], list[Poll]],
+    runner: CliRunner,
+    max_poll_seconds: int,
+    max_wait_seconds: int,
+) -> int:
+    """Wait for several PRs or MRs in one loop; each round costs one query per repository."""
+    schedule = PollSchedule(max_poll_seconds)
+    started = time.monotonic()
+    polls = 0
+    pending = list(targets)
+    results: dict[str, str] = {}
+    codes: list[int] = []
+    while True:
+        polls += 1
+        waiting: dict[str, Poll] = {}
+        for target, poll in zip(pending, poll_batch(pending, runner)):
+            verdict = target.verdict(poll)
+            if verdict is None:
+                waiting[target.label] = poll
+                continue
+            results[target.label] = "passed" if verdict == 0 else "failed"
+            codes.append(verdict)
+            emit_record(
+                "WAIT_DONE",
+                {
+                    "target": target.label,
+                    "status": poll.status,
+                    "result": results[target.label],
+                    "exit_code": verdict,
+                    "poll": polls,
+                    "elapsed_seconds": round(time.monotonic() - started, 1),
+                },
+            )
+        pending = [target for target in pending if target.label in waiting]
+        elapsed = time.monotonic() - started
+        remaining = max_wait_seconds - elapsed
+        # One schedule for the whole batch, driven by its most active target.
+        phase = "starting" if any(poll.phase == "starting" for poll in waiting.values()) else "running"
+        next_poll = min(schedule.next(phase), remaining) if pending and remaining > 0 else None
+        emit_record(
+            "WAIT_PROGRESS",
+            {
+                "poll": polls,
+                "pending": {label: poll.status for label, poll in waiting.items()},
+                "phase": phase if pending else "done",
+                "elapsed_seconds": round(elapsed, 1),
+                "next_poll_seconds": None if next_poll is None else round(next_poll, 1),
+                "api_calls": runner.calls,
+            },
+        )
+        if next_poll is None:
+            break
+        time.sleep(next_poll)
+
+    for target in pending:
+        results[target.label] = "timeout"
+    if pending:
+        print(targets[0].timeout_message(int(elapsed), max_wait_seconds), file=sys.stderr)
+    failures = [code for code in codes if code != 0]
+    exit_code = failures[0] if failures else TIMEOUT_EXIT_CODE if pending else 0
+    emit_record(
+        "WAIT_SUMMARY",
+        {
+            "provider": targets[0].name,
+            "result": "failed" if failures else "timeout" if pending else "passed",
+            "targets": results,
+            "polls": polls,
+            "api_calls": runner.calls,
+            "elapsed_seconds": round(time.monotonic() - started, 1),
+        },
+    )
+    return exit_code
+
+
+def github_target(value: str, repo: str | None, allow_missing: bool, runner: Runner) -> GitHubChecks:
+    match = GITHUB_PR_URL_RE.search(value)
+    if match:
+        owner, name, number = match.groups()
+        return GitHubChecks(number, allow_missing, runner, repo=f"{owner}/{name}")
+    return GitHubChecks(value, allow_missing, runner, repo=repo)
+
+
+def gitlab_target(value: str, project: str | None, allow_missing: bool, runner: Runner) -> GitLabPipeline:
+    match = GITLAB_MR_URL_RE.search(value)
+    if match:
+        return GitLabPipeline("", allow_missing, runner, mr=match.group(2), project=match.group(1))
+    return GitLabPipeline("", allow_missing, runner, mr=value.lstrip("!"), project=project)
+
+
+def positive_int(raw: str) -> int:
+    try:
+        value = int(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {raw}") from None
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be > 0: {raw}")
+    return value
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Wait for GitHub PR checks or a GitLab branch pipeline.")
+    parser.add_argument("provider", choices=("github", "gitlab"))
+    parser.add_argument(
+        "--pr",
+        action="append",
+        default=[],
+        help="GitHub PR number or URL (github); repeat to watch several PRs in one process.",
+    )
+    parser.add_argument("--branch", help="GitLab source branch (gitlab).")
+    parser.add_argument(
+        "--mr",
+        action="append",
+        default=[],
+        help="GitLab MR IID or URL (gitlab); repeatable, watched with one query per project.",
+    )
+    parser.add_argument("--repo", help="GitHub OWNER/REPO or GitLab project path for bare PR/MR numbers.")
+    parser.add_argument("--allow-missing", action="store_true", help="Accept an absent checks suite or pipeline.")
+    parser.add_argument(
+        "--poll-seconds",
+        type=positive_int,
+        default=DEFAULT_MAX_POLL_SECONDS,
+        help="Longest interval between polls; polls are shorter while checks are starting.",
+    )
+    parser.add_argument("--max-wait-seconds", type=positive_int, default=DEFAULT_MAX_WAIT_SECONDS)
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Poll one GitHub PR once, print its check status, and exit with the status code (github).",
+    )
+    args = parser.parse_args(argv)
+
+    runner = CliRunner()
+    provider: GitHubChecks | GitLabPipeline
+    if args.provider == "github":
+        if not args.pr:
+            parser.error("github requires --pr")
+        prs = [github_target(pr, args.repo, args.allow_missing, runner) for pr in dict.fromkeys(args.pr)]
+        if args.once:
+            if len(prs) > 1:
+                parser.error("--once takes a single --pr")
+            poll = prs[0].poll()
+            print(poll.status)
+            return poll.code
+        if len(prs) > 1:
+            return wait_many(prs, poll_github_batch, runner, args.poll_seconds, args.max_wait_seconds)
+        provider = prs[0]
+    elif args.once:
+        parser.error("--once is only supported for github")
+    elif args.mr:
+        if args.branch:
+            parser.error("gitlab takes --branch or --mr, not both")
+        project = args.repo
+        if project is None and any(not GITLAB_MR_URL_RE.search(mr) for mr in args.mr):
+            project = current_gitlab_project(runner)
+            if project is None:
+                print("error: failed to resolve the GitLab project; pass --repo", file=sys.stderr)
+                return 1
+        mrs = [gitlab_target(mr, project, args.allow_missing, runner) for mr in dict.fromkeys(args.mr)]
+        return wait_many(mrs, poll_gitlab_batch, runner, args.poll_seconds, args.max_wait_seconds)
+    else:
+        if not args.branch:
+            parser.error("gitlab requires --branch or --mr")
+        provider = GitLabPipeline(args.branch, args.allow_missing, runner)
+    return wait(provider, runner, args.poll_seconds, args.max_wait_seconds)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
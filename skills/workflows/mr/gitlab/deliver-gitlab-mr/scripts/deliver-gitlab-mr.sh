@@ -21,11 +21,12 @@ preflight options:
   --proceed-all         Alias of --bypass-ambiguity.
 
 wait-pipeline options:
-  --mr <iid|branch>          Resolve the source branch from a GitLab MR.
+  --mr <iid|branch>          Resolve the source branch from a GitLab MR; repeat with IIDs or MR URLs
+                             to watch several MRs in one process.
   --branch <branch>          Source branch to poll.
   --source-branch <branch>   Alias of --branch.
   --allow-no-pipeline        Treat an absent GitLab pipeline as an explicit pass.
-  --poll-seconds <n>         Poll interval in seconds (default: 20)
+  --poll-seconds <n>         Longest poll interval in seconds; polls run sooner while jobs start (default: 20)
   --max-wait-seconds <n>     Maximum wait time in seconds (default: 7200)
 
 close options:
@@ -48,6 +49,8 @@ Exit codes:
 USAGE
 }
 
+workflows_shared_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../../../_shared" && pwd)"
+
 DELIVER_GITLAB_MR_KIND=""
 
 require_kind() {
@@ -556,45 +559,12 @@ resolve_mr_source_branch() {
   printf '%s\n' "$source_branch"
 }
 
-pipeline_status_from_json() {
-  json_field pipeline.status pipeline.detailed_status.group pipeline.detailedStatus.group status detailed_status.group detailedStatus.group 2>/dev/null || true
-}
-
-pipeline_status_for_branch() {
-  local branch="${1:-}"
-  local output status
-
-  set +e
-  output="$(glab ci status --branch "$branch" --output json 2>&1)"
-  local rc=$?
-  set -e
-
-  if [[ "$rc" -ne 0 ]]; then
-    if printf '%s\n' "$output" | grep -qi 'No pipeline found'; then
-      printf '%s\n' "$output" >&2
-      printf '%s\n' "missing"
-      return 3
-    fi
-    printf '%s\n' "$output" >&2
-    return "$rc"
-  fi
-
-  status="$(printf '%s' "$output" | pipeline_status_from_json)"
-  if [[ -z "$status" ]]; then
-    echo "error: failed to parse pipeline status for branch ${branch}" >&2
-    printf '%s\n' "$output" >&2
-    return 1
-  fi
-
-  printf '%s\n' "$status"
-}
-
 wait_pipeline_for_branch() {
   local branch="${1:-}"
   local poll_seconds="${2:-20}"
   local max_wait_seconds="${3:-7200}"
   local allow_no_pipeline="${4:-0}"
-  local start now elapsed status normalized status_rc
+  local -a waiter_args=()
 
   if [[ -z "$branch" ]]; then
     echo "error: source branch is required for pipeline wait" >&2
@@ -603,59 +573,32 @@ wait_pipeline_for_branch() {
   parse_positive_int "--poll-seconds" "$poll_seconds"
   parse_positive_int "--max-wait-seconds" "$max_wait_seconds"
 
-  start="$(date +%s)"
-  while true; do
-    status_rc=0
-    set +e
-    status="$(pipeline_status_for_branch "$branch")"
-    status_rc=$?
-    set -e
-    normalized="$(printf '%s' "$status" | tr '[:upper:]' '[:lower:]')"
-    echo "PIPELINE_STATUS=${normalized}"
-
-    if [[ "$status_rc" -eq 3 && "$normalized" == "missing" ]]; then
-      if [[ "$allow_no_pipeline" == "1" ]]; then
-        echo "ok: no pipeline found for branch ${branch}; accepted by --allow-no-pipeline"
-        return 0
-      fi
-      echo "error: no pipeline found for branch ${branch}; use --allow-no-pipeline only after confirming this repo has no CI" >&2
-      return 1
-    fi
-    if [[ "$status_rc" -ne 0 ]]; then
-      return "$status_rc"
-    fi
+  waiter_args=(gitlab --branch "$branch" --poll-seconds "$poll_seconds" --max-wait-seconds "$max_wait_seconds")
+  if [[ "$allow_no_pipeline" == "1" ]]; then
+    waiter_args+=(--allow-missing)
+  fi
+  python3 "$workflows_shared_dir/python/check_waiter.py" "${waiter_args[@]}"
+}
 
-    case "$normalized" in
-      success|succeeded|passed|pass)
-        echo "ok: pipeline passed for branch ${branch}"
-        return 0
-        ;;
-      skipped|manual|blocked|action_required)
-        echo "error: source-branch pipeline is not mergeable for branch ${branch} (status=${normalized})" >&2
-        echo "error: if this repo intentionally uses target-branch CI, verify MR mergeability and target-branch validation, then use --skip-pipeline only after explicit user confirmation" >&2
-        return 1
-        ;;
-      failed|fail|canceled|cancelled)
-        echo "error: pipeline is not mergeable for branch ${branch} (status=${normalized})" >&2
-        return 1
-        ;;
-      running|pending|created|preparing|waiting_for_resource|scheduled)
-        ;;
-      *)
-        echo "error: unknown pipeline status for branch ${branch}: ${status}" >&2
-        return 1
-        ;;
-    esac
+wait_pipelines_for_mrs() {
+  local poll_seconds="${1:-20}"
+  local max_wait_seconds="${2:-7200}"
+  local allow_no_pipeline="${3:-0}"
+  shift 3
+  local -a waiter_args=(gitlab)
+  local mr_ref=''
 
-    now="$(date +%s)"
-    elapsed=$((now - start))
-    if [[ "$elapsed" -ge "$max_wait_seconds" ]]; then
-      echo "error: timed out waiting for GitLab pipeline (elapsed=${elapsed}s, limit=${max_wait_seconds}s)" >&2
-      exit 124
-    fi
+  parse_positive_int "--poll-seconds" "$poll_seconds"
+  parse_positive_int "--max-wait-seconds" "$max_wait_seconds"
 
-    sleep "$poll_seconds"
+  for mr_ref in "$@"; do
+    waiter_args+=(--mr "$mr_ref")
   done
+  waiter_args+=(--poll-seconds "$poll_seconds" --max-wait-seconds "$max_wait_seconds")
+  if [[ "$allow_no_pipeline" == "1" ]]; then
+    waiter_args+=(--allow-missing)
+  fi
+  python3 "$workflows_shared_dir/python/check_waiter.py" "${waiter_args[@]}"
 }
 
 ensure_origin_base_ref() {
@@ -813,6 +756,7 @@ cmd_preflight() {
 }
 
 cmd_wait_pipeline() {
+  local -a mr_refs=()
   local mr_ref=''
   local branch=''
   local allow_no_pipeline="0"
@@ -822,11 +766,11 @@ cmd_wait_pipeline() {
   while [[ $# -gt 0 ]]; do
     case "${1:-}" in
       --mr)
-        if [[ $# -lt 2 ]]; then
+        if [[ $# -lt 2 || -z "${2:-}" ]]; then
           echo "error: --mr requires a value" >&2
           exit 2
         fi
-        mr_ref="${2:-}"
+        mr_refs+=("${2:-}")
         shift 2
         ;;
       --branch|--source-branch)
@@ -873,6 +817,21 @@ cmd_wait_pipeline() {
   require_cmd python3
   require_git_repo
 
+  if [[ "${#mr_refs[@]}" -gt 1 ]]; then
+    if [[ -n "$branch" ]]; then
+      echo "error: --branch cannot be combined with several --mr values" >&2
+      exit 2
+    fi
+    for mr_ref in "${mr_refs[@]}"; do
+      echo "MR_REF=$mr_ref"
+    done
+    wait_pipelines_for_mrs "$poll_seconds" "$max_wait_seconds" "$allow_no_pipeline" "${mr_refs[@]}"
+    return
+  fi
+  if [[ "${#mr_refs[@]}" -eq 1 ]]; then
+    mr_ref="${mr_refs[0]}"
+  fi
+
   if [[ -z "$branch" && -n "$mr_ref" ]]; then
     branch="$(resolve_mr_source_branch "$mr_ref")"
   fi
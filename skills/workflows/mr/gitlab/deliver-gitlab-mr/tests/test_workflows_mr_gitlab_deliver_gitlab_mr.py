@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 import stat
 import subprocess
@@ -103,6 +104,14 @@ def _install_fake_glab(tmp_path: Path) -> tuple[Path, Path]:
         "  printf '\"state\":\"%s\",\"draft\":%s}\\n' \"${GLAB_FAKE_MR_STATE:-opened}\" \"${GLAB_FAKE_DRAFT:-true}\"\n"
         "  exit 0\n"
         "fi\n"
+        "if [[ \"${1-}\" == \"repo\" && \"${2-}\" == \"view\" ]]; then\n"
+        "  printf '{\"path_with_namespace\":\"group/project\"}\\n'\n"
+        "  exit 0\n"
+        "fi\n"
+        "if [[ \"${1-}\" == \"api\" && \"${2-}\" == \"graphql\" ]]; then\n"
+        "  printf '%s\\n' \"${GLAB_FAKE_GRAPHQL_JSON:?}\"\n"
+        "  exit 0\n"
+        "fi\n"
         "if [[ \"${1-}\" == \"mr\" && \"${2-}\" == \"update\" ]]; then\n"
         "  exit 0\n"
         "fi\n"
@@ -204,6 +213,16 @@ def test_wait_pipeline_passes_on_success_status(tmp_path: Path) -> None:
     assert "PIPELINE_STATUS=success" in proc.stdout
 
 
+def test_wait_pipeline_rejects_empty_mr_values(tmp_path: Path) -> None:
+    repo, env, _ = _setup_repo(tmp_path)
+
+    proc = _run_skill(repo, env, "--kind", "feature", "wait-pipeline", "--mr", "")
+
+    assert proc.returncode == 2
+    assert "--mr requires a value" in proc.stderr
+    assert "SOURCE_BRANCH=" not in proc.stdout
+
+
 def test_wait_pipeline_resolves_branch_from_mr(tmp_path: Path) -> None:
     repo, env, _ = _setup_repo(tmp_path)
     env["GLAB_FAKE_SOURCE_BRANCH"] = "fix/from-mr"
@@ -297,6 +316,91 @@ def test_wait_pipeline_blocks_nested_manual_detailed_status(tmp_path: Path) -> N
     assert "--skip-pipeline" in proc.stderr
 
 
+def test_wait_pipeline_fails_fast_on_failed_job_in_running_pipeline(tmp_path: Path) -> None:
+    repo, env, log_path = _setup_repo(tmp_path)
+    env["GLAB_FAKE_PIPELINE_JSON"] = (
+        '{"status":"running","jobs":['
+        '{"name":"lint","status":"failed","allow_failure":false},'
+        '{"name":"flaky","status":"failed","allow_failure":true},'
+        '{"name":"test","status":"running"}]}'
+    )
+
+    proc = _run_skill(
+        repo,
+        env,
+        "--kind",
+        "feature",
+        "wait-pipeline",
+        "--branch",
+        "feat/demo",
+        "--max-wait-seconds",
+        "600",
+    )
+
+    assert proc.returncode == 1
+    assert "PIPELINE_STATUS=running" in proc.stdout
+    assert "(jobs=lint)" in proc.stderr
+    summary = next(line for line in proc.stdout.splitlines() if line.startswith("WAIT_SUMMARY="))
+    assert '"api_calls": 1' in summary
+    assert '"result": "failed"' in summary
+    assert log_path.read_text(encoding="utf-8").count("glab ci status") == 1
+
+
+def test_wait_pipeline_watches_several_mrs_with_one_query_per_poll(tmp_path: Path) -> None:
+    repo, env, log_path = _setup_repo(tmp_path)
+    env["GLAB_FAKE_GRAPHQL_JSON"] = json.dumps(
+        {
+            "data": {
+                "project": {
+                    "mergeRequests": {
+                        "nodes": [
+                            {"iid": "7", "sourceBranch": "feat/a", "headPipeline": {"status": "SUCCESS"}},
+                            {
+                                "iid": "8",
+                                "sourceBranch": "feat/b",
+                                "headPipeline": {
+                                    "status": "RUNNING",
+                                    "jobs": {"nodes": [{"name": "lint", "status": "FAILED", "allowFailure": False}]},
+                                },
+                            },
+                        ]
+                    }
+                }
+            }
+        }
+    )
+
+    proc = _run_skill(
+        repo,
+        env,
+        "--kind",
+        "feature",
+        "wait-pipeline",
+        "--mr",
+        "7",
+        "--mr",
+        "8",
+        "--max-wait-seconds",
+        "600",
+    )
+
+    assert proc.returncode == 1
+    assert "ok: pipeline passed for branch feat/a" in proc.stdout
+    assert "pipeline job failed for branch feat/b (jobs=lint)" in proc.stderr
+    records = [line.split("=", 1) for line in proc.stdout.splitlines() if line.startswith("WAIT_")]
+    done = [json.loads(value) for key, value in records if key == "WAIT_DONE"]
+    assert [(record["target"], record["result"]) for record in done] == [
+        ("group/project!7", "passed"),
+        ("group/project!8", "failed"),
+    ]
+    summary = json.loads(next(value for key, value in records if key == "WAIT_SUMMARY"))
+    assert summary["api_calls"] == 2
+    assert summary["result"] == "failed"
+    calls = log_path.read_text(encoding="utf-8")
+    assert calls.count("glab api graphql") == 1
+    assert "glab ci status" not in calls
+
+
 def test_wait_pipeline_fails_on_missing_pipeline_by_default(tmp_path: Path) -> None:
     repo, env, _ = _setup_repo(tmp_path)
     env["GLAB_FAKE_PIPELINE_STATUS"] = "no_pipeline"
@@ -20,9 +20,9 @@ preflight options:
   --proceed-all             Alias of --bypass-ambiguity.
 
 wait-checks options:
-  --pr <number>             PR number (required)
+  --pr <number|url>         PR to watch (required); repeat to watch several PRs in one process
   --allow-no-checks         Treat an absent GitHub checks suite as explicitly accepted.
-  --poll-seconds <n>        Poll interval in seconds (default: 20)
+  --poll-seconds <n>        Poll interval ceiling in seconds; polls run sooner while checks start or run (default: 20)
   --max-wait-seconds <n>    Maximum wait time in seconds (default: 7200)
 
 close options:
@@ -39,9 +39,7 @@ Exit codes:
 USAGE
 }
 
-github_pr_workflow_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
-# shellcheck source=/dev/null
-source "$github_pr_workflow_dir/_shared/lib/github-pr-checks.bash"
+workflows_shared_dir="$(cd "$(dirname "${BASH_SOURCE[0]}")/../../../../_shared" && pwd)"
 
 DELIVER_GITHUB_PR_KIND=''
 
@@ -389,77 +387,25 @@ print_worktree_state_summary() {
   echo "CHANGE_STATE_SUMMARY=staged:${#WORKTREE_STAGED_PATHS[@]},unstaged:${#WORKTREE_UNSTAGED_PATHS[@]},untracked:${#WORKTREE_UNTRACKED_PATHS[@]},mixed_status=$([[ "${#WORKTREE_STAGED_PATHS[@]}" -gt 0 && "${#WORKTREE_UNSTAGED_PATHS[@]}" -gt 0 ]] && echo "true" || echo "false")"
 }
 
-check_once_for_pr() {
-  local pr="${1:-}"
-  local status=''
-  local rc=0
-
-  set +e
-  status="$(github_pr_checks_status_for_pr "$pr")"
-  rc=$?
-  set -e
-  status="$(printf '%s\n' "$status" | tail -n 1)"
-
-  echo "${status:-unknown}"
-  return "$rc"
-}
-
-wait_checks_for_pr() {
-  local pr="${1:-}"
-  local poll_seconds="${2:-20}"
-  local max_wait_seconds="${3:-7200}"
-  local allow_no_checks="${4:-0}"
-  local start now elapsed status status_rc
+wait_checks_for_prs() {
+  local poll_seconds="${1:-20}"
+  local max_wait_seconds="${2:-7200}"
+  local allow_no_checks="${3:-0}"
+  shift 3
+  local -a waiter_args=(github)
+  local pr=''
 
-  if [[ -z "$pr" ]]; then
-    echo "error: --pr is required for wait-checks" >&2
-    exit 2
-  fi
   parse_positive_int "--poll-seconds" "$poll_seconds"
   parse_positive_int "--max-wait-seconds" "$max_wait_seconds"
 
-  start="$(date +%s)"
-  while true; do
-    status_rc=0
-    set +e
-    status="$(check_once_for_pr "$pr")"
-    status_rc=$?
-    set -e
-    status="$(printf '%s\n' "$status" | tail -n 1)"
-    echo "CHECK_STATUS=$status"
-
-    case "$status" in
-      passed)
-        echo "ok: required GitHub checks passed for PR #$pr"
-        return 0
-        ;;
-      missing)
-        if [[ "$allow_no_checks" == "1" ]]; then
-          echo "ok: no GitHub checks found for PR #${pr}; accepted by --allow-no-checks"
-          return 0
-        fi
-        echo "error: no GitHub checks found for PR #${pr}; use --allow-no-checks only after confirming this repo has no CI" >&2
-        return 1
-        ;;
-      failed)
-        echo "error: GitHub checks are not mergeable for PR #${pr}" >&2
-        return 1
-        ;;
-    esac
-
-    if [[ "$status_rc" -ne 5 ]]; then
-      return "$status_rc"
-    fi
-
-    now="$(date +%s)"
-    elapsed=$((now - start))
-    if [[ "$elapsed" -ge "$max_wait_seconds" ]]; then
-      echo "error: timed out waiting for GitHub checks (elapsed=${elapsed}s, limit=${max_wait_seconds}s)" >&2
-      exit 124
-    fi
-
-    sleep "$poll_seconds"
+  for pr in "$@"; do
+    waiter_args+=(--pr "$pr")
   done
+  waiter_args+=(--poll-seconds "$poll_seconds" --max-wait-seconds "$max_wait_seconds")
+  if [[ "$allow_no_checks" == "1" ]]; then
+    waiter_args+=(--allow-missing)
+  fi
+  python3 "$workflows_shared_dir/python/check_waiter.py" "${waiter_args[@]}"
 }
 
 query_pr_state_for_close() {
@@ -538,6 +484,7 @@ cmd_preflight() {
 }
 
 cmd_wait_checks() {
+  local -a prs=()
   local pr=''
   local allow_no_checks='0'
   local poll_seconds='20'
@@ -546,11 +493,11 @@ cmd_wait_checks() {
   while [[ $# -gt 0 ]]; do
     case "${1:-}" in
       --pr)
-        if [[ $# -lt 2 ]]; then
+        if [[ $# -lt 2 || -z "${2:-}" ]]; then
           echo "error: --pr requires a value" >&2
           exit 2
         fi
-        pr="${2:-}"
+        prs+=("${2:-}")
         shift 2
         ;;
       --allow-no-checks)
@@ -585,8 +532,15 @@ cmd_wait_checks() {
   done
 
   require_cmd gh
-  echo "PR_NUMBER=$pr"
-  wait_checks_for_pr "$pr" "$poll_seconds" "$max_wait_seconds" "$allow_no_checks"
+  require_cmd python3
+  if [[ "${#prs[@]}" -eq 0 ]]; then
+    echo "error: --pr is required for wait-checks" >&2
+    exit 2
+  fi
+  for pr in "${prs[@]}"; do
+    echo "PR_NUMBER=$pr"
+  done
+  wait_checks_for_prs "$poll_seconds" "$max_wait_seconds" "$allow_no_checks" "${prs[@]}"
 }
 
 cmd_close() {
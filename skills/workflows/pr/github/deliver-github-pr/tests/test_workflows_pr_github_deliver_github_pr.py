@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 import subprocess
+import sys
 from pathlib import Path
+from types import ModuleType
 
 from skills._shared.python.skill_testing import assert_entrypoints_exist, assert_skill_contract
 
@@ -11,6 +14,7 @@ from skills._shared.python.skill_testing import assert_entrypoints_exist, assert
 SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "deliver-github-pr.sh"
 REPO_ROOT = Path(__file__).resolve().parents[6]
 STUB_BIN = REPO_ROOT / "tests" / "stubs" / "bin"
+CHECK_WAITER = REPO_ROOT / "skills" / "workflows" / "_shared" / "python" / "check_waiter.py"
 
 
 def test_workflows_pr_github_deliver_github_pr_contract() -> None:
@@ -78,6 +82,21 @@ def _run_skill(repo: Path, env: dict[str, str], *args: str) -> subprocess.Comple
     return _run([str(SCRIPT), *args], cwd=repo, env=env)
 
 
+def _load_check_waiter() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("check_waiter", CHECK_WAITER)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _wait_summary(stdout: str) -> dict[str, object]:
+    lines = [line for line in stdout.splitlines() if line.startswith("WAIT_SUMMARY=")]
+    assert len(lines) == 1, stdout
+    return json.loads(lines[0].removeprefix("WAIT_SUMMARY="))
+
+
 def _custom_checks(required: list[dict[str, str]], all_checks: list[dict[str, str]]) -> dict[str, str]:
     return {
         "CODEX_GH_STUB_PR_REQUIRED_CHECKS_JSON": json.dumps(required),
@@ -126,6 +145,16 @@ def test_wait_checks_blocks_missing_checks_by_default(tmp_path: Path) -> None:
     assert "use --allow-no-checks" in proc.stderr
 
 
+def test_wait_checks_rejects_empty_pr_values(tmp_path: Path) -> None:
+    repo, env = _setup_repo(tmp_path, checks_mode="none")
+
+    proc = _run_skill(repo, env, "--kind", "feature", "wait-checks", "--pr", "12", "--pr", "")
+
+    assert proc.returncode == 2
+    assert "--pr requires a value" in proc.stderr
+    assert "PR_NUMBER=" not in proc.stdout
+
+
 def test_wait_checks_accepts_missing_checks_when_explicitly_allowed(tmp_path: Path) -> None:
     repo, env = _setup_repo(tmp_path, checks_mode="none")
 
@@ -261,3 +290,198 @@ def test_wait_checks_keeps_waiting_when_required_checks_are_pending(tmp_path: Pa
 
     assert proc.returncode == 124
     assert "CHECK_STATUS=pending" in proc.stdout
+
+
+def test_wait_checks_fails_fast_when_a_required_check_fails_while_others_pend(tmp_path: Path) -> None:
+    repo, env = _setup_repo(
+        tmp_path,
+        checks_mode="custom",
+        extra_env=_custom_checks(
+            required=[
+                {"name": "build", "state": "IN_PROGRESS", "bucket": "pending"},
+                {"name": "lint", "state": "FAILURE", "bucket": "fail"},
+            ],
+            all_checks=[],
+        ),
+    )
+
+    proc = _run_skill(repo, env, "--kind", "feature", "wait-checks", "--pr", "123", "--max-wait-seconds", "600")
+
+    assert proc.returncode == 1
+    assert "CHECK_STATUS=failed" in proc.stdout
+    assert _wait_summary(proc.stdout) | {"elapsed_seconds": 0} == {
+        "provider": "github",
+        "result": "failed",
+        "status": "failed",
+        "polls": 1,
+        "api_calls": 1,
+        "elapsed_seconds": 0,
+    }
+
+
+def test_wait_checks_reports_progress_and_timeout_summary(tmp_path: Path) -> None:
+    repo, env = _setup_repo(
+        tmp_path,
+        checks_mode="custom",
+        extra_env=_custom_checks(
+            required=[{"name": "test", "state": "QUEUED", "bucket": "pending"}],
+            all_checks=[],
+        ),
+    )
+
+    proc = _run_skill(
+        repo,
+        env,
+        "--kind",
+        "feature",
+        "wait-checks",
+        "--pr",
+        "123",
+        "--poll-seconds",
+        "1",
+        "--max-wait-seconds",
+        "1",
+    )
+
+    assert proc.returncode == 124
+    progress = [
+        json.loads(line.removeprefix("WAIT_PROGRESS="))
+        for line in proc.stdout.splitlines()
+        if line.startswith("WAIT_PROGRESS=")
+    ]
+    assert [record["phase"] for record in progress] == ["starting"] * len(progress)
+    assert progress[0]["next_poll_seconds"] == 1
+    summary = _wait_summary(proc.stdout)
+    assert summary["result"] == "timeout"
+    assert summary["polls"] == len(progress)
+    assert summary["api_calls"] == len(progress)
+
+
+def test_check_waiter_schedule_polls_fast_while_starting_and_backs_off_while_running() -> None:
+    schedule = _load_check_waiter().PollSchedule(60)
+
+    assert [schedule.next("starting"), schedule.next("starting")] == [5, 5]
+    assert [schedule.next("running") for _ in range(5)] == [15, 22.5, 33.75, 50.625, 60]
+    assert schedule.next("starting") == 5
+    assert schedule.next("running") == 15
+    assert _load_check_waiter().PollSchedule(10).next("running") == 10
+
+
+def test_check_waiter_schedule_keeps_running_backoff_across_unsettled_polls() -> None:
+    schedule = _load_check_waiter().PollSchedule(60)
+
+    assert [schedule.next("running"), schedule.next("running")] == [15, 22.5]
+    assert schedule.next("done") == 22.5
+    assert schedule.next("running") == 33.75
+
+
+def _rollup_pr(*contexts: dict[str, object]) -> dict[str, object]:
+    return {
+        "commits": {
+            "nodes": [
+                {
+                    "commit": {
+                        "statusCheckRollup": {
+                            "contexts": {"pageInfo": {"hasNextPage": False}, "nodes": list(contexts)}
+                        }
+                    }
+                }
+            ]
+        }
+    }
+
+
+def _check_run(name: str, status: str, conclusion: str | None = None, *, required: bool = True) -> dict[str, object]:
+    return {
+        "__typename": "CheckRun",
+        "name": name,
+        "status": status,
+        "conclusion": conclusion,
+        "isRequired": required,
+    }
+
+
+def test_wait_checks_watches_several_prs_with_one_query_per_poll(tmp_path: Path) -> None:
+    graphql_dir = tmp_path / "graphql"
+    graphql_dir.mkdir()
+    (graphql_dir / "first.json").write_text(
+        json.dumps(
+            {
+                "data": {
+                    "repository": {
+                        "pr12": _rollup_pr(
+                            _check_run("test", "COMPLETED", "SUCCESS"),
+                            _check_run("docs", "COMPLETED", "FAILURE", required=False),
+                        ),
+                        "pr15": _rollup_pr(
+                            {"__typename": "StatusContext", "context": "ci/jenkins", "state": "SUCCESS"}
+                        ),
+                    }
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    repo, env = _setup_repo(
+        tmp_path,
+        checks_mode="custom",
+        extra_env={"CODEX_GH_STUB_GRAPHQL_DIR": str(graphql_dir), "CODEX_STUB_LOG_DIR": str(log_dir)},
+    )
+
+    proc = _run_skill(repo, env, "--kind", "feature", "wait-checks", "--pr", "12", "--pr", "15")
+
+    assert proc.returncode == 0, proc.stderr
+    assert "PR_NUMBER=12" in proc.stdout
+    assert "PR_NUMBER=15" in proc.stdout
+    assert "ok: required GitHub checks passed for PR #12" in proc.stdout
+    assert "ok: required GitHub checks passed for PR #15" in proc.stdout
+    summary = _wait_summary(proc.stdout)
+    assert summary["targets"] == {"#12": "passed", "#15": "passed"}
+    assert summary["api_calls"] == 1
+    calls = (log_dir / "gh.calls.txt").read_text(encoding="utf-8")
+    assert "pr checks" not in calls
+
+
+def test_check_waiter_reports_each_pr_as_it_completes(monkeypatch, capsys) -> None:
+    waiter = _load_check_waiter()
+    rounds = iter(
+        [
+            {
+                "pr1": _rollup_pr(_check_run("test", "COMPLETED", "SUCCESS")),
+                "pr2": _rollup_pr(_check_run("test", "IN_PROGRESS")),
+                "pr3": _rollup_pr(_check_run("test", "QUEUED")),
+            },
+            {
+                "pr2": _rollup_pr(_check_run("test", "COMPLETED", "TIMED_OUT")),
+                "pr3": _rollup_pr(_check_run("test", "IN_PROGRESS")),
+            },
+            {"pr3": _rollup_pr(_check_run("test", "COMPLETED", "SUCCESS"))},
+        ]
+    )
+    sleeps: list[float] = []
+
+    class FakeRunner(waiter.CliRunner):
+        def __call__(self, args):
+            self.calls += 1
+            assert args[:3] == ["gh", "api", "graphql"]
+            return 0, json.dumps({"data": {"repository": next(rounds)}}), ""
+
+    monkeypatch.setattr(waiter.time, "sleep", sleeps.append)
+    runner = FakeRunner()
+    targets = [waiter.GitHubChecks(pr, False, runner, repo="acme/app") for pr in ("1", "2", "3")]
+
+    code = waiter.wait_many(targets, waiter.poll_github_batch, runner, 60, 600)
+
+    records = [line.split("=", 1) for line in capsys.readouterr().out.splitlines() if line.startswith("WAIT_")]
+    done = [json.loads(value) for key, value in records if key == "WAIT_DONE"]
+    assert [(record["target"], record["result"], record["poll"]) for record in done] == [
+        ("acme/app#1", "passed", 1),
+        ("acme/app#2", "failed", 2),
+        ("acme/app#3", "passed", 3),
+    ]
+    assert code == 1
+    assert runner.calls == 3
+    # A queued check keeps the batch on the short interval; then it backs off.
+    assert sleeps == [5, 15]